@@ -1,21 +1,32 @@
+from collections import OrderedDict, deque
 from enum import Enum
-from itertools import cycle
+from functools import partial
 from logging import getLogger
 from pathlib import Path
 from pprint import pformat
-from re import search
-from string import whitespace
+from re import compile as re_compile
+from re import escape, search
+from statistics import median
+from string import Formatter, whitespace
 from tempfile import gettempdir
-from typing import Dict, List, Sequence, Tuple, Union
+from threading import Condition, Event, Lock, Thread, local
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from PIL import Image, ImageDraw, ImageFont
 
-from dcspy import default_yaml, load_yaml
-from dcspy.models import DEFAULT_FONT_NAME, NO_OF_LCD_SCREENSHOTS, CycleButton, Gkey, LcdButton, LcdInfo, LcdType, ZigZagIterator, get_key_instance
+from dcspy import default_yaml, get_config_yaml_item, load_yaml
+from dcspy.models import (DEFAULT_FONT_NAME, CycleButton, Gkey, LayoutOp, LayoutPlan, LcdButton, LcdElement, LcdInfo, LcdType, ZigZagIterator, get_font,
+                          get_key_instance)
+from dcspy.screenshot import ScreenshotRecorder
 from dcspy.sdk import lcd_sdk
-from dcspy.utils import replace_symbols, substitute_symbols
+from dcspy.utils import SymbolTranslator, compose_symbol_replacements, get_full_bios_for_plane, get_symbol_translator
 
 LOG = getLogger(__name__)
+DED_FONT: Tuple[str, int] = (str((Path(__file__) / '..' / 'resources' / 'falconded.ttf').resolve()), 25)
+F15ESE_UFC_FONT: Tuple[str, int] = (DEFAULT_FONT_NAME, 29)
+AIRCRAFT_FONTS: Dict[LcdType, List[Tuple[str, int]]] = {LcdType.MONO: [], LcdType.COLOR: [DED_FONT, F15ESE_UFC_FONT]}
 
 
 class MetaAircraft(type):
@@ -154,6 +165,410 @@ class BasicAircraft:
         return f'{super().__repr__()} with: {pformat(self.__dict__)}'
 
 
+class RenderScheduler:
+    """
+    Render aircraft image once per DCS-BIOS frame.
+
+    Setting BIOS value only marks aircraft as dirty, image is rendered at frame sync,
+    but not more often than maximum FPS. Frame sync, which comes too early, leave aircraft dirty
+    for next one.
+    """
+    def __init__(self, render: Callable[[], None], max_fps: float = 0.0) -> None:
+        """
+        Create render scheduler.
+
+        :param render: render image and send it to LCD
+        :param max_fps: maximum number of renders per second, 0 - render at each frame sync
+        """
+        self.render = render
+        self.interval = 1 / max_fps if max_fps else 0.0
+        self.dirty = False
+        self.renders = 0
+        self.skipped = 0
+        self._last_render = 0.0
+
+    def mark_dirty(self) -> None:
+        """Mark image as outdated, count skipped render when it is outdated already."""
+        if self.dirty:
+            self.skipped += 1
+        self.dirty = True
+
+    def on_frame_sync(self) -> None:
+        """Render image when it is outdated and maximum FPS allows."""
+        now = monotonic()
+        if self.dirty and now - self._last_render >= self.interval:
+            self.dirty = False
+            self._last_render = now
+            self.renders += 1
+            self.render()
+
+
+class RenderWorker:
+    """
+    Render aircraft images from dedicated thread.
+
+    Parser thread only publishes immutable snapshot of BIOS data with selectors changed since previous one.
+    Worker renders the newest snapshot, snapshot replaced before it was rendered is counted as dropped,
+    but its changed selectors are kept. Latency from publishing to rendered image is recorded for each render.
+    Failed render is logged and counted, worker keeps rendering next snapshots.
+    """
+    def __init__(self, render: Callable[[Mapping[str, Union[str, int]], Set[str]], None], latency_samples: int = 1000) -> None:
+        """
+        Initialize instance and start worker thread.
+
+        :param render: render image from snapshot of BIOS data and send it to LCD
+        :param latency_samples: number of the latest render latencies kept
+        """
+        self.render = render
+        self.published = 0
+        self.renders = 0
+        self.dropped = 0
+        self.failed = 0
+        self.latencies: Deque[float] = deque(maxlen=latency_samples)
+        self._snapshot: Optional[Mapping[str, Union[str, int]]] = None
+        self._changed: Set[str] = set()
+        self._published_at = 0.0
+        self._busy = False
+        self._condition = Condition()
+        self._stop = Event()
+        self._worker = Thread(target=self._run, name='dcspy-render', daemon=True)
+        self._worker.start()
+
+    def publish(self, snapshot: Mapping[str, Union[str, int]], changed: Set[str]) -> None:
+        """
+        Replace snapshot waiting for render.
+
+        :param snapshot: immutable BIOS data
+        :param changed: selectors changed since previous snapshot
+        """
+        with self._condition:
+            self.published += 1
+            if self._snapshot is not None:
+                self.dropped += 1
+            self._snapshot = snapshot
+            self._changed |= changed
+            self._published_at = monotonic()
+            self._condition.notify()
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Wait till the newest snapshot is rendered.
+
+        :param timeout: maximum time to wait in seconds
+        :return: True if nothing is waiting for render
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._snapshot is None and not self._busy, timeout=timeout)
+
+    def stop(self) -> None:
+        """Stop worker thread, snapshot waiting for render is dropped."""
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        self._worker.join(timeout=1.0)
+        latency = f'median: {median(self.latencies) * 1000:.2f} ms, max: {max(self.latencies) * 1000:.2f} ms' if self.latencies else 'n/a'
+        LOG.debug(f'Snapshots published: {self.published}, rendered: {self.renders}, dropped: {self.dropped}, failed: {self.failed}, latency {latency}')
+
+    def _run(self) -> None:
+        """Render the newest snapshot of BIOS data."""
+        while not self._stop.is_set():
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+                self._condition.wait_for(lambda: self._snapshot is not None or self._stop.is_set())
+                if self._stop.is_set():
+                    return
+                snapshot, changed, published_at = self._snapshot, self._changed, self._published_at
+                self._snapshot, self._changed = None, set()
+                self._busy = True
+            if snapshot is not None:
+                try:
+                    self.render(snapshot, changed)
+                except Exception:
+                    LOG.exception('Render of BIOS snapshot failed')
+                    self.failed += 1
+                    continue
+                self.latencies.append(monotonic() - published_at)
+                self.renders += 1
+
+
+class FramePool:
+    """
+    Preallocated images with draw contexts for LCD.
+
+    Images are reused round-robin and cleared with background color before each frame,
+    so steady-state rendering does not allocate new images.
+    """
+    def __init__(self, lcd: LcdInfo, size: int = 3) -> None:
+        """
+        Create frame pool.
+
+        :param lcd: LCD type
+        :param size: number of images in pool
+        """
+        self.lcd = lcd
+        self.frames = [Image.new(mode=lcd.mode.value, size=(lcd.width, lcd.height), color=lcd.background) for _ in range(size)]
+        self._draws = {id(img): ImageDraw.Draw(img) for img in self.frames}
+        self._index = 0
+
+    def next_frame(self, static: Optional[Image.Image] = None) -> Image.Image:
+        """
+        Get next image from pool, cleared with background color or static layer.
+
+        :param static: image with static layer
+        :return: image instance
+        """
+        self._index = (self._index + 1) % len(self.frames)
+        img = self.frames[self._index]
+        if static:
+            img.paste(static)
+        else:
+            img.paste(self.lcd.background, (0, 0, self.lcd.width, self.lcd.height))
+        return img
+
+    def get_draw(self, img: Image.Image) -> ImageDraw.ImageDraw:
+        """
+        Get draw context for image, cached one for image from pool.
+
+        :param img: image instance
+        :return: ImageDraw instance
+        """
+        draw = self._draws.get(id(img))
+        return draw if draw else ImageDraw.Draw(img)
+
+
+class TextCache:
+    """
+    Bounded LRU cache of rasterised text.
+
+    Mask of text is rasterised once for font, text and font mode of image and drawn with fill color
+    by ImageDraw.bitmap, which gives exactly the same pixels as ImageDraw.text. Fill is not part
+    of key, the same mask is used for any color.
+    """
+    def __init__(self, max_size: int = 512) -> None:
+        """
+        Create text cache.
+
+        :param max_size: maximum number of cached masks
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._masks: 'OrderedDict[Tuple, Tuple[Tuple[int, int], Image.Image]]' = OrderedDict()
+        self._lock = Lock()
+
+    def text(self, draw: ImageDraw.ImageDraw, xy: Tuple[float, float], text: str, fill: Union[int, Tuple[int, int, int, int]],
+             font: Optional[ImageFont.FreeTypeFont]) -> None:
+        """
+        Draw text, same as ImageDraw.text.
+
+        Multiline text, text at fractional position and text without font are drawn directly.
+        :param draw: ImageDraw instance
+        :param xy: position of text
+        :param text: text to draw
+        :param fill: color of text
+        :param font: font of text
+        """
+        if font is None or '\n' in text or xy[0] % 1 or xy[1] % 1:
+            draw.text(xy=xy, text=text, fill=fill, font=font)
+            return
+        key = (getattr(font, 'path', font), getattr(font, 'size', None), text, draw.fontmode)
+        with self._lock:
+            entry = self._masks.get(key)
+            if entry:
+                self.hits += 1
+                self._masks.move_to_end(key)
+            else:
+                self.misses += 1
+                entry = self._rasterise(text=text, font=font, fontmode=draw.fontmode)
+                self._masks[key] = entry
+                if len(self._masks) > self.max_size:
+                    self._masks.popitem(last=False)
+        (left, top), mask = entry
+        draw.bitmap(xy=(int(xy[0]) + left, int(xy[1]) + top), bitmap=mask, fill=fill)
+
+    @staticmethod
+    def _rasterise(text: str, font: ImageFont.FreeTypeFont, fontmode: str) -> Tuple[Tuple[int, int], Image.Image]:
+        """
+        Rasterise text into mask.
+
+        :param text: text to rasterise
+        :param font: font of text
+        :param fontmode: '1' without or 'L' with antialiasing
+        :return: offset of mask from text position and mask
+        """
+        left, top, right, bottom = font.getbbox(text, mode=fontmode)
+        mask = Image.new(mode='L', size=(int(right - left), int(bottom - top)))
+        mask_draw = ImageDraw.Draw(mask)
+        mask_draw.fontmode = fontmode
+        mask_draw.text(xy=(-left, -top), text=text, fill=255, font=font)
+        return (int(left), int(top)), mask
+
+
+TEXT_CACHE = TextCache()
+FRAME_POOLS = local()
+STATIC_LAYERS: Dict[Tuple, Image.Image] = {}
+LAYOUT_PLANS: Dict[Tuple, Optional[LayoutPlan]] = {}
+LAYOUT_FONTS = {'small': 'font_xs', 'medium': 'font_s', 'large': 'font_l'}
+
+
+def get_frame_pool(lcd: LcdInfo) -> FramePool:
+    """
+    Get frame pool of LCD type for current thread.
+
+    Each thread (i.e. parser and render worker) draws into its own images, so one thread
+    never clears frame which is drawn or pushed to LCD by another one.
+    :param lcd: LCD type
+    :return: frame pool instance
+    """
+    pools: Dict[Tuple[str, int, int], FramePool] = FRAME_POOLS.__dict__.setdefault('pools', {})
+    key = (lcd.mode.value, lcd.width, lcd.height)
+    if key not in pools:
+        pools[key] = FramePool(lcd=lcd)
+    return pools[key]
+
+
+def get_fonts_key(lcd: LcdInfo) -> Tuple:
+    """
+    Get path and size of all fonts of LCD type.
+
+    :param lcd: LCD type
+    :return: tuple of font path and size pairs
+    """
+    return tuple((font.path, font.size) for font in (lcd.font_xs, lcd.font_s, lcd.font_l) if font)
+
+
+def text_bbox(lcd: LcdInfo, xy: Tuple[int, ...], font: Optional[ImageFont.FreeTypeFont]) -> Tuple[int, int, int, int]:
+    """
+    Get bounding box of single line of text, it covers height of font from text position to the right edge of LCD.
+
+    :param lcd: LCD type
+    :param xy: position of text
+    :param font: font of text
+    :return: left, upper, right and lower (exclusive) pixel coordinate
+    """
+    ascent, descent = font.getmetrics() if font else (lcd.height, 0)
+    return xy[0], xy[1], lcd.width, min(xy[1] + ascent + descent, lcd.height)
+
+
+def load_layout(bios_name: str) -> Dict[str, Any]:
+    """
+    Load LCD layout of aircraft from user configuration directory or the one shipped with DCSpy.
+
+    :param bios_name: BIOS name of aircraft
+    :return: dictionary with layout, empty when aircraft has no layout
+    """
+    for directory in (default_yaml.parent, Path(__file__).parent):
+        layout_yaml = directory / f'{bios_name}_layout.yaml'
+        if bios_name and layout_yaml.is_file():
+            return load_yaml(full_path=layout_yaml)
+    return {}
+
+
+def get_bios_selectors(bios_name: str) -> Optional[FrozenSet[str]]:
+    """
+    Get names of all controls of aircraft from DCS-BIOS.
+
+    :param bios_name: BIOS name of aircraft
+    :return: set of control names, None when DCS-BIOS of aircraft can not be loaded
+    """
+    try:
+        plane_bios = get_full_bios_for_plane(plane=bios_name, bios_dir=Path(str(get_config_yaml_item('dcsbios'))))
+    except (KeyError, OSError, ValueError) as exp:
+        LOG.debug(f'Can not load DCS-BIOS of: {bios_name}, selectors of layout are not checked, {type(exp).__name__}: {exp}')
+        return None
+    return frozenset(ctrl_name for controls in plane_bios.root.values() for ctrl_name in controls)
+
+
+def compile_layout(layout: Dict[str, Any], lcd: LcdInfo, selectors: Optional[FrozenSet[str]] = None) -> LayoutPlan:
+    """
+    Compile LCD layout into draw plan for LCD type.
+
+    Coordinates of layout are for Mono LCD and are doubled for Color LCD. Element with `lcd` key
+    is used only for this LCD type. Elements which do not depend on any selector are static.
+    Element with selector unknown for aircraft is dropped.
+    :param layout: dictionary with layout
+    :param lcd: LCD type
+    :param selectors: all known selectors of aircraft, None - selectors are not checked
+    :return: draw plan
+    """
+    scale = 1 if lcd.type == LcdType.MONO else 2
+    plan = LayoutPlan()
+    for item in layout.get('elements', []):
+        if item.get('lcd', lcd.type.name.lower()) != lcd.type.name.lower():
+            continue
+        try:
+            operation = _compile_layout_item(item=item, lcd=lcd, scale=scale)
+        except (AttributeError, KeyError, OSError, TypeError, ValueError) as exp:
+            LOG.warning(f'Wrong layout element: {item}, {type(exp).__name__}: {exp}')
+            continue
+        unknown = operation.selectors - selectors if selectors is not None else frozenset()
+        if unknown:
+            LOG.warning(f'Unknown selector: {", ".join(sorted(unknown))} in layout element: {item}')
+            continue
+        (plan.dynamic if operation.selectors else plan.static).append(operation)
+    return plan
+
+
+def _compile_layout_item(item: Dict[str, Any], lcd: LcdInfo, scale: int) -> LayoutOp:
+    """
+    Compile single element of LCD layout into draw operation.
+
+    :param item: element of layout
+    :param lcd: LCD type
+    :param scale: scaling factor (Mono 1, Color 2)
+    :return: draw operation
+    """
+    if 'line' in item:
+        return LayoutOp(kind='line', xy=tuple(coord * scale for coord in item['line']), width=item.get('width', 1))
+    font = _get_layout_font(font=item.get('font', 'large'), lcd=lcd)
+    if 'led' in item:
+        xy = tuple(coord * scale for coord in item['xy'])
+        box = tuple(coord * scale for coord in item['box'])
+        left, upper, right, lower = font.getbbox(item['led']) if font else (0, 0, 0, 0)
+        bbox = (max(min(box[0], xy[0] + left - 1), 0), max(min(box[1], xy[1] + upper - 1), 0),
+                min(max(box[2] + 1, xy[0] + right + 1), lcd.width), min(max(box[3] + 1, xy[1] + lower + 1), lcd.height))
+        return LayoutOp(kind='led', xy=xy, bbox=bbox, selectors=frozenset([item['selector']]), text=item['led'], font=font, box=box)
+    if 'text' in item:
+        xy = tuple(coord * scale for coord in item['xy'])
+        selectors = frozenset(field.split('.')[0].split('[')[0] for _, field, _, _ in Formatter().parse(item['text']) if field)
+        return LayoutOp(kind='text', xy=xy, bbox=text_bbox(lcd=lcd, xy=xy, font=font), selectors=selectors, text=item['text'], font=font)
+    if 'box' in item:
+        box = tuple(coord * scale for coord in item['box'])
+        return LayoutOp(kind='box', xy=box[:2], box=box)
+    raise ValueError('unknown kind of element')
+
+
+def _get_layout_font(font: Union[str, Sequence[Union[str, int]]], lcd: LcdInfo) -> Optional[ImageFont.FreeTypeFont]:
+    """
+    Get font of layout element, LCD font by name (small, medium, large) or font file name with size.
+
+    :param font: name of LCD font or font file name and size
+    :param lcd: LCD type
+    :return: font instance
+    """
+    if isinstance(font, str):
+        return getattr(lcd, LAYOUT_FONTS[font])
+    name, size = str(font[0]), int(font[1])
+    font_file = (Path(__file__).parent / 'resources' / name).resolve()
+    return get_font(name=str(font_file) if font_file.is_file() else name, size=size)
+
+
+def get_layout_plan(bios_name: str, lcd: LcdInfo) -> Optional[LayoutPlan]:
+    """
+    Get draw plan of aircraft, compiled once per aircraft, LCD type and fonts.
+
+    :param bios_name: BIOS name of aircraft
+    :param lcd: LCD type
+    :return: draw plan, None when aircraft has no layout
+    """
+    key = (bios_name, lcd.type.name, get_fonts_key(lcd))
+    if key not in LAYOUT_PLANS:
+        layout = load_layout(bios_name)
+        LAYOUT_PLANS[key] = compile_layout(layout=layout, lcd=lcd, selectors=get_bios_selectors(bios_name)) if layout else None
+    return LAYOUT_PLANS[key]
+
+
 class AdvancedAircraft(BasicAircraft):
     """Advanced Aircraft."""
     def __init__(self, lcd_type: LcdInfo) -> None:
@@ -163,17 +578,99 @@ class AdvancedAircraft(BasicAircraft):
         :param lcd_type: LCD type
         """
         super().__init__(lcd_type=lcd_type)
-        self._debug_img = cycle([f'{x:03}' for x in range(NO_OF_LCD_SCREENSHOTS)])
+        self.screenshot_recorder: Optional[ScreenshotRecorder] = None
+        self.render_scheduler: Optional[RenderScheduler] = None
+        self.render_worker: Optional[RenderWorker] = None
+        self._render_local = local()
+        self._lcd_elements: Optional[List[LcdElement]] = None
+        self._changed_selectors: Set[str] = set()
+        self._frame: Optional[Image.Image] = None
+        self._frame_update = False
+        self._layout_missing = False
+        plan = get_layout_plan(bios_name=self.bios_name, lcd=self.lcd)
+        for operation in plan.dynamic if plan else []:
+            for selector in operation.selectors:
+                self.bios_data.setdefault(selector, int() if operation.kind == 'led' else '')
 
     def set_bios(self, selector: str, value: Union[str, int]) -> None:
         """
         Set value for DCS-BIOS selector and update LCD with image.
 
+        With render scheduler, LCD is updated once per DCS-BIOS frame.
         :param selector:
         :param value:
         """
         super().set_bios(selector=selector, value=value)
-        lcd_sdk.update_display(self.prepare_image())
+        self._changed_selectors.add(selector)
+        if not self._frame_update:
+            self._request_render()
+
+    def set_frame_changes(self, frame_changes: Mapping[str, Union[str, int]]) -> None:
+        """
+        Set values of all selectors changed during DCS-BIOS frame and update LCD once.
+
+        Frame without change of any selector of aircraft is skipped without rendering.
+        :param frame_changes: new values of controls changed during frame
+        """
+        changes = [(selector, value) for selector, value in frame_changes.items() if selector in self.bios_data]
+        if not changes:
+            return
+        self._frame_update = True
+        try:
+            for selector, value in changes:
+                self.set_bios(selector=selector, value=value)
+        finally:
+            self._frame_update = False
+        self._request_render()
+
+    def _request_render(self) -> None:
+        """Update LCD now or mark image as outdated for render scheduler."""
+        if self.render_scheduler:
+            self.render_scheduler.mark_dirty()
+        else:
+            self.update_display()
+
+    def get_bios(self, selector: str, default: Union[str, int, float] = '') -> Union[str, int, float]:
+        """
+        Get value for DCS-BIOS selector, from snapshot of BIOS data in render worker thread.
+
+        :param selector: name of selector
+        :param default: return this when fetch fail
+        """
+        snapshot = getattr(self._render_local, 'bios_data', None)
+        if snapshot is None:
+            return super().get_bios(selector=selector, default=default)
+        try:
+            return type(default)(snapshot[selector])
+        except (KeyError, ValueError):
+            return default
+
+    def update_display(self) -> None:
+        """
+        Prepare image and send it to LCD.
+
+        With render worker, only snapshot of BIOS data is published and image is rendered by worker thread.
+        """
+        if self.render_worker:
+            changed, self._changed_selectors = self._changed_selectors, set()
+            self.render_worker.publish(snapshot=MappingProxyType(dict(self.bios_data)), changed=changed)
+        else:
+            lcd_sdk.update_display(self.prepare_image())
+
+    def render_snapshot(self, bios_data: Mapping[str, Union[str, int]], changed: Set[str]) -> None:
+        """
+        Prepare image from snapshot of BIOS data and send it to LCD.
+
+        :param bios_data: immutable BIOS data
+        :param changed: selectors changed since previous snapshot
+        """
+        self._render_local.bios_data = bios_data
+        self._render_local.changed = changed
+        try:
+            lcd_sdk.update_display(self.prepare_image())
+        finally:
+            self._render_local.bios_data = None
+            self._render_local.changed = None
 
     def prepare_image(self) -> Image.Image:
         """
@@ -181,21 +678,193 @@ class AdvancedAircraft(BasicAircraft):
 
         :return: image instance ready display on LCD
         """
-        img = Image.new(mode=self.lcd.mode.value, size=(self.lcd.width, self.lcd.height), color=self.lcd.background)
-        getattr(self, f'draw_for_lcd_{self.lcd.type.name.lower()}')(img)
+        changed = self._pop_changed_selectors()
+        if self.cfg.get('render_dirty_regions', False) and self.get_lcd_elements():
+            img = self._draw_dirty_regions(changed)
+        else:
+            img = get_frame_pool(self.lcd).next_frame(static=self._get_static_layer())
+            getattr(self, f'draw_for_lcd_{self.lcd.type.name.lower()}')(img)
         if self.cfg.get('save_lcd', False):
-            screen_shot_file = f'{type(self).__name__}_{next(self._debug_img)}.png'
-            img.save(Path(gettempdir()) / screen_shot_file, 'PNG')
-            LOG.debug(f'Save screenshot: {screen_shot_file}')
+            if not self.screenshot_recorder:
+                self.screenshot_recorder = ScreenshotRecorder(name=type(self).__name__, directory=Path(gettempdir()),
+                                                              frame_log=bool(self.cfg.get('save_lcd_log', False)))
+            self.screenshot_recorder.record(img)
         return img
 
+    def _pop_changed_selectors(self) -> Set[str]:
+        """
+        Get selectors changed since previous image, from snapshot in render worker thread.
+
+        :return: set of selectors
+        """
+        changed = getattr(self._render_local, 'changed', None)
+        if changed is None:
+            changed, self._changed_selectors = self._changed_selectors, set()
+        return changed
+
+    def _draw_dirty_regions(self, changed: Set[str]) -> Image.Image:
+        """
+        Redraw only LCD elements, which depend on changed selectors, on persistent frame.
+
+        Bounding boxes of changed elements are redrawn from static layer, together with all elements
+        which overlap them. Selectors not used by any element do not change image.
+        :param changed: selectors changed since previous image
+        :return: persistent image instance
+        """
+        pool = get_frame_pool(self.lcd)
+        if self._frame is None:
+            img = pool.next_frame(static=self._get_static_layer())
+            getattr(self, f'draw_for_lcd_{self.lcd.type.name.lower()}')(img)
+            self._frame = img.copy()
+            return self._frame
+
+        elements = self.get_lcd_elements()
+        dirty = [element.bbox for element in elements if element.selectors & changed]
+        if dirty:
+            img = pool.next_frame(static=self._get_static_layer())
+            draw = pool.get_draw(img)
+            for element in elements:
+                if any(element.intersects(bbox) for bbox in dirty):
+                    element.draw(draw)
+            for bbox in dirty:
+                self._frame.paste(img.crop(bbox), bbox)
+        return self._frame
+
+    def get_lcd_elements(self) -> List[LcdElement]:
+        """
+        Get LCD elements with bounding boxes and selectors they depend on, built once for aircraft.
+
+        :return: list of LCD elements in drawing order
+        """
+        if self._lcd_elements is None:
+            self._lcd_elements = self._build_lcd_elements(scale=1 if self.lcd.type == LcdType.MONO else 2)
+        return self._lcd_elements
+
+    def _build_lcd_elements(self, scale: int) -> List[LcdElement]:
+        """
+        Build LCD elements (based on scale) from layout, none without layout, so whole image is always redrawn.
+
+        Aircraft with LCD elements should draw whole dynamic part of image with them.
+        :param scale: scaling factor (Mono 1, Color 2)
+        :return: list of LCD elements in drawing order
+        """
+        plan = get_layout_plan(bios_name=self.bios_name, lcd=self.lcd)
+        if not plan:
+            return []
+        return [LcdElement(bbox=operation.bbox, selectors=operation.selectors, draw=partial(getattr(self, f'_draw_layout_{operation.kind}'), operation))
+                for operation in plan.dynamic]
+
+    def _draw_layout_line(self, operation: LayoutOp, draw: ImageDraw.ImageDraw) -> None:
+        """
+        Draw line of layout.
+
+        :param operation: draw operation
+        :param draw: ImageDraw instance
+        """
+        draw.line(xy=operation.xy, fill=self.lcd.foreground, width=operation.width)
+
+    def _draw_layout_box(self, operation: LayoutOp, draw: ImageDraw.ImageDraw) -> None:
+        """
+        Draw box of layout.
+
+        :param operation: draw operation
+        :param draw: ImageDraw instance
+        """
+        draw.rectangle(xy=operation.box, fill=self.lcd.background, outline=self.lcd.foreground)
+
+    def _draw_layout_text(self, operation: LayoutOp, draw: ImageDraw.ImageDraw) -> None:
+        """
+        Draw text of layout with values of its selectors.
+
+        :param operation: draw operation
+        :param draw: ImageDraw instance
+        """
+        text = operation.text.format_map({selector: self.get_bios(selector) for selector in operation.selectors})
+        TEXT_CACHE.text(draw, xy=(operation.xy[0], operation.xy[1]), text=text, fill=self.lcd.foreground, font=operation.font)
+
+    def _draw_layout_led(self, operation: LayoutOp, draw: ImageDraw.ImageDraw) -> None:
+        """
+        Draw indicator LED of layout, filled when its selector is on.
+
+        :param operation: draw operation
+        :param draw: ImageDraw instance
+        """
+        turn_on = int(self.get_bios(next(iter(operation.selectors)), 0))
+        draw_autopilot_channels(self.lcd, operation.text, operation.box, (operation.xy[0], operation.xy[1]), draw, turn_on, operation.font)
+
+    def _draw_lcd_elements(self, img: Image.Image) -> None:
+        """
+        Draw all LCD elements.
+
+        :param img: image instance
+        """
+        draw = self._get_draw(img)
+        for element in self.get_lcd_elements():
+            element.draw(draw)
+
+    def _get_static_layer(self) -> Image.Image:
+        """
+        Get image with static layer, rendered once per aircraft, LCD type and fonts.
+
+        :return: image instance
+        """
+        key = (type(self).__name__, self.lcd.type.name, get_fonts_key(self.lcd))
+        if key not in STATIC_LAYERS:
+            img = Image.new(mode=self.lcd.mode.value, size=(self.lcd.width, self.lcd.height), color=self.lcd.background)
+            getattr(self, f'draw_static_for_lcd_{self.lcd.type.name.lower()}')(img)
+            STATIC_LAYERS[key] = img
+        return STATIC_LAYERS[key]
+
+    def draw_static_for_lcd_mono(self, img: Image.Image) -> None:
+        """Prepare static layer for Mono LCD."""
+        self._draw_static_data(draw=self._get_draw(img), scale=1)
+
+    def draw_static_for_lcd_color(self, img: Image.Image) -> None:
+        """Prepare static layer for Color LCD."""
+        self._draw_static_data(draw=self._get_draw(img), scale=2)
+
+    def _draw_static_data(self, draw: ImageDraw.ImageDraw, scale: int) -> None:
+        """
+        Draw part which never changes (based on scale) from layout, nothing without layout.
+
+        :param draw: ImageDraw instance
+        :param scale: scaling factor (Mono 1, Color 2)
+        """
+        plan = get_layout_plan(bios_name=self.bios_name, lcd=self.lcd)
+        for operation in plan.static if plan else []:
+            getattr(self, f'_draw_layout_{operation.kind}')(operation, draw)
+
+    def _get_draw(self, img: Image.Image) -> ImageDraw.ImageDraw:
+        """
+        Get draw context for image.
+
+        :param img: image instance
+        :return: ImageDraw instance
+        """
+        return get_frame_pool(self.lcd).get_draw(img)
+
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
-        """Prepare image for Aircraft for Mono LCD."""
-        raise NotImplementedError
+        """Prepare image for Aircraft for Mono LCD, from layout."""
+        self._draw_layout(img)
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
-        """Prepare image for Aircraft for Color LCD."""
-        raise NotImplementedError
+        """Prepare image for Aircraft for Color LCD, from layout."""
+        self._draw_layout(img)
+
+    def _draw_layout(self, img: Image.Image) -> None:
+        """
+        Draw dynamic part of image from layout.
+
+        When layout of aircraft is missing, i.e. layout file is not installed, warning is logged once and image stays blank.
+        :param img: image instance
+        """
+        if get_layout_plan(bios_name=self.bios_name, lcd=self.lcd):
+            self._draw_lcd_elements(img)
+        elif not self.bios_name:
+            raise NotImplementedError
+        elif not self._layout_missing:
+            self._layout_missing = True
+            LOG.warning(f'No LCD layout for: {self.bios_name}, LCD stays blank')
 
 
 class FA18Chornet(AdvancedAircraft):
@@ -232,45 +901,6 @@ class FA18Chornet(AdvancedAircraft):
             'IFEI_UP_BTN': int(),
         })
 
-    def _draw_common_data(self, draw: ImageDraw.ImageDraw, scale: int) -> ImageDraw.ImageDraw:
-        """
-        Draw common part (based on scale) for Mono and Color LCD.
-
-        :param draw: ImageDraw instance
-        :param scale: scaling factor (Mono 1, Color 2)
-        :return: updated image to draw
-        """
-        scratch_1 = self.get_bios('UFC_SCRATCHPAD_STRING_1_DISPLAY')
-        scratch_2 = self.get_bios('UFC_SCRATCHPAD_STRING_2_DISPLAY')
-        scratch_num = self.get_bios('UFC_SCRATCHPAD_NUMBER_DISPLAY')
-        draw.text(xy=(0, 0), fill=self.lcd.foreground, font=self.lcd.font_l,
-                  text=f'{scratch_1}{scratch_2}{scratch_num}')
-        draw.line(xy=(0, 20 * scale, 115 * scale, 20 * scale), fill=self.lcd.foreground, width=1)
-
-        draw.rectangle(xy=(0, 29 * scale, 20 * scale, 42 * scale), fill=self.lcd.background, outline=self.lcd.foreground)
-        draw.text(xy=(2 * scale, 29 * scale), text=str(self.get_bios('UFC_COMM1_DISPLAY')), fill=self.lcd.foreground, font=self.lcd.font_l)
-
-        offset = 44 * scale
-        draw.rectangle(xy=(139 * scale - offset, 29 * scale, 159 * scale - offset, 42 * scale), fill=self.lcd.background, outline=self.lcd.foreground)
-        draw.text(xy=(140 * scale - offset, 29 * scale), text=str(self.get_bios('UFC_COMM2_DISPLAY')), fill=self.lcd.foreground, font=self.lcd.font_l)
-
-        for i in range(1, 6):
-            offset = (i - 1) * 8 * scale
-            draw.text(xy=(120 * scale, offset), fill=self.lcd.foreground, font=self.lcd.font_s,
-                      text=f'{i}{self.get_bios(f"UFC_OPTION_CUEING_{i}")}{self.get_bios(f"UFC_OPTION_DISPLAY_{i}")}')
-
-        draw.text(xy=(36 * scale, 29 * scale), text=str(self.get_bios('IFEI_FUEL_UP')), fill=self.lcd.foreground, font=self.lcd.font_l)
-        return draw
-
-    def draw_for_lcd_mono(self, img: Image.Image) -> None:
-        """Prepare image for F/A-18C Hornet for Mono LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), scale=1)
-
-    def draw_for_lcd_color(self, img: Image.Image) -> None:
-        """Prepare image for F/A-18C Hornet for Color LCD."""
-        draw = self._draw_common_data(draw=ImageDraw.Draw(img), scale=2)
-        draw.text(xy=(72, 100), text=str(self.get_bios('IFEI_FUEL_DOWN')), fill=self.lcd.foreground, font=self.lcd.font_l)
-
     def set_bios(self, selector: str, value: Union[str, int]) -> None:
         """
         Set new data.
@@ -292,6 +922,8 @@ class F16C50(AdvancedAircraft):
         ('A\x10\x04', ''), ('\x82', ''), ('\x03', ''), ('\x02', ''), ('\x80', ''), ('\x08', ''), ('\x10', ''),
         ('\x07', ''), ('\x0f', ''), ('\xfe', ''), ('\xfc', ''), ('\x03', ''), ('\xff', ''), ('\xc0', '')
     )
+    # List - 6, line which ends with '@' when garbage is removed
+    LIST_PAGE = re_compile(f'@(?:{"|".join(escape(original) for original, _ in COMMON_SYMBOLS_TO_REPLACE)})*$')
     # degree sign, 'a' to up-down arrow 2195 or black diamond 2666, INVERSE WHITE CIRCLE
     MONO_SYMBOLS_TO_REPLACE = (('o', '\u00b0'), ('a', '\u2666'), ('*', '\u25d9'))
     # degree sign, fix up-down triangle arrow, fix to inverse star
@@ -320,8 +952,9 @@ class F16C50(AdvancedAircraft):
         self.font = self.lcd.font_s
         self.ded_font = self.cfg.get('f16_ded_font', True)
         if self.ded_font and self.lcd.type == LcdType.COLOR:
-            self.font = ImageFont.truetype(str((Path(__file__) / '..' / 'resources' / 'falconded.ttf').resolve()), 25)
+            self.font = get_font(*DED_FONT)
         self.bios_data.update({f'DED_LINE_{i}': '' for i in range(1, 6)})
+        self._translators = {list_page: self._get_translator(list_page=list_page) for list_page in (False, True)}
 
     def _draw_common_data(self, draw: ImageDraw.ImageDraw, separation: int) -> None:
         """
@@ -332,15 +965,15 @@ class F16C50(AdvancedAircraft):
         """
         for i in range(1, 6):
             offset = (i - 1) * separation
-            draw.text(xy=(0, offset), text=str(self.get_bios(f'DED_LINE_{i}')), fill=self.lcd.foreground, font=self.font)
+            TEXT_CACHE.text(draw, xy=(0, offset), text=str(self.get_bios(f'DED_LINE_{i}')), fill=self.lcd.foreground, font=self.font)
 
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for F-16C Viper for Mono LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), separation=8)
+        self._draw_common_data(draw=self._get_draw(img), separation=8)
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for F-16C Viper for Color LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), separation=24)
+        self._draw_common_data(draw=self._get_draw(img), separation=24)
 
     def set_bios(self, selector: str, value: Union[str, int]) -> None:
         """
@@ -362,34 +995,25 @@ class F16C50(AdvancedAircraft):
         :param value: The string value to be cleaned and replaced.
         :return: The cleaned and replaced string value.
         """
-        value = replace_symbols(value, self.COMMON_SYMBOLS_TO_REPLACE)
-        if value and value[-1] == '@':
-            value = value.replace('@', '')  # List - 6
-        if self.lcd.type == LcdType.MONO:
-            value = self._replace_symbols_for_mono_lcd(value)
-        elif self.ded_font and self.lcd.type == LcdType.COLOR:
-            value = self._replace_symbols_for_color_lcd(value)
-        return value
-
-    def _replace_symbols_for_mono_lcd(self, value: str) -> str:
-        """
-        Clean and replace garbage characters for Mono LCD.
-
-        :param value: The input string that needs to be modified.
-        :return: The modified string after replacing symbols based on the MONO_SYMBOLS_TO_REPLACE dictionary.
-        """
-        return replace_symbols(value, self.MONO_SYMBOLS_TO_REPLACE)
+        return self._translators[bool(self.LIST_PAGE.search(value))].translate(value)
 
-    def _replace_symbols_for_color_lcd(self, value: str) -> str:
+    def _get_translator(self, list_page: bool) -> SymbolTranslator:
         """
-        Clean and replace garbage characters for Color LCD.
+        Get symbol translator with all replacements for LCD type, compiled once per aircraft and LCD type.
 
-        :param value: The input string value.
-        :return: The modified string with replaced symbols.
+        Garbage characters are removed, '@' is removed from List page line and symbols are replaced for LCD type.
+        :param list_page: remove '@' from List page line
+        :return: symbol translator instance
         """
-        value = replace_symbols(value, self.COLOR_SYMBOLS_TO_REPLACE)
-        value = substitute_symbols(value, self.COLOR_SYMBOLS_TO_SUBSTITUTE)
-        return value
+        lcd_replacement: Tuple[Tuple[str, str], ...] = ()
+        lcd_substitution: Tuple[Tuple[str, str], ...] = ()
+        if self.lcd.type == LcdType.MONO:
+            lcd_replacement = self.MONO_SYMBOLS_TO_REPLACE
+        elif self.ded_font and self.lcd.type == LcdType.COLOR:
+            lcd_replacement, lcd_substitution = self.COLOR_SYMBOLS_TO_REPLACE, self.COLOR_SYMBOLS_TO_SUBSTITUTE
+        list_page_replacement = (('@', ''),) if list_page else ()
+        symbol_replacement = compose_symbol_replacements(self.COMMON_SYMBOLS_TO_REPLACE, list_page_replacement, lcd_replacement)
+        return get_symbol_translator(symbol_replacement, lcd_substitution)
 
 
 class F15ESE(AdvancedAircraft):
@@ -407,24 +1031,24 @@ class F15ESE(AdvancedAircraft):
 
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for F-15ESE Eagle for Mono LCD."""
-        draw = ImageDraw.Draw(img)
+        draw = self._get_draw(img)
         for i in range(1, 6):
             offset = (i - 1) * 8
-            draw.text(xy=(0, offset), text=str(self.get_bios(f'F_UFC_LINE{i}_DISPLAY')), fill=self.lcd.foreground, font=self.lcd.font_s)
+            TEXT_CACHE.text(draw, xy=(0, offset), text=str(self.get_bios(f'F_UFC_LINE{i}_DISPLAY')), fill=self.lcd.foreground, font=self.lcd.font_s)
         if mat := search(r'\s*([0-9G]{1,2})\s+([0-9GV]{1,2})\s+', str(self.get_bios('F_UFC_LINE6_DISPLAY'))):
             uhf, v_uhf = mat.groups()
-            draw.text(xy=(130, 30), text=f'{uhf:>2} {v_uhf:>2}', fill=self.lcd.foreground, font=self.lcd.font_s)
+            TEXT_CACHE.text(draw, xy=(130, 30), text=f'{uhf:>2} {v_uhf:>2}', fill=self.lcd.foreground, font=self.lcd.font_s)
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for F-15ESE Eagle for Color LCD."""
-        draw = ImageDraw.Draw(img)
+        draw = self._get_draw(img)
         for i in range(1, 7):
             offset = (i - 1) * 24
             # todo: fix custom font for Color LCD
-            draw.text(xy=(0, offset),
-                      text=str(self.get_bios(f'F_UFC_LINE{i}_DISPLAY')),
-                      fill=self.lcd.foreground,
-                      font=ImageFont.truetype(DEFAULT_FONT_NAME, 29))
+            TEXT_CACHE.text(draw, xy=(0, offset),
+                            text=str(self.get_bios(f'F_UFC_LINE{i}_DISPLAY')),
+                            fill=self.lcd.foreground,
+                            font=get_font(*F15ESE_UFC_FONT))
 
 
 class Ka50(AdvancedAircraft):
@@ -460,6 +1084,18 @@ class Ka50(AdvancedAircraft):
         """
         Draw common part (based on scale) for Mono and Color LCD.
 
+        :param draw: ImageDraw instance
+        :param scale: scaling factor (Mono 1, Color 2)
+        """
+        line1, line2 = self._generate_pvi_lines()
+        TEXT_CACHE.text(draw, xy=(2 * scale, 3 * scale), text=line1, fill=self.lcd.foreground, font=self.lcd.font_l)
+        TEXT_CACHE.text(draw, xy=(2 * scale, 24 * scale), text=line2, fill=self.lcd.foreground, font=self.lcd.font_l)
+        self._auto_pilot_switch(draw, scale)
+
+    def _draw_static_data(self, draw: ImageDraw.ImageDraw, scale: int) -> None:
+        """
+        Draw PVI rectangles (based on scale) for Mono and Color LCD.
+
         :param draw: ImageDraw instance
         :param scale: scaling factor (Mono 1, Color 2)
         """
@@ -470,10 +1106,6 @@ class Ka50(AdvancedAircraft):
             (88 * scale, 22 * scale, 103 * scale, 39 * scale),
         ]:
             draw.rectangle(xy=rect_xy, fill=self.lcd.background, outline=self.lcd.foreground)
-        line1, line2 = self._generate_pvi_lines()
-        draw.text(xy=(2 * scale, 3 * scale), text=line1, fill=self.lcd.foreground, font=self.lcd.font_l)
-        draw.text(xy=(2 * scale, 24 * scale), text=line2, fill=self.lcd.foreground, font=self.lcd.font_l)
-        self._auto_pilot_switch(draw, scale)
 
     def _generate_pvi_lines(self) -> Sequence[str]:
         """
@@ -512,11 +1144,11 @@ class Ka50(AdvancedAircraft):
 
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for Ka-50 Black Shark for Mono LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), scale=1)
+        self._draw_common_data(draw=self._get_draw(img), scale=1)
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for Ka-50 Black Shark for Mono LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), scale=2)
+        self._draw_common_data(draw=self._get_draw(img), scale=2)
 
 
 class Ka503(Ka50):
@@ -563,15 +1195,15 @@ class Mi8MT(AdvancedAircraft):
         r863, r828, yadro = self._generate_radio_values()
         for i, line in enumerate([f'R828 {r828}', f'YADRO1 {yadro}', f'R863 {r863}'], 1):
             offset = i * 10 * scale
-            draw.text(xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
+            TEXT_CACHE.text(draw, xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
 
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for Mi-8MTV2 Magnificent Eight for Mono LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), scale=1)
+        self._draw_common_data(draw=self._get_draw(img), scale=1)
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for Mi-8MTV2 Magnificent Eight for Color LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), scale=2)
+        self._draw_common_data(draw=self._get_draw(img), scale=2)
 
     def _generate_radio_values(self) -> Sequence[str]:
         """
@@ -634,15 +1266,15 @@ class Mi24P(AdvancedAircraft):
         r863, r828, yadro = self._generate_radio_values()
         for i, line in enumerate([f'R828 {r828}', f'R863 {r863}', f'YADRO1 {yadro}'], 1):
             offset = i * 10 * scale
-            draw.text(xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
+            TEXT_CACHE.text(draw, xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
 
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for Mi-24P Hind for Mono LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), scale=1)
+        self._draw_common_data(draw=self._get_draw(img), scale=1)
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for Mi-24P Hind for Color LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), scale=2)
+        self._draw_common_data(draw=self._get_draw(img), scale=2)
 
     def _generate_radio_values(self) -> Sequence[str]:
         """
@@ -668,6 +1300,11 @@ class ApacheEufdMode(Enum):
 class AH64DBLKII(AdvancedAircraft):
     """AH-64D Apache."""
     bios_name: str = 'AH-64D_BLK_II'
+    # right arrow
+    EUFD_SYMBOLS_TO_REPLACE = (('!', '\u2192'),)
+    # black diamond, lozenge, black square, right and left triangles, bullet operator and right arrow
+    IDM_SYMBOLS_TO_REPLACE = ((']', '\u2666'), ('[', '\u25ca'), ('~', '\u25a0'), ('>', '\u25b8'), ('<', '\u25c2'), ('=', '\u2219'),
+                              ('!', '\u2192'))
 
     def __init__(self, lcd_type: LcdInfo) -> None:
         """
@@ -683,7 +1320,7 @@ class AH64DBLKII(AdvancedAircraft):
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for AH-64D Apache for Mono LCD."""
         LOG.debug(f'Mode: {self.mode}')
-        kwargs = {'draw': ImageDraw.Draw(img), 'scale': 1}
+        kwargs = {'draw': self._get_draw(img), 'scale': 1}
         if (mode := self.mode.name.lower()) == 'pre':
             kwargs['x_cords'] = [0] * 5 + [80] * 5
             kwargs['y_cords'] = [j * 8 for j in range(0, 5)] * 2
@@ -694,7 +1331,7 @@ class AH64DBLKII(AdvancedAircraft):
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for AH-64D Apache for Color LCD."""
         LOG.debug(f'Mode: {self.mode}')
-        kwargs = {'draw': ImageDraw.Draw(img), 'scale': 2}
+        kwargs = {'draw': self._get_draw(img), 'scale': 2}
         if (mode := self.mode.name.lower()) == 'pre':
             kwargs['x_cords'] = [0] * 10
             kwargs['y_cords'] = [j * 24 for j in range(0, 10)]
@@ -714,7 +1351,7 @@ class AH64DBLKII(AdvancedAircraft):
             if mat := search(r'(.*\*)\s+(\d+)([.\dULCA]+)[\s\dA-Z]*\s+(\d+)([.\dULCA]+)[\sA-Z]+', str(self.get_bios(f'PLT_EUFD_LINE{i}'))):
                 spacer = ' ' * (6 - len(mat.group(3)))
                 text = f'{mat.group(1):>7}{mat.group(2):>4}{mat.group(3):5<}{spacer}{mat.group(4):>4}{mat.group(5):5<}'
-                draw.text(xy=(0, offset), text=text, fill=self.lcd.foreground, font=self.lcd.font_xs)
+                TEXT_CACHE.text(draw, xy=(0, offset), text=text, fill=self.lcd.foreground, font=self.lcd.font_xs)
 
     def _draw_for_wca(self, draw: ImageDraw.ImageDraw, scale: int) -> None:
         """
@@ -728,7 +1365,7 @@ class AH64DBLKII(AdvancedAircraft):
         try:
             for idx, warn_no in enumerate(range(self.warning_line - 1, self.warning_line + 4)):
                 line = idx * 8 * scale
-                draw.text(xy=(0, line), text=f'{idx + self.warning_line:2} {warnings[warn_no]}', fill=self.lcd.foreground, font=self.lcd.font_s)
+                TEXT_CACHE.text(draw, xy=(0, line), text=f'{idx + self.warning_line:2} {warnings[warn_no]}', fill=self.lcd.foreground, font=self.lcd.font_s)
                 if self.warning_line >= len(warnings) - 3:
                     self.warning_line = 1
         except IndexError:
@@ -769,8 +1406,8 @@ class AH64DBLKII(AdvancedAircraft):
         }
         for i, x_cord, y_cord in zip(range(2, 12), x_cords, y_cords):
             if mat := search(match_dict[i], str(self.get_bios(f'PLT_EUFD_LINE{i}'))):
-                draw.text(xy=(x_cord, y_cord), text=f'{mat.group(1):<9}{mat.group(2):>7}',
-                          fill=self.lcd.foreground, font=font)
+                TEXT_CACHE.text(draw, xy=(x_cord, y_cord), text=f'{mat.group(1):<9}{mat.group(2):>7}',
+                                fill=self.lcd.foreground, font=font)
 
     def set_bios(self, selector: str, value: Union[str, int]) -> None:
         """
@@ -785,11 +1422,10 @@ class AH64DBLKII(AdvancedAircraft):
                 self.mode = ApacheEufdMode.PRE
         if selector in ('PLT_EUFD_LINE8', 'PLT_EUFD_LINE9', 'PLT_EUFD_LINE10', 'PLT_EUFD_LINE11', 'PLT_EUFD_LINE12'):
             LOG.debug(f'{type(self).__name__} {selector} original: "{value}"')
-            value = str(value).replace(']', '\u2666').replace('[', '\u25ca').replace('~', '\u25a0'). \
-                replace('>', '\u25b8').replace('<', '\u25c2').replace('=', '\u2219')
-        if 'PLT_EUFD_LINE' in selector:
+            value = get_symbol_translator(self.IDM_SYMBOLS_TO_REPLACE).translate(str(value))
+        elif 'PLT_EUFD_LINE' in selector:
             LOG.debug(f'{type(self).__name__} {selector} original: "{value}"')
-            value = str(value).replace('!', '\u2192')  # replace ! with ->
+            value = get_symbol_translator(self.EUFD_SYMBOLS_TO_REPLACE).translate(str(value))
         super().set_bios(selector, value)
 
     def button_request(self, button: Union[LcdButton, Gkey]) -> str:
@@ -891,23 +1527,23 @@ class A10C(AdvancedAircraft):
 
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for A-10C Warthog for Mono LCD."""
-        draw = ImageDraw.Draw(img)
+        draw = self._get_draw(img)
         uhf = self._generate_uhf()
         vhf_am = self._generate_vhf('AM')
         vhf_fm = self._generate_vhf('FM')
         for i, line in enumerate(['      *** RADIOS ***', f' AM: {vhf_am}', f'UHF: {uhf}', f' FM: {vhf_fm}']):
             offset = i * 10
-            draw.text(xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
+            TEXT_CACHE.text(draw, xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for A-10C Warthog for Color LCD."""
-        draw = ImageDraw.Draw(img)
+        draw = self._get_draw(img)
         uhf = self._generate_uhf()
         vhf_am = self._generate_vhf('AM')
         vhf_fm = self._generate_vhf('FM')
         for i, line in enumerate(['      *** RADIOS ***', f' AM: {vhf_am}', f'UHF: {uhf}', f' FM: {vhf_fm}']):
             offset = i * 20
-            draw.text(xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
+            TEXT_CACHE.text(draw, xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
 
 
 class A10C2(A10C):
@@ -916,23 +1552,23 @@ class A10C2(A10C):
 
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for A-10C II Tank Killer for Mono LCD."""
-        draw = ImageDraw.Draw(img)
+        draw = self._get_draw(img)
         uhf = self._generate_uhf()
         vhf_fm = self._generate_vhf('FM')
         arc = self._generate_arc()
         for i, line in enumerate(['      *** RADIOS ***', f' AM: {arc}', f'UHF: {uhf}', f' FM: {vhf_fm}']):
             offset = i * 10
-            draw.text(xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
+            TEXT_CACHE.text(draw, xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for A-10C II Tank Killer for Color LCD."""
-        draw = ImageDraw.Draw(img)
+        draw = self._get_draw(img)
         uhf = self._generate_uhf()
         vhf_fm = self._generate_vhf('FM')
         arc = self._generate_arc()
         for i, line in enumerate(['      *** RADIOS ***', f' AM: {arc}', f'UHF: {uhf}', f' FM: {vhf_fm}']):
             offset = i * 20
-            draw.text(xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
+            TEXT_CACHE.text(draw, xy=(0, offset), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
 
 
 class F14B(AdvancedAircraft):
@@ -945,15 +1581,15 @@ class F14B(AdvancedAircraft):
 
         :param draw: ImageDraw instance
         """
-        draw.text(xy=(2, 3), text=f'{self.bios_name}', fill=self.lcd.foreground, font=self.lcd.font_l)
+        TEXT_CACHE.text(draw, xy=(2, 3), text=f'{self.bios_name}', fill=self.lcd.foreground, font=self.lcd.font_l)
 
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for F-14B Tomcat for Mono LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img))
+        self._draw_common_data(draw=self._get_draw(img))
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for F-14B Tomcat for Color LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img))
+        self._draw_common_data(draw=self._get_draw(img))
 
 
 class F14A135GR(F14B):
@@ -996,28 +1632,34 @@ class AV8BNA(AdvancedAircraft):
         :param scale: scaling factor (Mono 1, Color 2)
         :return: updated image to draw
         """
-        draw.text(xy=(50 * scale, 0), fill=self.lcd.foreground, font=self.lcd.font_l, text=f'{self.get_bios("UFC_SCRATCHPAD")}')
-        draw.line(xy=(50 * scale, 20 * scale, 160 * scale, 20 * scale), fill=self.lcd.foreground, width=1)
-
-        draw.rectangle(xy=(50 * scale, 29 * scale, 70 * scale, 42 * scale), fill=self.lcd.background, outline=self.lcd.foreground)
-        draw.text(xy=(52 * scale, 29 * scale), text=str(self.get_bios('UFC_COMM1_DISPLAY')), fill=self.lcd.foreground, font=self.lcd.font_l)
-
-        draw.rectangle(xy=(139 * scale, 29 * scale, 159 * scale, 42 * scale), fill=self.lcd.background, outline=self.lcd.foreground)
-        draw.text(xy=(140 * scale, 29 * scale), text=str(self.get_bios('UFC_COMM2_DISPLAY')), fill=self.lcd.foreground, font=self.lcd.font_l)
+        TEXT_CACHE.text(draw, xy=(50 * scale, 0), fill=self.lcd.foreground, font=self.lcd.font_l, text=f'{self.get_bios("UFC_SCRATCHPAD")}')
+        TEXT_CACHE.text(draw, xy=(52 * scale, 29 * scale), text=str(self.get_bios('UFC_COMM1_DISPLAY')), fill=self.lcd.foreground, font=self.lcd.font_l)
+        TEXT_CACHE.text(draw, xy=(140 * scale, 29 * scale), text=str(self.get_bios('UFC_COMM2_DISPLAY')), fill=self.lcd.foreground, font=self.lcd.font_l)
 
         for i in range(1, 6):
             offset = (i - 1) * 8 * scale
-            draw.text(xy=(0 * scale, offset), fill=self.lcd.foreground, font=self.lcd.font_s,
-                      text=f'{i}{self.get_bios(f"AV8BNA_ODU_{i}_SELECT")}{self.get_bios(f"AV8BNA_ODU_{i}_TEXT")}')
+            TEXT_CACHE.text(draw, xy=(0 * scale, offset), fill=self.lcd.foreground, font=self.lcd.font_s,
+                            text=f'{i}{self.get_bios(f"AV8BNA_ODU_{i}_SELECT")}{self.get_bios(f"AV8BNA_ODU_{i}_TEXT")}')
         return draw
 
+    def _draw_static_data(self, draw: ImageDraw.ImageDraw, scale: int) -> None:
+        """
+        Draw separator line and COMM boxes (based on scale) for Mono and Color LCD.
+
+        :param draw: ImageDraw instance
+        :param scale: scaling factor (Mono 1, Color 2)
+        """
+        draw.line(xy=(50 * scale, 20 * scale, 160 * scale, 20 * scale), fill=self.lcd.foreground, width=1)
+        draw.rectangle(xy=(50 * scale, 29 * scale, 70 * scale, 42 * scale), fill=self.lcd.background, outline=self.lcd.foreground)
+        draw.rectangle(xy=(139 * scale, 29 * scale, 159 * scale, 42 * scale), fill=self.lcd.background, outline=self.lcd.foreground)
+
     def draw_for_lcd_mono(self, img: Image.Image) -> None:
         """Prepare image for AV-8B N/A for Mono LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), scale=1)
+        self._draw_common_data(draw=self._get_draw(img), scale=1)
 
     def draw_for_lcd_color(self, img: Image.Image) -> None:
         """Prepare image for AV-8B N/A for Color LCD."""
-        self._draw_common_data(draw=ImageDraw.Draw(img), scale=2)
+        self._draw_common_data(draw=self._get_draw(img), scale=2)
 
 
 def draw_autopilot_channels(lcd: LcdInfo,
@@ -1025,7 +1667,8 @@ def draw_autopilot_channels(lcd: LcdInfo,
                             c_rect: Tuple[float, float, float, float],
                             c_text: Tuple[float, float],
                             draw_obj: ImageDraw.ImageDraw,
-                            turn_on: Union[str, int, float]) -> None:
+                            turn_on: Union[str, int, float],
+                            font: Optional[ImageFont.FreeTypeFont] = None) -> None:
     """
     Draw rectangles with a background for autopilot channels.
 
@@ -1035,10 +1678,11 @@ def draw_autopilot_channels(lcd: LcdInfo,
     :param c_text: coordinates for a name
     :param draw_obj: ImageDraw instance
     :param turn_on: channel on/off, fill on/off
+    :param font: font of channel name, large LCD font by default
     """
     if turn_on:
         draw_obj.rectangle(c_rect, fill=lcd.foreground, outline=lcd.foreground)
-        draw_obj.text(xy=c_text, text=ap_channel, fill=lcd.background, font=lcd.font_l)
+        TEXT_CACHE.text(draw_obj, xy=c_text, text=ap_channel, fill=lcd.background, font=font or lcd.font_l)
     else:
         draw_obj.rectangle(xy=c_rect, fill=lcd.background, outline=lcd.foreground)
-        draw_obj.text(xy=c_text, text=ap_channel, fill=lcd.foreground, font=lcd.font_l)
+        TEXT_CACHE.text(draw_obj, xy=c_text, text=ap_channel, fill=lcd.foreground, font=font or lcd.font_l)
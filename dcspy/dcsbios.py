@@ -1,7 +1,23 @@
+from collections import deque
 from enum import Enum, auto
 from functools import partial
-from struct import pack
-from typing import Callable, Set
+from logging import getLogger
+from re import compile as re_compile
+from socket import socket
+from socket import timeout as socket_timeout
+from struct import pack, unpack_from
+from threading import Condition, Event, Thread
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+LOG = getLogger(__name__)
+SYNC_SEQUENCE = re_compile(b'\x55{4}')
+SET_STATE_REQUEST = re_compile(r'^(\S+) \d+\n?$')
+EXPORT_MEMORY_WORDS = 0x8000
 
 
 class ParserState(Enum):
@@ -15,6 +31,24 @@ class ParserState(Enum):
     WAIT_FOR_SYNC = auto()
 
 
+class Subscription:
+    """Handle of registered callback, which allows to remove it later."""
+    def __init__(self, unsubscribe: Callable[[], None]) -> None:
+        """
+        Initialize instance.
+
+        :param unsubscribe: function which removes registered callback
+        """
+        self.__unsubscribe = unsubscribe
+        self.active = True
+
+    def unsubscribe(self) -> None:
+        """Remove registered callback, calling it more than once has no effect."""
+        if self.active:
+            self.active = False
+            self.__unsubscribe()
+
+
 class ProtocolParser:
     """DCS_BIOS protocol parser."""
     def __init__(self) -> None:
@@ -25,7 +59,64 @@ class ProtocolParser:
         self.count = 0
         self.data = 0
         self.write_callbacks: Set[Callable] = set()
+        self.address_callbacks: Dict[int, Set[Callable]] = {}
+        self.block_callbacks: Set[Callable] = set()
         self.frame_sync_callbacks: Set[Callable] = set()
+        self.frame_changed_callbacks: Set[Callable] = set()
+        self.frame_end_callbacks: Set[Callable] = set()
+        self.frame_changes: Dict[str, Union[str, int]] = {}
+
+    def add_address_callback(self, callback: Callable, address: int, length: int = 1) -> Subscription:
+        """
+        Register write callback only for range of addresses.
+
+        Callback is called only for data words written to address in range,
+        use write_callbacks for callbacks interested in all data words.
+        :param callback: called with address and data
+        :param address: first address of range
+        :param length: number of addresses in range
+        :return: subscription handle
+        """
+        for addr in range(address, address + length):
+            self.address_callbacks.setdefault(addr, set()).add(callback)
+        return Subscription(unsubscribe=partial(self._remove_address_callback, callback, address, length))
+
+    def _remove_address_callback(self, callback: Callable, address: int, length: int) -> None:
+        """
+        Remove write callback from range of addresses.
+
+        :param callback: registered callback
+        :param address: first address of range
+        :param length: number of addresses in range
+        """
+        for addr in range(address, address + length):
+            callbacks = self.address_callbacks.get(addr, set())
+            callbacks.discard(callback)
+            if not callbacks:
+                self.address_callbacks.pop(addr, None)
+
+    def add_callback(self, callbacks: Set[Callable], callback: Callable) -> Subscription:
+        """
+        Register callback in one of parser callbacks sets.
+
+        :param callbacks: set of callbacks i.e. frame_sync_callbacks
+        :param callback: callback to register
+        :return: subscription handle
+        """
+        callbacks.add(callback)
+        return Subscription(unsubscribe=partial(callbacks.discard, callback))
+
+    def add_frame_change(self, ctrl_name: str, value: Union[str, int]) -> None:
+        """
+        Collect new value of control changed during current frame.
+
+        Changes are collected only when any frame changed callback is registered,
+        all of them are passed as one dictionary at next frame sync.
+        :param ctrl_name: name of DCS-BIOS control
+        :param value: new value of control
+        """
+        if self.frame_changed_callbacks:
+            self.frame_changes[ctrl_name] = value
 
     def process_byte(self, int_byte: int) -> None:
         """
@@ -47,6 +138,63 @@ class ProtocolParser:
 
         self._wait_for_sync()
 
+    def process_bytes(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Process whole datagram received from DCS-BIOS.
+
+        Complete write blocks are decoded at once, only sync sequences and blocks
+        split across datagrams are processed byte by byte with state machine.
+        Callbacks are called in exactly the same order as for process_byte.
+        :param data: datagram from DCS-BIOS
+        """
+        data = memoryview(data)
+        position = 0
+        while position < len(data):
+            block_end = self._process_write_block(data=data, position=position)
+            if block_end:
+                position = block_end
+            else:
+                self.process_byte(data[position])
+                position += 1
+
+    def _process_write_block(self, data: memoryview, position: int) -> int:
+        """
+        Decode complete write block (address, count and data) at once.
+
+        :param data: datagram from DCS-BIOS
+        :param position: index of first byte of write block
+        :return: index of first byte after write block, zero when block can not be decoded at once
+        """
+        if self.state != ParserState.ADDRESS_LOW or self.sync_byte_count or len(data) - position < 4:
+            return 0
+        address, count = unpack_from('<HH', data, position)
+        block_end = position + 4 + count
+        if address == 0x5555 or not count or count % 2 or block_end > len(data) or SYNC_SEQUENCE.search(data, position, block_end):
+            return 0
+        for callback in self.block_callbacks:
+            callback(address, data[position + 4:block_end])
+        words = unpack_from(f'<{count // 2}H', data, position + 4)
+        for word in words:
+            self._dispatch_write(address, word)
+            address += 2
+        self.address = address
+        self.count = 0
+        self.data = words[-1]
+        self.sync_byte_count = _count_trailing_sync_bytes(data[block_end - 3:block_end])
+        return block_end
+
+    def _dispatch_write(self, address: int, data: int) -> None:
+        """
+        Call all write callbacks with address and data.
+
+        :param address: address of data word
+        :param data: 16-bit data word
+        """
+        for callback in self.write_callbacks:
+            callback(address, data)
+        for callback in self.address_callbacks.get(address, ()):
+            callback(address, data)
+
     def _address_low(self, int_byte: int) -> None:
         """
         Handle ADDRESS_LOW state.
@@ -104,8 +252,9 @@ class ProtocolParser:
         """
         self.data += 256 * int_byte
         self.count -= 1
-        for callback in self.write_callbacks:
-            callback(self.address, self.data)
+        for callback in self.block_callbacks:
+            callback(self.address, pack('<H', self.data))
+        self._dispatch_write(self.address, self.data)
         self.address += 2
         if self.count == 0:
             self.state = ParserState.ADDRESS_LOW
@@ -113,32 +262,71 @@ class ProtocolParser:
             self.state = ParserState.DATA_LOW
 
     def _wait_for_sync(self) -> None:
-        """Handle WAIT_FOR_SYNC state."""
+        """
+        Handle WAIT_FOR_SYNC state.
+
+        At frame sync, frame sync callbacks are called first, then frame changed callbacks and frame end callbacks
+        at the end, so rendering in frame end callback sees all values extracted at frame sync.
+        """
         if self.sync_byte_count == 4:
             self.state = ParserState.ADDRESS_LOW
             self.sync_byte_count = 0
             for callback in self.frame_sync_callbacks:
                 callback()
+            self._emit_frame_changes()
+            for callback in self.frame_end_callbacks:
+                callback()
+
+    def _emit_frame_changes(self) -> None:
+        """Call frame changed callbacks with all controls changed during last frame."""
+        if self.frame_changes:
+            frame_changes, self.frame_changes = self.frame_changes, {}
+            for callback in self.frame_changed_callbacks:
+                callback(frame_changes)
+
+
+def _count_trailing_sync_bytes(data: memoryview) -> int:
+    """
+    Count consecutive sync bytes (0x55) at the end of data.
+
+    :param data: bytes to check
+    :return: number of sync bytes
+    """
+    count = 0
+    for int_byte in reversed(data):
+        if int_byte != 0x55:
+            break
+        count += 1
+    return count
 
 
 class StringBuffer:
     """String buffer for DCS-BIOS protocol."""
-    def __init__(self, parser: ProtocolParser, address: int, max_length: int, callback: Callable) -> None:
+    def __init__(self, parser: ProtocolParser, address: int, max_length: int, callback: Optional[Callable] = None, ctrl_name: str = '') -> None:
         """
         Initialize instance.
 
+        When ctrl_name is set, changes are also collected by parser for frame changed callbacks.
         :param parser:
         :param address:
         :param max_length:
         :param callback:
+        :param ctrl_name: name of DCS-BIOS control
         """
+        self.__parser = parser
         self.__address = address
         self.__length = max_length
         self.__dirty = False
+        self.ctrl_name = ctrl_name
         self.buffer = bytearray(max_length)
         self.callbacks: Set[Callable] = set()
-        self.callbacks.add(callback)
-        parser.write_callbacks.add(partial(self.on_dcsbios_write))
+        if callback:
+            self.callbacks.add(callback)
+        write_callback = partial(self.on_dcsbios_write)
+        self.subscriptions = [
+            parser.add_address_callback(write_callback, address=address, length=max_length),
+            parser.add_address_callback(write_callback, address=0xfffe),
+        ]
 
     def set_char(self, index, char) -> None:
         """
@@ -151,6 +339,11 @@ class StringBuffer:
             self.buffer[index] = char
             self.__dirty = True
 
+    def unsubscribe(self) -> None:
+        """Detach buffer from parser."""
+        for subscription in self.subscriptions:
+            subscription.unsubscribe()
+
     def on_dcsbios_write(self, address: int, data: int) -> None:
         """
         Set callback function.
@@ -169,27 +362,39 @@ class StringBuffer:
             str_buff = self.buffer.split(sep=b'\x00', maxsplit=1)[0].decode('latin-1')
             for callback in self.callbacks:
                 callback(str_buff)
+            if self.ctrl_name:
+                self.__parser.add_frame_change(self.ctrl_name, str_buff)
 
 
 class IntegerBuffer:
     """Integer buffer for DCS-BIOS protocol."""
-    def __init__(self, parser: ProtocolParser, address: int, mask: int, shift_by: int, callback: Callable) -> None:
+    def __init__(self, parser: ProtocolParser, address: int, mask: int, shift_by: int, callback: Optional[Callable] = None, ctrl_name: str = '') -> None:
         """
         Initialize instance.
 
+        When ctrl_name is set, changes are also collected by parser for frame changed callbacks.
         :param parser:
         :param address:
         :param mask:
         :param shift_by:
         :param callback:
+        :param ctrl_name: name of DCS-BIOS control
         """
+        self.__parser = parser
         self.__address = address
         self.__mask = mask
         self.__shift_by = shift_by
         self.__value = int()
+        self.ctrl_name = ctrl_name
         self.callbacks: Set[Callable] = set()
-        self.callbacks.add(callback)
-        parser.write_callbacks.add(partial(self.on_dcsbios_write))
+        if callback:
+            self.callbacks.add(callback)
+        self.subscriptions = [parser.add_address_callback(partial(self.on_dcsbios_write), address=address)]
+
+    def unsubscribe(self) -> None:
+        """Detach buffer from parser."""
+        for subscription in self.subscriptions:
+            subscription.unsubscribe()
 
     def on_dcsbios_write(self, address: int, data: int) -> None:
         """
@@ -204,3 +409,371 @@ class IntegerBuffer:
                 self.__value = value
                 for callback in self.callbacks:
                     callback(value)
+                if self.ctrl_name:
+                    self.__parser.add_frame_change(self.ctrl_name, value)
+
+
+class ExportMemory:
+    """
+    Shadow copy of whole DCS-BIOS export memory.
+
+    Keep 64 KiB address space as NumPy array of 16-bit words. Each write block is copied with one slice
+    assignment and at frame sync all registered integer outputs are extracted at once and compared
+    with values from previous frame. It requires NumPy.
+    """
+    def __init__(self, parser: ProtocolParser) -> None:
+        """
+        Initialize instance and register it in parser.
+
+        :param parser: DCS-BIOS parser instance
+        :raise ImportError: when NumPy is not installed
+        """
+        if 'np' not in globals():
+            raise ImportError('NumPy is required for export memory')
+        self.__parser = parser
+        self.memory = np.zeros(EXPORT_MEMORY_WORDS, dtype=np.uint16)
+        self.dirty = np.zeros(EXPORT_MEMORY_WORDS, dtype=np.bool_)
+        self.callbacks: List[Optional[Callable]] = []
+        self.ctrl_names: List[str] = []
+        self._handles: List[object] = []
+        self._words = np.zeros(0, dtype=np.intp)
+        self._masks = np.zeros(0, dtype=np.uint16)
+        self._shifts = np.zeros(0, dtype=np.uint16)
+        self._values = np.zeros(0, dtype=np.uint16)
+        self.subscriptions = [
+            parser.add_callback(parser.block_callbacks, partial(self.on_dcsbios_block)),
+            parser.add_callback(parser.frame_sync_callbacks, partial(self.on_frame_sync)),
+        ]
+
+    def unsubscribe(self) -> None:
+        """Detach export memory from parser."""
+        for subscription in self.subscriptions:
+            subscription.unsubscribe()
+
+    def add_integer(self, address: int, mask: int, shift_by: int, callback: Optional[Callable] = None, ctrl_name: str = '') -> Subscription:
+        """
+        Register integer output, same way as IntegerBuffer.
+
+        :param address: address of output
+        :param mask: bit mask of output
+        :param shift_by: number of bits to shift
+        :param callback: called with new value
+        :param ctrl_name: name of DCS-BIOS control
+        :return: subscription handle
+        """
+        handle = object()
+        self._handles.append(handle)
+        self.callbacks.append(callback)
+        self.ctrl_names.append(ctrl_name)
+        self._words = np.append(self._words, address >> 1)
+        self._masks = np.append(self._masks, np.uint16(mask))
+        self._shifts = np.append(self._shifts, np.uint16(shift_by))
+        self._values = np.append(self._values, np.uint16(0))
+        return Subscription(unsubscribe=partial(self._remove_integer, handle))
+
+    def _remove_integer(self, handle: object) -> None:
+        """
+        Remove registered integer output.
+
+        :param handle: handle of output
+        """
+        idx = self._handles.index(handle)
+        del self._handles[idx]
+        del self.callbacks[idx]
+        del self.ctrl_names[idx]
+        self._words = np.delete(self._words, idx)
+        self._masks = np.delete(self._masks, idx)
+        self._shifts = np.delete(self._shifts, idx)
+        self._values = np.delete(self._values, idx)
+
+    def on_dcsbios_block(self, address: int, data: Union[bytes, memoryview]) -> None:
+        """
+        Copy whole write block into export memory.
+
+        :param address: address of first word
+        :param data: little-endian data words
+        """
+        start = address >> 1
+        words = np.frombuffer(data, dtype='<u2')[:EXPORT_MEMORY_WORDS - start]
+        self.memory[start:start + len(words)] = words
+        self.dirty[start:start + len(words)] = True
+
+    def on_frame_sync(self) -> None:
+        """Extract all registered integer outputs and call callbacks for changed ones."""
+        touched = self.dirty[self._words]
+        self.dirty[:] = False
+        if not touched.any():
+            return
+        values = (self.memory[self._words] & self._masks) >> self._shifts
+        changed = np.flatnonzero(touched & (values != self._values))
+        self._values = values
+        for idx in changed:
+            self._notify(idx=int(idx), value=int(values[idx]))
+
+    def _notify(self, idx: int, value: int) -> None:
+        """
+        Call callback and collect frame change for output.
+
+        :param idx: index of registered output
+        :param value: new value
+        """
+        callback = self.callbacks[idx]
+        if callback:
+            callback(value)
+        if self.ctrl_names[idx]:
+            self.__parser.add_frame_change(self.ctrl_names[idx], value)
+
+
+class RequestQueue:
+    """
+    Queue of DCS-BIOS requests waiting for sending, it is not thread-safe.
+
+    Multistep requests (separated with pipe) are queued as separate requests, each one with its own delay
+    after sending. Single SET_STATE request (control name and value) replace request for the same control,
+    which is still waiting in queue, so only the latest state is sent.
+    """
+    def __init__(self, delay: float = 0.05) -> None:
+        """
+        Initialize instance.
+
+        :param delay: default delay after each request in seconds
+        """
+        self.delay = delay
+        self.sent = 0
+        self.coalesced = 0
+        self.max_queue_depth = 0
+        self._queue: Deque[List] = deque()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get number of requests waiting in queue.
+
+        :return: number of requests
+        """
+        return len(self._queue)
+
+    def put(self, request: str, delay: Optional[float] = None) -> None:
+        """
+        Queue DCS-BIOS request.
+
+        :param request: DCS-BIOS request, steps separated with pipe
+        :param delay: delay after each step, default delay when None
+        """
+        delay = self.delay if delay is None else delay
+        steps = request.split('|')
+        match = SET_STATE_REQUEST.match(request) if len(steps) == 1 else None
+        ctrl_name = match.group(1) if match else ''
+        if ctrl_name and self._coalesce(ctrl_name=ctrl_name, request=request):
+            return
+        self._queue.extend([ctrl_name, step, delay] for step in steps)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+
+    def get(self) -> Tuple[str, float]:
+        """
+        Take the oldest request from queue.
+
+        :return: tuple with request and delay after sending it
+        """
+        _, request, delay = self._queue.popleft()
+        return request, delay
+
+    def close(self) -> None:
+        """Drop requests waiting in queue and log counters."""
+        self._queue.clear()
+        LOG.debug(f'Requests sent: {self.sent}, coalesced: {self.coalesced}, max queue depth: {self.max_queue_depth}')
+
+    def _coalesce(self, ctrl_name: str, request: str) -> bool:
+        """
+        Replace queued SET_STATE request for the same control.
+
+        :param ctrl_name: name of control
+        :param request: new DCS-BIOS request
+        :return: True if request was replaced
+        """
+        for entry in self._queue:
+            if entry[0] == ctrl_name:
+                LOG.debug(f'Request coalesced: {entry[1].strip()} -> {request.strip()}')
+                entry[1] = request
+                self.coalesced += 1
+                return True
+        return False
+
+
+class CommandScheduler(RequestQueue):
+    """
+    Send DCS-BIOS requests from dedicated worker thread.
+
+    Requests are queued and coalesced like in RequestQueue, worker thread sends them and waits delay after each one.
+    """
+    def __init__(self, sock: socket, address: Tuple[str, int], delay: float = 0.05) -> None:
+        """
+        Initialize instance and start worker thread.
+
+        :param sock: network socket
+        :param address: DCS-BIOS address for requests
+        :param delay: default delay after each request in seconds
+        """
+        super().__init__(delay=delay)
+        self.__sock = sock
+        self.__address = address
+        self._busy = False
+        self._condition = Condition()
+        self._stop = Event()
+        self._worker = Thread(target=self._run, name='dcspy-requests', daemon=True)
+        self._worker.start()
+
+    def schedule(self, request: str, delay: Optional[float] = None) -> None:
+        """
+        Queue DCS-BIOS request and wake up worker thread.
+
+        :param request: DCS-BIOS request, steps separated with pipe
+        :param delay: delay after each step, default delay when None
+        """
+        with self._condition:
+            self.put(request=request, delay=delay)
+            self._condition.notify()
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Wait till all queued requests are sent.
+
+        :param timeout: maximum time to wait in seconds
+        :return: True if queue is empty
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._busy, timeout=timeout)
+
+    def stop(self) -> None:
+        """Stop worker thread, requests waiting in queue are dropped."""
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        self._worker.join(timeout=1.0)
+        with self._condition:
+            self.close()
+
+    def _run(self) -> None:
+        """Send queued requests, wait delay after each one."""
+        while not self._stop.is_set():
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+                self._condition.wait_for(lambda: self._queue or self._stop.is_set())
+                if self._stop.is_set():
+                    return
+                request, delay = self.get()
+                self._busy = True
+            self.__sock.sendto(bytes(request, 'utf-8'), self.__address)
+            self.sent += 1
+            self._stop.wait(delay)
+
+
+class DatagramReceiver:
+    """
+    Receive DCS-BIOS datagrams from dedicated thread into bounded ring buffer.
+
+    Receiver thread only reads datagrams into preallocated slots, so socket is drained on time,
+    even when parsing and rendering are slow. Datagrams are parsed in place by consumer thread.
+    When all slots are occupied, datagram is dropped and counted as overflow.
+    """
+    def __init__(self, sock: socket, slots: int = 32, datagram_size: int = 0x10000) -> None:
+        """
+        Initialize instance and start receiver thread.
+
+        :param sock: multicast UDP socket with timeout
+        :param slots: maximum number of datagrams waiting for processing
+        :param datagram_size: size of single slot in bytes
+        """
+        self.__sock = sock
+        self.received = 0
+        self.overflows = 0
+        self.max_queue_depth = 0
+        buffer = memoryview(bytearray(slots * datagram_size))
+        self._slots = [buffer[idx * datagram_size:(idx + 1) * datagram_size] for idx in range(slots)]
+        self._sizes = [0] * slots
+        self._spare = memoryview(bytearray(datagram_size))
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+        self._condition = Condition()
+        self._stop = Event()
+        self._worker = Thread(target=self._run, name='dcspy-receiver', daemon=True)
+        self._worker.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get number of datagrams waiting for processing.
+
+        :return: number of datagrams
+        """
+        return self._count
+
+    def process(self, parser: ProtocolParser, timeout: float) -> int:
+        """
+        Parse all datagrams waiting in ring buffer.
+
+        :param parser: DCS protocol parser
+        :param timeout: maximum time to wait for first datagram in seconds
+        :return: number of processed datagrams
+        :raise TimeoutError: when there is no datagram within timeout
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._count, timeout=timeout):
+                raise TimeoutError('timed out')
+            pending = self._count
+        for _ in range(pending):
+            slot = self._tail
+            parser.process_bytes(self._slots[slot][:self._sizes[slot]])
+            with self._condition:
+                self._tail = (slot + 1) % len(self._slots)
+                self._count -= 1
+        return pending
+
+    def stop(self) -> None:
+        """Stop receiver thread, datagrams waiting in ring buffer are dropped."""
+        self._stop.set()
+        self._worker.join(timeout=1.0)
+        LOG.debug(f'Datagrams received: {self.received}, overflows: {self.overflows}, max queue depth: {self.max_queue_depth}')
+
+    def _run(self) -> None:
+        """Receive datagrams into free slots, drop them when ring buffer is full."""
+        while not self._stop.is_set():
+            with self._condition:
+                full = self._count == len(self._slots)
+            buffer = self._spare if full else self._slots[self._head]
+            try:
+                size = self.__sock.recv_into(buffer)
+            except socket_timeout:
+                continue
+            except OSError as exp:
+                LOG.debug(f'Receiver socket error: {exp}')
+                self._stop.wait(0.1)
+                continue
+            self._put(buffer=buffer, size=size)
+
+    def _put(self, buffer: memoryview, size: int) -> None:
+        """
+        Publish received datagram for processing.
+
+        Datagram received into spare buffer (ring buffer was full when waiting for it)
+        is copied into slot, if consumer freed one in meantime.
+        :param buffer: buffer with received datagram
+        :param size: size of datagram in bytes
+        """
+        with self._condition:
+            if self._count == len(self._slots):
+                self.overflows += 1
+                if self.overflows == 1:
+                    LOG.warning('Receive ring buffer overflow, DCS-BIOS datagrams are dropped')
+                return
+            slot = self._head
+            if buffer is self._spare:
+                self._slots[slot][:size] = buffer[:size]
+            self._sizes[slot] = size
+            self._head = (slot + 1) % len(self._slots)
+            self._count += 1
+            self.received += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._count)
+            self._condition.notify()
@@ -4,19 +4,20 @@ from logging import getLogger
 from pathlib import Path
 from pprint import pformat
 from socket import socket
-from time import sleep
-from typing import List, Sequence, Union
+from typing import List, Optional, Sequence
 
-from PIL import Image, ImageDraw
+from PIL import Image
 
 from dcspy import get_config_yaml_item
-from dcspy.aircraft import BasicAircraft, MetaAircraft
-from dcspy.dcsbios import ProtocolParser
-from dcspy.models import SEND_ADDR, SUPPORTED_CRAFTS, Gkey, KeyboardModel, LcdButton, LcdColor, LcdMono, ModelG13, ModelG15v1, ModelG15v2, ModelG19, ModelG510
+from dcspy.aircraft import AIRCRAFT_FONTS, TEXT_CACHE, AdvancedAircraft, BasicAircraft, MetaAircraft, RenderScheduler, RenderWorker, get_frame_pool, load_layout
+from dcspy.dcsbios import CommandScheduler, ExportMemory, ProtocolParser, Subscription
+from dcspy.models import (SEND_ADDR, SUPPORTED_CRAFTS, Gkey, KeyboardModel, LcdButton, LcdColor, LcdMono, ModelG13, ModelG15v1, ModelG15v2, ModelG19, ModelG510,
+                          preload_fonts)
 from dcspy.sdk import key_sdk, lcd_sdk
 from dcspy.utils import get_full_bios_for_plane, get_planes_list
 
 LOG = getLogger(__name__)
+REQUEST_DELAY = 0.05
 
 
 class KeyboardManager:
@@ -38,6 +39,10 @@ class KeyboardManager:
         - pass lcd_type argument as LcdInfo to super constructor
 
         :param parser: DCS-BIOS parser instance
+        :param export_memory: optional ExportMemory instance for integer outputs
+        :param render_max_fps: render image of advanced plane once per DCS-BIOS frame with maximum FPS (0 - no limit), None - at each change
+        :param render_worker: render image of advanced plane in dedicated thread from snapshot of BIOS data
+        :param frame_changes: set all values of advanced plane changed during DCS-BIOS frame at once, at frame sync
         """
         detect_plane = {'parser': parser, 'address': 0x0, 'max_length': 0x10, 'callback': partial(self.detecting_plane)}
         getattr(import_module('dcspy.dcsbios'), 'StringBuffer')(**detect_plane)
@@ -49,6 +54,7 @@ class KeyboardManager:
         self.gkey_pressed = False
         self._display: List[str] = []
         self.lcd = kwargs.get('lcd_type', LcdMono)
+        preload_fonts(AIRCRAFT_FONTS[self.lcd.type])
         self.model = KeyboardModel(name='', klass='', modes=0, gkeys=0, lcdkeys=(LcdButton.NONE,), lcd='mono')
         self.gkey: Sequence[Gkey] = ()
         self.buttons: Sequence[LcdButton] = ()
@@ -56,6 +62,12 @@ class KeyboardManager:
         key_sdk.logi_gkey_init()
         self.plane = BasicAircraft(self.lcd)
         self.vert_space = 0
+        self.export_memory: Optional[ExportMemory] = kwargs.get('export_memory')
+        self.plane_subscriptions: List[Subscription] = []
+        self.scheduler: Optional[CommandScheduler] = None
+        self.render_max_fps: Optional[float] = kwargs.get('render_max_fps')
+        self.render_worker: bool = kwargs.get('render_worker', False)
+        self.frame_changes: bool = kwargs.get('frame_changes', False)
 
     @property
     def display(self) -> List[str]:
@@ -116,13 +128,18 @@ class KeyboardManager:
         """
         Dynamic load of new detected aircraft.
 
-        Setup callbacks for detected plane inside DCS-BIOS parser.
+        Remove callbacks of previous plane and setup callbacks for detected plane inside DCS-BIOS parser.
         """
         self.plane_detected = False
+        self._remove_plane_callback()
         if self.plane_name in SUPPORTED_CRAFTS:
             self.plane = getattr(import_module('dcspy.aircraft'), self.plane_name)(self.lcd)
             LOG.debug(f'Dynamic load of: {self.plane_name} as AdvancedAircraft | BIOS: {self.plane.bios_name}')
             self._setup_plane_callback()
+        elif load_layout(self.bios_name):
+            self.plane = MetaAircraft(self.plane_name, (AdvancedAircraft,), {'bios_name': self.bios_name})(self.lcd)
+            LOG.debug(f'Dynamic load of: {self.plane_name} as AdvancedAircraft with layout | BIOS: {self.plane.bios_name}')
+            self._setup_plane_callback()
         else:
             self.plane = MetaAircraft(self.plane_name, (BasicAircraft,), {})(self.lcd)
             self.plane.bios_name = self.bios_name
@@ -131,11 +148,56 @@ class KeyboardManager:
 
     def _setup_plane_callback(self):
         """Setups DCS-BIOS parser callbacks for detected plane."""
-        plane_bios = get_full_bios_for_plane(plane=SUPPORTED_CRAFTS[self.plane_name]['bios'], bios_dir=Path(str(get_config_yaml_item('dcsbios'))))
+        plane_bios = get_full_bios_for_plane(plane=self.plane.bios_name, bios_dir=Path(str(get_config_yaml_item('dcsbios'))))
+        frame_changes = self.frame_changes and isinstance(self.plane, AdvancedAircraft)
         for ctrl_name in self.plane.bios_data:
             ctrl = plane_bios.get_ctrl(ctrl_name=ctrl_name)
-            dcsbios_buffer = getattr(import_module('dcspy.dcsbios'), ctrl.output.klass)
-            dcsbios_buffer(parser=self.parser, callback=partial(self.plane.set_bios, ctrl_name), **ctrl.output.args.model_dump())
+            if not ctrl:
+                LOG.warning(f'Control: {ctrl_name} not found in DCS-BIOS of: {self.plane.bios_name}')
+                continue
+            callback = None if frame_changes else partial(self.plane.set_bios, ctrl_name)
+            buffer_args = {'callback': callback, 'ctrl_name': ctrl_name, **ctrl.output.args.model_dump()}
+            if self.export_memory and ctrl.output.klass == 'IntegerBuffer':
+                self.plane_subscriptions.append(self.export_memory.add_integer(**buffer_args))
+            else:
+                dcsbios_buffer = getattr(import_module('dcspy.dcsbios'), ctrl.output.klass)
+                self.plane_subscriptions.extend(dcsbios_buffer(parser=self.parser, **buffer_args).subscriptions)
+        if frame_changes:
+            self.plane_subscriptions.append(self.parser.add_callback(self.parser.frame_changed_callbacks, partial(self.plane.set_frame_changes)))
+        self._setup_render_scheduler()
+        self._setup_render_worker()
+
+    def _setup_render_scheduler(self) -> None:
+        """Render image of advanced plane once per DCS-BIOS frame, when enabled."""
+        if not isinstance(self.plane, AdvancedAircraft) or self.render_max_fps is None:
+            return
+        scheduler = RenderScheduler(render=self.plane.update_display, max_fps=self.render_max_fps)
+        self.plane.render_scheduler = scheduler
+        self.plane_subscriptions.append(self.parser.add_callback(self.parser.frame_end_callbacks, partial(scheduler.on_frame_sync)))
+
+    def _setup_render_worker(self) -> None:
+        """Render image of advanced plane in dedicated thread, when enabled."""
+        if isinstance(self.plane, AdvancedAircraft) and self.render_worker:
+            self.plane.render_worker = RenderWorker(render=self.plane.render_snapshot)
+
+    def shutdown(self) -> None:
+        """Stop threads of current plane and remove its DCS-BIOS parser callbacks, when DCSpy is stopped."""
+        self._remove_plane_callback()
+
+    def _remove_plane_callback(self) -> None:
+        """Remove DCS-BIOS parser callbacks of previous plane and stop its render worker and screenshot recorder."""
+        scheduler = getattr(self.plane, 'render_scheduler', None)
+        if scheduler:
+            LOG.debug(f'{type(self.plane).__name__} renders: {scheduler.renders}, skipped: {scheduler.skipped}')
+        if isinstance(self.plane, AdvancedAircraft) and self.plane.render_worker:
+            self.plane.render_worker.stop()
+            self.plane.render_worker = None
+        if isinstance(self.plane, AdvancedAircraft) and self.plane.screenshot_recorder:
+            self.plane.screenshot_recorder.stop()
+            self.plane.screenshot_recorder = None
+        for subscription in self.plane_subscriptions:
+            subscription.unsubscribe()
+        self.plane_subscriptions.clear()
 
     def check_buttons(self) -> LcdButton:
         """
@@ -175,27 +237,30 @@ class KeyboardManager:
 
         * detect if button was pressed
         * fetch DCS-BIOS request from current plane
-        * sent action to DCS-BIOS via network socket
+        * queue action to be sent to DCS-BIOS via network socket
 
         :param sock: network socket
         """
-        button = self.check_buttons()
-        gkey = self.check_gkey()
-        if button.value:
-            self._send_request(button, sock)
-        if gkey:
-            self._send_request(gkey, sock)
+        if not self.scheduler:
+            self.scheduler = CommandScheduler(sock=sock, address=SEND_ADDR, delay=REQUEST_DELAY)
+        for request in self.get_requests():
+            self.scheduler.schedule(request)
 
-    def _send_request(self, button: Union[LcdButton, Gkey], sock) -> None:
+    def get_requests(self) -> List[str]:
         """
-        Sent action to DCS-BIOS via network socket.
+        Get DCS-BIOS requests for pressed LCD button and G-Key.
 
-        :param button: LcdButton or Gkey
-        :param sock: network socket
+        Steps of multistep request are separated with pipe.
+        :return: list of requests
         """
-        for request in self.plane.button_request(button).split('|'):
-            sock.sendto(bytes(request, 'utf-8'), SEND_ADDR)
-            sleep(0.05)
+        requests = []
+        button = self.check_buttons()
+        gkey = self.check_gkey()
+        if button.value:
+            requests.append(self.plane.button_request(button))
+        if gkey:
+            requests.append(self.plane.button_request(gkey))
+        return requests
 
     def clear(self, true_clear=False) -> None:
         """
@@ -214,10 +279,11 @@ class KeyboardManager:
         For G19 takes first 8 or fewer elements of list and display as 8 rows.
         :return: image instance ready display on LCD
         """
-        img = Image.new(mode=self.lcd.mode.value, size=(self.lcd.width, self.lcd.height), color=self.lcd.background)
-        draw = ImageDraw.Draw(img)
+        frame_pool = get_frame_pool(self.lcd)
+        img = frame_pool.next_frame()
+        draw = frame_pool.get_draw(img)
         for line_no, line in enumerate(self._display):
-            draw.text(xy=(0, self.vert_space * line_no), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
+            TEXT_CACHE.text(draw, xy=(0, self.vert_space * line_no), text=line, fill=self.lcd.foreground, font=self.lcd.font_s)
         return img
 
     def __str__(self) -> str:
@@ -237,7 +303,7 @@ class G13(KeyboardManager):
         :param parser: DCS-BIOS parser instance
         """
         LcdMono.set_fonts(kwargs['fonts'])
-        super().__init__(parser, lcd_type=LcdMono)
+        super().__init__(parser, lcd_type=LcdMono, **kwargs)
         self.model = ModelG13
         self.buttons = (LcdButton.ONE, LcdButton.TWO, LcdButton.THREE, LcdButton.FOUR)
         self.gkey = Gkey.generate(key=self.model.gkeys, mode=self.model.modes)
@@ -254,7 +320,7 @@ class G510(KeyboardManager):
         :param parser: DCS-BIOS parser instance
         """
         LcdMono.set_fonts(kwargs['fonts'])
-        super().__init__(parser, lcd_type=LcdMono)
+        super().__init__(parser, lcd_type=LcdMono, **kwargs)
         self.model = ModelG510
         self.buttons = (LcdButton.ONE, LcdButton.TWO, LcdButton.THREE, LcdButton.FOUR)
         self.gkey = Gkey.generate(key=self.model.gkeys, mode=self.model.modes)
@@ -271,7 +337,7 @@ class G15v1(KeyboardManager):
         :param parser: DCS-BIOS parser instance
         """
         LcdMono.set_fonts(kwargs['fonts'])
-        super().__init__(parser, lcd_type=LcdMono)
+        super().__init__(parser, lcd_type=LcdMono, **kwargs)
         self.model = ModelG15v1
         self.buttons = (LcdButton.ONE, LcdButton.TWO, LcdButton.THREE, LcdButton.FOUR)
         self.gkey = Gkey.generate(key=self.model.gkeys, mode=self.model.modes)
@@ -288,7 +354,7 @@ class G15v2(KeyboardManager):
         :param parser: DCS-BIOS parser instance
         """
         LcdMono.set_fonts(kwargs['fonts'])
-        super().__init__(parser, lcd_type=LcdMono)
+        super().__init__(parser, lcd_type=LcdMono, **kwargs)
         self.model = ModelG15v2
         self.buttons = (LcdButton.ONE, LcdButton.TWO, LcdButton.THREE, LcdButton.FOUR)
         self.gkey = Gkey.generate(key=self.model.gkeys, mode=self.model.modes)
@@ -305,7 +371,7 @@ class G19(KeyboardManager):
         :param parser: DCS-BIOS parser instance
         """
         LcdColor.set_fonts(kwargs['fonts'])
-        super().__init__(parser, lcd_type=LcdColor)
+        super().__init__(parser, lcd_type=LcdColor, **kwargs)
         self.model = ModelG19
         self.buttons = (LcdButton.LEFT, LcdButton.RIGHT, LcdButton.UP, LcdButton.DOWN, LcdButton.OK, LcdButton.CANCEL, LcdButton.MENU)
         self.gkey = Gkey.generate(key=self.model.gkeys, mode=self.model.modes)
@@ -1,13 +1,17 @@
 from enum import Enum
+from logging import getLogger
 from pathlib import Path
 from re import search
 from tempfile import gettempdir
-from typing import Any, Dict, Final, Iterator, List, Optional, Sequence, Tuple, Union
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Final, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from packaging import version
-from PIL import ImageFont
+from PIL import ImageDraw, ImageFont
 from pydantic import BaseModel, ConfigDict, RootModel, field_validator
 
+LOG = getLogger(__name__)
+
 # Network
 SEND_ADDR: Final = ('127.0.0.1', 7778)
 RECV_ADDR: Final = ('', 5010)
@@ -564,6 +568,55 @@ class FontsConfig(BaseModel):
     medium: int
     large: int
 
+    @property
+    def fonts(self) -> List[Tuple[str, int]]:
+        """
+        Get name and size of small, medium and large font.
+
+        :return: list of font name and size pairs
+        """
+        return [(self.name, self.small), (self.name, self.medium), (self.name, self.large)]
+
+
+FONTS: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+FONTS_LOCK = Lock()
+
+
+def get_font(name: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Get TrueType font, loaded only once per process for name and size.
+
+    :param name: font file name or path
+    :param size: font size in points
+    :return: font instance
+    """
+    key = (str(name), size)
+    with FONTS_LOCK:
+        if key not in FONTS:
+            FONTS[key] = ImageFont.truetype(key[0], size)
+        return FONTS[key]
+
+
+def preload_fonts(fonts: Iterable[Tuple[str, int]]) -> Thread:
+    """
+    Load fonts into registry from background thread.
+
+    :param fonts: font name and size pairs
+    :return: started thread
+    """
+    fonts_to_load = list(fonts)
+
+    def load() -> None:
+        for name, size in fonts_to_load:
+            try:
+                get_font(name=name, size=size)
+            except OSError as exp:
+                LOG.warning(f'Can not preload font: {name} size: {size}: {exp}')
+
+    thread = Thread(target=load, name='dcspy-fonts', daemon=True)
+    thread.start()
+    return thread
+
 
 class LcdInfo(BaseModel):
     """LCD info."""
@@ -585,9 +638,7 @@ class LcdInfo(BaseModel):
 
         :param fonts: fonts configuration
         """
-        self.font_xs = ImageFont.truetype(fonts.name, fonts.small)
-        self.font_s = ImageFont.truetype(fonts.name, fonts.medium)
-        self.font_l = ImageFont.truetype(fonts.name, fonts.large)
+        self.font_xs, self.font_s, self.font_l = (get_font(name=name, size=size) for name, size in fonts.fonts)
 
 
 LcdMono = LcdInfo(width=MONO_WIDTH, height=MONO_HEIGHT, type=LcdType.MONO, foreground=255,
@@ -596,6 +647,45 @@ LcdColor = LcdInfo(width=COLOR_WIDTH, height=COLOR_HEIGHT, type=LcdType.COLOR, f
                    background=(0, 0, 0, 0), mode=LcdMode.TRUE_COLOR)
 
 
+class LcdElement(BaseModel):
+    """Part of LCD image, which depends only on its DCS-BIOS selectors."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    bbox: Tuple[int, int, int, int]
+    selectors: FrozenSet[str]
+    draw: Callable[[ImageDraw.ImageDraw], None]
+
+    def intersects(self, bbox: Tuple[int, int, int, int]) -> bool:
+        """
+        Check if element overlaps with bounding box.
+
+        :param bbox: left, upper, right and lower (exclusive) pixel coordinate
+        :return: True if element overlaps with bounding box, False otherwise
+        """
+        left, upper, right, lower = self.bbox
+        return left < bbox[2] and bbox[0] < right and upper < bbox[3] and bbox[1] < lower
+
+
+class LayoutOp(BaseModel):
+    """Draw operation of LCD layout, with absolute coordinates and font for LCD type."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    kind: str
+    xy: Tuple[int, ...]
+    bbox: Tuple[int, int, int, int] = (0, 0, 0, 0)
+    selectors: FrozenSet[str] = frozenset()
+    text: str = ''
+    font: Optional[ImageFont.FreeTypeFont] = None
+    box: Tuple[int, int, int, int] = (0, 0, 0, 0)
+    width: int = 1
+
+
+class LayoutPlan(BaseModel):
+    """LCD layout compiled for LCD type: static operations and dynamic operations in drawing order."""
+    static: List[LayoutOp] = []
+    dynamic: List[LayoutOp] = []
+
+
 class KeyboardModel(BaseModel):
     """Light LCD keyboard model."""
     name: str
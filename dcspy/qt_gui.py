@@ -27,8 +27,8 @@ from PySide6.QtWidgets import (QButtonGroup, QCheckBox, QComboBox, QCompleter, Q
 
 from dcspy import default_yaml, qtgui_rc
 from dcspy.models import (CTRL_LIST_SEPARATOR, DCS_BIOS_REPO_DIR, DCS_BIOS_VER_FILE, DCSPY_REPO_NAME, KEYBOARD_TYPES, ControlKeyData, DcspyConfigYaml,
-                          FontsConfig, Gkey, GuiPlaneInputRequest, KeyboardModel, LcdButton, MsgBoxTypes, ReleaseInfo, SystemData)
-from dcspy.starter import dcspy_run
+                          FontsConfig, Gkey, GuiPlaneInputRequest, KeyboardModel, LcdButton, MsgBoxTypes, ReleaseInfo, SystemData, preload_fonts)
+from dcspy.starter import dcspy_run, dcspy_run_async
 from dcspy.utils import (CloneProgress, check_bios_ver, check_dcs_bios_entry, check_dcs_ver, check_github_repo, check_ver_at_github, collect_debug_data,
                          defaults_cfg, download_file, get_all_git_refs, get_inputs_for_plane, get_list_of_ctrls, get_plane_aliases, get_planes_list,
                          get_sha_for_current_git_ref, get_version_string, is_git_exec_present, is_git_object, load_yaml, proc_is_running, run_pip_command,
@@ -241,6 +241,7 @@ class DcsPyQtGui(QMainWindow):
         * Add correct numbers of rows and columns
         * enable DED font checkbox
         * updates font sliders (range and values)
+        * preload fonts of keyboard in background
         * update dock with image of keyboard
 
         :param keyboard: name
@@ -254,6 +255,8 @@ class DcsPyQtGui(QMainWindow):
             self.keyboard = getattr(import_module('dcspy.models'), f'Model{keyboard}')
             LOG.debug(f'Select: {self.keyboard}')
             self._set_ded_font_and_font_sliders()
+            if font_name := self.le_font_name.text():
+                preload_fonts(FontsConfig(name=font_name, **getattr(self, f'{self.keyboard.lcd}_font')).fonts)
             self._update_dock()
             self._load_table_gkeys()
 
@@ -1030,7 +1033,7 @@ class DcsPyQtGui(QMainWindow):
                 rb_key.setEnabled(False)
         fonts_cfg = FontsConfig(name=self.le_font_name.text(), **getattr(self, f'{self.keyboard.lcd}_font'))
         app_params = {'lcd_type': self.keyboard.klass, 'event': self.event, 'fonts_cfg': fonts_cfg}
-        app_thread = Thread(target=dcspy_run, kwargs=app_params)
+        app_thread = Thread(target=dcspy_run_async if self.config.get('async_runtime', False) else dcspy_run, kwargs=app_params)
         app_thread.name = 'dcspy-app'
         LOG.debug(f'Starting thread {app_thread} for: {app_params}')
         self.pb_start.setEnabled(False)
@@ -1087,8 +1090,9 @@ class DcsPyQtGui(QMainWindow):
             self._reset_defaults_cfg()
 
     def save_configuration(self) -> None:
-        """Save configuration from GUI."""
+        """Save configuration from GUI, keep options not available in GUI."""
         cfg = {
+            **self.config,
             'api_ver': __version__,
             'keyboard': self.keyboard.name,
             'autostart': self.cb_autostart.isChecked(),
@@ -0,0 +1,338 @@
+import struct
+import zlib
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from itertools import cycle
+from logging import getLogger
+from pathlib import Path
+from threading import Condition, Event, Thread
+from time import perf_counter, sleep
+from typing import BinaryIO, Callable, Deque, Final, Iterator, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from dcspy.models import NO_OF_LCD_SCREENSHOTS, TYPE_COLOR, TYPE_MONO, LcdMode
+
+LOG = getLogger(__name__)
+FRAMES_MAGIC: Final = b'DCSPYLCD'
+FRAMES_VERSION: Final = 1
+FRAMES_SUFFIX: Final = '.lcdlog'
+HEADER: Final = struct.Struct('<8sH')
+RECORD: Final = struct.Struct('<dHHBI')
+LCD_MODES: Final = tuple(mode.value for mode in LcdMode)
+Frame = Tuple[float, Image.Image]
+
+
+class FrameLogFormatError(Exception):
+    """Raised when file is not valid LCD frame log."""
+
+
+def write_frame(frame_file: BinaryIO, timestamp: float, img: Image.Image) -> int:
+    """
+    Append single LCD image to opened frame log.
+
+    Frame is saved as timestamp, size, mode and length of data, followed by raw bitmap
+    compressed with the fastest zlib level, LCD images are mostly background so they shrink a lot.
+    :param frame_file: file opened in binary mode, positioned after header
+    :param timestamp: time of frame in seconds
+    :param img: image instance
+    :return: number of written bytes
+    """
+    data = zlib.compress(img.tobytes(), 1)
+    frame_file.write(RECORD.pack(timestamp, img.width, img.height, LCD_MODES.index(img.mode), len(data)))
+    frame_file.write(data)
+    return RECORD.size + len(data)
+
+
+def write_header(frame_file: BinaryIO) -> None:
+    """
+    Write header (magic and version) of frame log.
+
+    :param frame_file: file opened in binary mode
+    """
+    frame_file.write(HEADER.pack(FRAMES_MAGIC, FRAMES_VERSION))
+
+
+def read_frames(file_path: Path) -> Iterator[Frame]:
+    """
+    Read LCD images with timestamps from frame log.
+
+    :param file_path: path of frame log
+    :return: iterator of pairs of timestamp and image
+    """
+    with open(file_path, 'rb') as frame_file:
+        magic, ver = HEADER.unpack(frame_file.read(HEADER.size).ljust(HEADER.size, b'\x00'))
+        if magic != FRAMES_MAGIC or ver != FRAMES_VERSION:
+            raise FrameLogFormatError(f'Not a LCD frame log: {file_path}')
+        while record := frame_file.read(RECORD.size):
+            if len(record) < RECORD.size:
+                raise FrameLogFormatError(f'Truncated record in: {file_path}')
+            timestamp, width, height, mode, length = RECORD.unpack(record)
+            try:
+                data = zlib.decompress(frame_file.read(length))
+                yield timestamp, Image.frombytes(mode=LCD_MODES[mode], size=(width, height), data=data)
+            except (IndexError, ValueError, zlib.error) as exp:
+                raise FrameLogFormatError(f'Corrupted frame in: {file_path}, {exp}') from exp
+
+
+def export_png(file_path: Path, directory: Path) -> int:
+    """
+    Export all frames of frame log as PNG files.
+
+    Files are named after frame log with number of frame, i.e. FA18Chornet_000.png.
+    :param file_path: path of frame log
+    :param directory: destination directory
+    :return: number of exported frames
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for count, (_, img) in enumerate(read_frames(file_path=file_path), start=1):
+        img.save(directory / f'{file_path.stem}_{count - 1:03}.png', 'PNG')
+    LOG.info(f'Exported {count} frames from: {file_path} to: {directory}')
+    return count
+
+
+def replay_frames(file_path: Path, show: Callable[[Image.Image], None], speed: float = 1.0) -> int:
+    """
+    Replay frames of frame log with original timing.
+
+    Speed 1.0 keeps original timing, 2.0 is two times faster, zero replay frames without any delay.
+    :param file_path: path of frame log
+    :param show: function showing image, i.e. send it to LCD
+    :param speed: replay speed factor
+    :return: number of replayed frames
+    """
+    start_time = perf_counter()
+    count = 0
+    for timestamp, img in read_frames(file_path=file_path):
+        if speed:
+            delay = start_time + timestamp / speed - perf_counter()
+            if delay > 0:
+                sleep(delay)
+        show(img)
+        count += 1
+    LOG.debug(f'Replayed {count} frames in {perf_counter() - start_time:.3f} s')
+    return count
+
+
+class ScreenshotRecorder:
+    """
+    Save LCD screenshots from dedicated thread.
+
+    Caller only copies image into bounded queue, PNG encoding or compression and disk writes are done
+    by writer thread. When queue is full, screenshot is dropped and counted. Screenshots are saved
+    round-robin as PNG files, or appended to frame log, which is rotated after maximum number of frames.
+    """
+    def __init__(self, name: str, directory: Path, frame_log: bool = False, queue_size: int = 16, max_frames: int = NO_OF_LCD_SCREENSHOTS) -> None:
+        """
+        Initialize instance and start writer thread.
+
+        :param name: prefix of file names, i.e. name of aircraft
+        :param directory: directory for screenshots
+        :param frame_log: append screenshots to frame log instead of PNG files
+        :param queue_size: maximum number of screenshots waiting for writer
+        :param max_frames: number of PNG files or frames in frame log before rotation
+        """
+        self.name = name
+        self.directory = directory
+        self.frame_log = frame_log
+        self.max_frames = max_frames
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self._png_numbers = cycle(range(max_frames))
+        self._queue: Deque[Frame] = deque()
+        self._queue_size = queue_size
+        self._log_file: Optional[BinaryIO] = None
+        self._log_frames = 0
+        self._start_time = perf_counter()
+        self._busy = False
+        self._condition = Condition()
+        self._stop = Event()
+        self._worker = Thread(target=self._run, name='dcspy-screenshot', daemon=True)
+        self._worker.start()
+
+    @property
+    def log_path(self) -> Path:
+        """
+        Get path of current frame log.
+
+        :return: path to file
+        """
+        return self.directory / f'{self.name}{FRAMES_SUFFIX}'
+
+    def record(self, img: Image.Image) -> None:
+        """
+        Put copy of image into queue for writer.
+
+        :param img: image instance, can be reused by caller as soon as record returns, ignored after stop
+        """
+        with self._condition:
+            if self._stop.is_set():
+                return
+            if len(self._queue) >= self._queue_size:
+                self.dropped += 1
+                if self.dropped == 1:
+                    LOG.warning('Screenshot queue is full, LCD screenshots are dropped')
+                return
+            self._queue.append((perf_counter() - self._start_time, img.copy()))
+            self.recorded += 1
+            self._condition.notify()
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Wait till all queued screenshots are written.
+
+        :param timeout: maximum time to wait in seconds
+        :return: True if nothing is waiting for writer
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._busy, timeout=timeout)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stop writer thread, screenshots still waiting in queue are written and frame log is closed by writer.
+
+        :param timeout: maximum time to wait for writer in seconds
+        """
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        self._worker.join(timeout=timeout)
+        if self._worker.is_alive():
+            LOG.warning(f'Screenshot writer still busy after {timeout} s, {len(self._queue)} screenshots waiting')
+        LOG.debug(f'Screenshots recorded: {self.recorded}, written: {self.written}, dropped: {self.dropped}')
+
+    def _run(self) -> None:
+        """Write queued screenshots, drain queue and close frame log before stop."""
+        try:
+            while True:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+                    self._condition.wait_for(lambda: self._queue or self._stop.is_set())
+                    if not self._queue:
+                        return
+                    timestamp, img = self._queue.popleft()
+                    self._busy = True
+                try:
+                    self._write(timestamp=timestamp, img=img)
+                    self.written += 1
+                except OSError as exp:
+                    LOG.warning(f'Can not save LCD screenshot: {exp}')
+        finally:
+            if self._log_file:
+                self._log_file.close()
+                self._log_file = None
+
+    def _write(self, timestamp: float, img: Image.Image) -> None:
+        """
+        Save screenshot as next PNG file or append it to frame log.
+
+        :param timestamp: time of screenshot in seconds from start of recorder
+        :param img: image instance
+        """
+        if not self.frame_log:
+            screen_shot_file = f'{self.name}_{next(self._png_numbers):03}.png'
+            img.save(self.directory / screen_shot_file, 'PNG')
+            LOG.debug(f'Save screenshot: {screen_shot_file}')
+            return
+        log_file = self._log_file if self._log_file and self._log_frames < self.max_frames else self._rotate_log()
+        write_frame(frame_file=log_file, timestamp=timestamp, img=img)
+        self._log_frames += 1
+
+    def _rotate_log(self) -> BinaryIO:
+        """
+        Start new frame log, previous one is kept with `.1` suffix.
+
+        :return: new frame log opened in binary mode
+        """
+        if self._log_file:
+            self._log_file.close()
+            self.log_path.replace(self.log_path.with_suffix(f'.1{FRAMES_SUFFIX}'))
+        self._log_file = open(self.log_path, 'wb')
+        write_header(frame_file=self._log_file)
+        self._log_frames = 0
+        return self._log_file
+
+
+def run(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Export or play LCD frame log from command line.
+
+    python -m dcspy.screenshot export FA18Chornet.lcdlog --out screenshots
+    python -m dcspy.screenshot play FA18Chornet.lcdlog --speed 2 --zoom 4
+    :param argv: command line arguments
+    """
+    arg_parser = ArgumentParser(prog='python -m dcspy.screenshot', description='Export and play LCD frame log.')
+    arg_parser.add_argument('mode', choices=['export', 'play'])
+    arg_parser.add_argument('file', type=Path, help='frame log file')
+    arg_parser.add_argument('--out', type=Path, default=Path('.'), help='destination directory of PNG files')
+    arg_parser.add_argument('--speed', type=float, default=1.0, help='replay speed factor, 0 - unthrottled')
+    arg_parser.add_argument('--zoom', type=int, default=2, help='zoom factor of replay window')
+    arg_parser.add_argument('--lcd', action='store_true', help='play on Logitech LCD instead of window')
+    args = arg_parser.parse_args(argv)
+    if args.mode == 'export':
+        export_png(file_path=args.file, directory=args.out)
+    elif args.lcd:
+        _play_on_lcd(args=args)
+    else:
+        _play_in_window(args=args)
+
+
+def _play_on_lcd(args: Namespace) -> None:
+    """
+    Play frame log on Logitech LCD.
+
+    :param args: parsed command line arguments
+    """
+    from dcspy.sdk import lcd_sdk
+
+    first = next(read_frames(file_path=args.file), None)
+    if not first:
+        LOG.warning(f'No frames to play in: {args.file}')
+        return
+    _, first_img = first
+    lcd_sdk.logi_lcd_init('DCSpy replay', TYPE_MONO if first_img.mode == LcdMode.BLACK_WHITE.value else TYPE_COLOR)
+    try:
+        replay_frames(file_path=args.file, show=lcd_sdk.push_display, speed=args.speed)
+    finally:
+        lcd_sdk.logi_lcd_shutdown()
+
+
+def _play_in_window(args: Namespace) -> None:
+    """
+    Play frame log in window with original timing.
+
+    :param args: parsed command line arguments
+    """
+    frames = list(read_frames(file_path=args.file))
+    if not frames:
+        LOG.warning(f'No frames to play in: {args.file}')
+        return
+
+    from PIL.ImageQt import ImageQt
+    from PySide6.QtCore import QTimer
+    from PySide6.QtGui import QPixmap
+    from PySide6.QtWidgets import QApplication, QLabel
+
+    app = QApplication([])
+    label = QLabel()
+    label.setWindowTitle(f'{args.file.name} - 0/{len(frames)}')
+    label.show()
+
+    def show_frame(idx: int) -> None:
+        timestamp, img = frames[idx]
+        zoomed = img.convert('RGBA').resize((img.width * args.zoom, img.height * args.zoom), Image.Resampling.NEAREST)
+        label.setPixmap(QPixmap.fromImage(ImageQt(zoomed)))
+        label.setWindowTitle(f'{args.file.name} - {idx + 1}/{len(frames)} - {timestamp:.3f} s')
+        if idx + 1 < len(frames):
+            delay = (frames[idx + 1][0] - timestamp) / args.speed if args.speed else 0
+            QTimer.singleShot(int(delay * 1000), lambda: show_frame(idx + 1))
+
+    show_frame(0)
+    app.exec()
+
+
+if __name__ == '__main__':
+    run()
@@ -1,5 +1,6 @@
 from logging import getLogger
-from typing import List, Tuple
+from threading import Condition, Event, Thread
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from _cffi_backend import Lib
 from cffi import FFI, CDefError
@@ -10,6 +11,9 @@ from dcspy.sdk import LcdDll, load_dll
 
 LOG = getLogger(__name__)
 LCD_DLL: Lib = load_dll(LcdDll)  # type: ignore[assignment]
+LAST_FRAMES: Dict[int, bytes] = {}
+MONO_THRESHOLD = [0] * 128 + [255] * 128
+SUPPRESSED_PUSHES = 0
 
 
 def logi_lcd_init(name: str, lcd_type: int) -> bool:
@@ -69,7 +73,20 @@ def logi_lcd_shutdown() -> None:
         pass
 
 
-def logi_lcd_mono_set_background(pixels: List[int]) -> bool:
+def _bitmap(pixels: Union[bytes, List[int]]):
+    """
+    Prepare C array of bytes for LCD SDK.
+
+    Bytes are passed without copy, list of integers is copied into new array.
+    :param pixels: bitmap as bytes or list of int
+    :return: C array of BYTE
+    """
+    if isinstance(pixels, (bytes, bytearray)):
+        return FFI().from_buffer('BYTE[]', pixels)
+    return FFI().new('BYTE[]', pixels)
+
+
+def logi_lcd_mono_set_background(pixels: Union[bytes, List[int]]) -> bool:
     """
     Set pixels as a rectangular area, 160 bytes wide and 43 bytes high.
 
@@ -79,11 +96,11 @@ def logi_lcd_mono_set_background(pixels: List[int]) -> bool:
     Note: The image size must be 160x43 in order to use this function. The SDK will turn on
     the pixel on the screen if the value assigned to that byte is >= 128, it will remain off
     if the  value is < 128.
-    :param pixels: list of 6880 (160x43) pixels as int
+    :param pixels: 6880 (160x43) pixels as bytes or list of int
     :return: result
     """
     try:
-        return LCD_DLL.LogiLcdMonoSetBackground(FFI().new('BYTE[]', pixels))  # type: ignore[attr-defined]
+        return LCD_DLL.LogiLcdMonoSetBackground(_bitmap(pixels))  # type: ignore[attr-defined]
     except (AttributeError, CDefError):  # we need catch error since BYTE[] is windows specific
         return False
 
@@ -102,19 +119,19 @@ def logi_lcd_mono_set_text(line_no: int, text: str) -> bool:
         return False
 
 
-def logi_lcd_color_set_background(pixels: List[Tuple[int, int, int, int]]) -> bool:
+def logi_lcd_color_set_background(pixels: Union[bytes, List[Tuple[int, int, int, int]]]) -> bool:
     """
     Set array of pixels as a rectangular area, 320 bytes wide and 240 bytes high.
 
     Since the color lcd can display the full RGB gamma, 32 bits per pixel (4 bytes) are used.
     The size of the colorBitmap array has to be 320x240x4 = 307200 therefore.
     Note: The image size must be 320x240 in order to use this function.
-    :param pixels: list of 307200 (320x240x4) pixels as int
+    :param pixels: 307200 (320x240x4) bytes or list of 76800 pixels as tuple of int
     :return: result
     """
-    img_bytes = [byte for pixel in pixels for byte in pixel]
+    img_bytes = pixels if isinstance(pixels, (bytes, bytearray)) else [byte for pixel in pixels for byte in pixel]
     try:
-        return LCD_DLL.LogiLcdColorSetBackground(FFI().new('BYTE[]', img_bytes))  # type: ignore[attr-defined]
+        return LCD_DLL.LogiLcdColorSetBackground(_bitmap(img_bytes))  # type: ignore[attr-defined]
     except (AttributeError, CDefError):  # we need catch error since BYTE[] is windows specific
         return False
 
@@ -172,20 +189,148 @@ def update_text(txt: List[str]) -> None:
         LOG.warning('LCD is not connected')
 
 
+class FrameMailbox:
+    """
+    Push images to LCD from dedicated thread with limited frame rate.
+
+    Images can be put at any rate, but only the newest one is kept. Image which is replaced
+    before it was pushed to LCD is counted as replaced. Images are copied into two buffers
+    owned by mailbox, so caller can reuse its image as soon as put returns.
+    """
+    def __init__(self, max_fps: float) -> None:
+        """
+        Initialize instance and start worker thread.
+
+        :param max_fps: maximum number of images pushed to LCD per second
+        """
+        self.interval = 1 / max_fps
+        self.pushed = 0
+        self.replaced = 0
+        self._pending = False
+        self._back: Optional[Image.Image] = None
+        self._front: Optional[Image.Image] = None
+        self._condition = Condition()
+        self._stop = Event()
+        self._worker = Thread(target=self._run, name='dcspy-lcd', daemon=True)
+        self._worker.start()
+
+    def put(self, image: Image.Image) -> None:
+        """
+        Replace image waiting for LCD.
+
+        :param image: image object from pillow library
+        """
+        with self._condition:
+            if self._pending:
+                self.replaced += 1
+            if self._back is None or self._back.mode != image.mode or self._back.size != image.size:
+                self._back = image.copy()
+            else:
+                self._back.paste(image)
+            self._pending = True
+            self._condition.notify()
+
+    def stop(self) -> None:
+        """Stop worker thread, image still waiting is pushed to LCD."""
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        self._worker.join(timeout=1.0)
+        if self._pending and self._back is not None:
+            self._pending = False
+            push_display(self._back)
+            self.pushed += 1
+        LOG.debug(f'Images pushed to LCD: {self.pushed}, replaced: {self.replaced}')
+
+    def _run(self) -> None:
+        """Push the newest image, wait frame interval after each one."""
+        while not self._stop.is_set():
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._stop.is_set())
+                if self._stop.is_set():
+                    return
+                self._front, self._back = self._back, self._front
+                self._pending = False
+                image = self._front
+            if image is not None:
+                push_display(image)
+                self.pushed += 1
+            self._stop.wait(self.interval)
+
+
+MAILBOX: Optional[FrameMailbox] = None
+
+
+def start_mailbox(max_fps: float) -> None:
+    """
+    Send images to LCD via frame mailbox with limited frame rate.
+
+    :param max_fps: maximum number of images pushed to LCD per second
+    """
+    global MAILBOX
+    stop_mailbox()
+    MAILBOX = FrameMailbox(max_fps=max_fps)
+
+
+def stop_mailbox() -> None:
+    """Stop frame mailbox, images are sent to LCD directly."""
+    global MAILBOX
+    if MAILBOX:
+        MAILBOX.stop()
+        MAILBOX = None
+
+
 def update_display(image: Image.Image) -> None:
     """
     Update display LCD with image.
 
+    When frame mailbox is started, image is only put into mailbox.
     :param image: image object from pillow library
     """
+    if MAILBOX:
+        MAILBOX.put(image)
+    else:
+        push_display(image)
+
+
+def push_display(image: Image.Image) -> None:
+    """
+    Push image to LCD.
+
+    Bitmap is prepared in bulk by Pillow and passed to SDK without per-pixel work.
+    Image identical to the last one pushed to the same type of LCD is skipped.
+    :param image: image object from pillow library
+    """
+    set_background: Callable[[bytes], bool]
     if logi_lcd_is_connected(TYPE_MONO):
-        logi_lcd_mono_set_background(list(image.getdata()))
-        logi_lcd_update()
+        lcd_type, set_background = TYPE_MONO, logi_lcd_mono_set_background
+        frame = image.convert('L').point(MONO_THRESHOLD).tobytes()
     elif logi_lcd_is_connected(TYPE_COLOR):
-        logi_lcd_color_set_background(list(image.getdata()))
-        logi_lcd_update()
+        lcd_type, set_background = TYPE_COLOR, logi_lcd_color_set_background
+        frame = image.tobytes() if image.mode == 'RGBA' else image.convert('RGBA').tobytes()
     else:
         LOG.warning('LCD is not connected')
+        return
+    if _is_same_frame(lcd_type=lcd_type, frame=frame):
+        return
+    set_background(frame)
+    logi_lcd_update()
+
+
+def _is_same_frame(lcd_type: int, frame: bytes) -> bool:
+    """
+    Check if bitmap is identical to the last one pushed to LCD and remember it.
+
+    :param lcd_type: type of LCD
+    :param frame: bitmap for LCD
+    :return: True if bitmap is the same
+    """
+    global SUPPRESSED_PUSHES
+    if LAST_FRAMES.get(lcd_type) == frame:
+        SUPPRESSED_PUSHES += 1
+        return True
+    LAST_FRAMES[lcd_type] = frame
+    return False
 
 
 def clear_display(true_clear=False) -> None:
@@ -194,6 +339,7 @@ def clear_display(true_clear=False) -> None:
 
     :param true_clear:
     """
+    LAST_FRAMES.clear()
     if logi_lcd_is_connected(TYPE_MONO):
         _clear_mono(true_clear)
     elif logi_lcd_is_connected(TYPE_COLOR):
@@ -1,24 +1,32 @@
+import asyncio
 import socket
 import struct
 from collections import deque
 from importlib import import_module
 from logging import getLogger
+from select import select
 from threading import Event
 from time import gmtime, time
-from typing import Iterator
+from typing import Iterator, Optional, Tuple
 
 from dcspy import get_config_yaml_item
-from dcspy.dcsbios import ProtocolParser
-from dcspy.logitech import KeyboardManager
-from dcspy.models import MULTICAST_IP, RECV_ADDR, FontsConfig
+from dcspy.dcsbios import DatagramReceiver, ExportMemory, ProtocolParser, RequestQueue
+from dcspy.logitech import REQUEST_DELAY, KeyboardManager
+from dcspy.models import MULTICAST_IP, RECV_ADDR, SEND_ADDR, FontsConfig
+from dcspy.sdk import lcd_sdk
 from dcspy.utils import check_bios_ver, get_version_string
 
 LOG = getLogger(__name__)
 LOOP_FLAG = True
+POLL_INTERVAL = 0.02
+DISCONNECT_TIMEOUT = 0.5
+DATAGRAM_SIZE = 0x10000
+MAX_DRAIN_DATAGRAMS = 64
 __version__ = '3.1.3'
 
 
-def _handle_connection(manager: KeyboardManager, parser: ProtocolParser, sock: socket.socket, ver_string: str, event: Event) -> None:
+def _handle_connection(manager: KeyboardManager, parser: ProtocolParser, sock: socket.socket, ver_string: str, event: Event,
+                       receiver: Optional[DatagramReceiver] = None) -> None:
     """
     Handle main loop where all the magic is happened.
 
@@ -27,15 +35,18 @@ def _handle_connection(manager: KeyboardManager, parser: ProtocolParser, sock: s
     :param sock: multicast UDP socket
     :param ver_string: current version to show
     :param event: stop event for main loop
+    :param receiver: datagram receiver thread, when None datagrams are received in main loop
     """
     start_time = time()
     LOG.info('Waiting for DCS connection...')
     support_banner = _supporters(text='Huge thanks to: Alexander Leschanz, Sireyn, Nick Thain, BrotherBloat and others! For support and help! ', width=26)
+    recv_buffer = memoryview(bytearray(DATAGRAM_SIZE))
     while not event.is_set():
         try:
-            dcs_bios_resp = sock.recv(2048)
-            for int_byte in dcs_bios_resp:
-                parser.process_byte(int_byte)
+            if receiver:
+                receiver.process(parser=parser, timeout=DISCONNECT_TIMEOUT)
+            else:
+                _receive_datagrams(parser=parser, sock=sock, recv_buffer=recv_buffer)
             start_time = time()
             _load_new_plane_if_detected(manager)
             manager.button_handle(sock)
@@ -43,6 +54,26 @@ def _handle_connection(manager: KeyboardManager, parser: ProtocolParser, sock: s
             _sock_err_handler(manager, start_time, ver_string, support_banner, exp)
 
 
+def _receive_datagrams(parser: ProtocolParser, sock: socket.socket, recv_buffer: memoryview) -> int:
+    """
+    Receive datagram and drain all datagrams already queued in socket.
+
+    Datagrams are received into preallocated buffer and parsed in place. First one is awaited
+    with socket timeout, next ones only when are ready, but no more than MAX_DRAIN_DATAGRAMS.
+    :param parser: DCS protocol parser
+    :param sock: multicast UDP socket
+    :param recv_buffer: reusable receive buffer
+    :return: number of received datagrams
+    """
+    count = 0
+    while True:
+        size = sock.recv_into(recv_buffer)
+        parser.process_bytes(recv_buffer[:size])
+        count += 1
+        if count >= MAX_DRAIN_DATAGRAMS or not select([sock], [], [], 0)[0]:
+            return count
+
+
 def _load_new_plane_if_detected(manager: KeyboardManager) -> None:
     """
     Load instance when new plane detected.
@@ -89,14 +120,17 @@ def _sock_err_handler(manager: KeyboardManager, start_time: float, ver_string: s
                        ver_string]
 
 
-def _prepare_socket() -> socket.socket:
+def _prepare_socket(recv_buffer_size: int = 0) -> socket.socket:
     """
     Prepare multicast UDP socket for DCS-BIOS communication.
 
+    :param recv_buffer_size: size of socket receive buffer (SO_RCVBUF) in bytes, 0 - system default
     :return: socket object
     """
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if recv_buffer_size:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer_size)
     sock.bind(RECV_ADDR)
     mreq = struct.pack('=4sl', socket.inet_aton(MULTICAST_IP), socket.INADDR_ANY)
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
@@ -104,21 +138,205 @@ def _prepare_socket() -> socket.socket:
     return sock
 
 
-def dcspy_run(lcd_type: str, event: Event, fonts_cfg: FontsConfig) -> None:
+def _prepare_export_memory(parser: ProtocolParser) -> Optional[ExportMemory]:
     """
-    Real starting point of DCSpy.
+    Prepare NumPy shadow export memory when enabled in configuration.
+
+    :param parser: DCS-BIOS parser instance
+    :return: ExportMemory instance or None
+    """
+    if not get_config_yaml_item('export_memory', False):
+        return None
+    try:
+        return ExportMemory(parser=parser)
+    except ImportError as exp:
+        LOG.warning(f'Export memory is disabled: {exp}')
+        return None
+
+
+def _prepare_manager(lcd_type: str, fonts_cfg: FontsConfig) -> Tuple[KeyboardManager, ProtocolParser]:
+    """
+    Prepare DCS-BIOS parser and keyboard manager.
 
     :param lcd_type: LCD handling class as string
-    :param event: stop event for main loop
     :param fonts_cfg: fonts configuration for LCD
+    :return: tuple with keyboard manager and parser
     """
     parser = ProtocolParser()
-    manager: KeyboardManager = getattr(import_module('dcspy.logitech'), lcd_type)(parser=parser, fonts=fonts_cfg)
+    export_memory = _prepare_export_memory(parser)
+    render_max_fps = float(get_config_yaml_item('render_max_fps', 0)) if get_config_yaml_item('render_on_frame_sync', False) else None
+    manager: KeyboardManager = getattr(import_module('dcspy.logitech'), lcd_type)(parser=parser, fonts=fonts_cfg, export_memory=export_memory,
+                                                                                  render_max_fps=render_max_fps,
+                                                                                  render_worker=bool(get_config_yaml_item('render_worker', False)),
+                                                                                  frame_changes=bool(get_config_yaml_item('render_on_frame_change', False)))
     LOG.info(f'Loading: {str(manager)}')
     LOG.debug(f'Loading: {repr(manager)}')
-    dcs_sock = _prepare_socket()
+    lcd_max_fps = float(get_config_yaml_item(f'lcd_max_fps_{manager.lcd.type.name.lower()}', 0))
+    if lcd_max_fps:
+        lcd_sdk.start_mailbox(max_fps=lcd_max_fps)
+    return manager, parser
+
+
+def _show_stopped(manager: KeyboardManager, ver_string: str) -> None:
+    """
+    Show information about stopped DCSpy on LCD.
+
+    :param manager: type of Logitech keyboard with LCD
+    :param ver_string: current version to show
+    """
+    LOG.info('DCSpy stopped.')
+    manager.display = ['DCSpy stopped', '', f'DCSpy: {ver_string}', f'DCS-BIOS: {check_bios_ver(bios_path=str(get_config_yaml_item("dcsbios"))).ver}']
+    lcd_sdk.stop_mailbox()
+
+
+def dcspy_run(lcd_type: str, event: Event, fonts_cfg: FontsConfig) -> None:
+    """
+    Real starting point of DCSpy.
+
+    :param lcd_type: LCD handling class as string
+    :param event: stop event for main loop
+    :param fonts_cfg: fonts configuration for LCD
+    """
+    manager, parser = _prepare_manager(lcd_type=lcd_type, fonts_cfg=fonts_cfg)
+    dcs_sock = _prepare_socket(recv_buffer_size=int(get_config_yaml_item('recv_buffer_size', 0)))
     dcspy_ver = get_version_string(repo='emcek/dcspy', current_ver=__version__, check=get_config_yaml_item('check_ver'))
-    _handle_connection(manager=manager, parser=parser, sock=dcs_sock, ver_string=dcspy_ver, event=event)
+    recv_queue_size = int(get_config_yaml_item('recv_queue_size', 0))
+    receiver = DatagramReceiver(sock=dcs_sock, slots=recv_queue_size, datagram_size=DATAGRAM_SIZE) if recv_queue_size else None
+    _handle_connection(manager=manager, parser=parser, sock=dcs_sock, ver_string=dcspy_ver, event=event, receiver=receiver)
+    if receiver:
+        receiver.stop()
+    if manager.scheduler:
+        manager.scheduler.stop()
     dcs_sock.close()
-    LOG.info('DCSpy stopped.')
-    manager.display = ['DCSpy stopped', '', f'DCSpy: {dcspy_ver}', f'DCS-BIOS: {check_bios_ver(bios_path=str(get_config_yaml_item("dcsbios"))).ver}']
+    manager.shutdown()
+    _show_stopped(manager=manager, ver_string=dcspy_ver)
+
+
+class DcsBiosProtocol(asyncio.DatagramProtocol):
+    """Asyncio protocol for DCS-BIOS multicast stream."""
+    def __init__(self, manager: KeyboardManager, parser: ProtocolParser) -> None:
+        """
+        Initialize instance.
+
+        :param manager: type of Logitech keyboard with LCD
+        :param parser: DCS protocol parser
+        """
+        self.manager = manager
+        self.parser = parser
+        self.last_data = time()
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """
+        Parse received datagram and load new plane if detected.
+
+        :param data: datagram
+        :param addr: address of sender
+        """
+        self.parser.process_bytes(data)
+        self.last_data = time()
+        _load_new_plane_if_detected(self.manager)
+
+    def error_received(self, exc: Exception) -> None:
+        """
+        Log socket error.
+
+        :param exc: caught exception instance
+        """
+        LOG.debug(f'DCS-BIOS socket error: {exc}')
+
+
+async def _poll_buttons(manager: KeyboardManager, requests: RequestQueue, pending: asyncio.Event) -> None:
+    """
+    Periodically check LCD buttons and G-Keys and queue DCS-BIOS requests.
+
+    :param manager: type of Logitech keyboard with LCD
+    :param requests: queue of DCS-BIOS requests
+    :param pending: event set when requests are waiting in queue
+    """
+    while True:
+        for request in manager.get_requests():
+            requests.put(request)
+        if requests.queue_depth:
+            pending.set()
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+async def _send_requests(transport: asyncio.DatagramTransport, requests: RequestQueue, pending: asyncio.Event) -> None:
+    """
+    Send queued DCS-BIOS requests, keep delay between requests without blocking reception.
+
+    :param transport: datagram transport
+    :param requests: queue of DCS-BIOS requests
+    :param pending: event set when requests are waiting in queue
+    """
+    while True:
+        if not requests.queue_depth:
+            pending.clear()
+            await pending.wait()
+            continue
+        request, delay = requests.get()
+        transport.sendto(bytes(request, 'utf-8'), SEND_ADDR)
+        requests.sent += 1
+        await asyncio.sleep(delay)
+
+
+async def _disconnect_timer(manager: KeyboardManager, protocol: DcsBiosProtocol, ver_string: str) -> None:
+    """
+    Show basic data when there is no data from DCS.
+
+    :param manager: type of Logitech keyboard with LCD
+    :param protocol: DCS-BIOS protocol instance
+    :param ver_string: current version to show
+    """
+    support_banner = _supporters(text='Huge thanks to: Alexander Leschanz, Sireyn, Nick Thain, BrotherBloat and others! For support and help! ', width=26)
+    while True:
+        await asyncio.sleep(DISCONNECT_TIMEOUT)
+        if time() - protocol.last_data >= DISCONNECT_TIMEOUT:
+            _sock_err_handler(manager, protocol.last_data, ver_string, support_banner, TimeoutError('timed out'))
+
+
+async def _async_handle_connection(manager: KeyboardManager, parser: ProtocolParser, sock: socket.socket, ver_string: str, event: Event) -> None:
+    """
+    Handle main loop with asyncio tasks for reception, buttons, requests and disconnect timer.
+
+    :param manager: type of Logitech keyboard with LCD
+    :param parser: DCS protocol parser
+    :param sock: multicast UDP socket
+    :param ver_string: current version to show
+    :param event: stop event for main loop
+    """
+    LOG.info('Waiting for DCS connection...')
+    transport, protocol = await asyncio.get_running_loop().create_datagram_endpoint(lambda: DcsBiosProtocol(manager=manager, parser=parser), sock=sock)
+    requests = RequestQueue(delay=REQUEST_DELAY)
+    pending = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_poll_buttons(manager=manager, requests=requests, pending=pending)),
+        asyncio.create_task(_send_requests(transport=transport, requests=requests, pending=pending)),
+        asyncio.create_task(_disconnect_timer(manager=manager, protocol=protocol, ver_string=ver_string)),
+    ]
+    try:
+        while not event.is_set():
+            await asyncio.sleep(POLL_INTERVAL)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        requests.close()
+        transport.close()
+
+
+def dcspy_run_async(lcd_type: str, event: Event, fonts_cfg: FontsConfig) -> None:
+    """
+    Real starting point of DCSpy with single-threaded asyncio runtime.
+
+    Reception of DCS-BIOS data, polling of buttons and sending of requests do not block each other.
+    :param lcd_type: LCD handling class as string
+    :param event: stop event for main loop
+    :param fonts_cfg: fonts configuration for LCD
+    """
+    manager, parser = _prepare_manager(lcd_type=lcd_type, fonts_cfg=fonts_cfg)
+    dcspy_ver = get_version_string(repo='emcek/dcspy', current_ver=__version__, check=get_config_yaml_item('check_ver'))
+    dcs_sock = _prepare_socket(recv_buffer_size=int(get_config_yaml_item('recv_buffer_size', 0)))
+    asyncio.run(_async_handle_connection(manager=manager, parser=parser, sock=dcs_sock, ver_string=dcspy_ver, event=event))
+    manager.shutdown()
+    _show_stopped(manager=manager, ver_string=dcspy_ver)
@@ -0,0 +1,339 @@
+import socket
+import struct
+from argparse import ArgumentParser, Namespace
+from logging import getLogger
+from pathlib import Path
+from random import Random
+from string import ascii_uppercase, digits
+from threading import Event
+from time import perf_counter, sleep
+from typing import BinaryIO, Final, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from dcspy import get_config_yaml_item
+from dcspy.dcsbios import ProtocolParser
+from dcspy.models import RECV_ADDR, DcsBiosPlaneData, OutputInt, OutputStr
+from dcspy.utils import get_full_bios_for_plane
+
+LOG = getLogger(__name__)
+STREAM_MAGIC: Final = b'DCSBIOS\x00'
+STREAM_VERSION: Final = 1
+HEADER: Final = struct.Struct('<8sH')
+RECORD: Final = struct.Struct('<dH')
+LOOPBACK_ADDR: Final = ('127.0.0.1', RECV_ADDR[1])
+SYNC_BYTES: Final = b'\x55' * 4
+UPDATE_COUNTER_ADDR: Final = 0xfffe
+TEXT_CHARS: Final = ascii_uppercase.replace('U', '') + digits + ' -.'
+Datagram = Tuple[float, bytes]
+
+
+class StreamFormatError(Exception):
+    """Raised when file is not valid DCS-BIOS stream recording."""
+
+
+def write_stream(file_path: Path, datagrams: Iterable[Datagram]) -> int:
+    """
+    Save datagrams with timestamps to stream file.
+
+    File start with header (magic and version), then every datagram is saved as
+    timestamp in seconds from the beginning of recording, length and raw data.
+    :param file_path: path of stream file
+    :param datagrams: pairs of timestamp and datagram
+    :return: number of saved datagrams
+    """
+    with open(file_path, 'wb') as stream_file:
+        return _write_datagrams(stream_file=stream_file, datagrams=datagrams)
+
+
+def _write_datagrams(stream_file: BinaryIO, datagrams: Iterable[Datagram]) -> int:
+    """
+    Write header and datagrams to opened stream file.
+
+    :param stream_file: file opened in binary mode
+    :param datagrams: pairs of timestamp and datagram
+    :return: number of saved datagrams
+    """
+    stream_file.write(HEADER.pack(STREAM_MAGIC, STREAM_VERSION))
+    count = 0
+    for timestamp, data in datagrams:
+        stream_file.write(RECORD.pack(timestamp, len(data)))
+        stream_file.write(data)
+        count += 1
+    return count
+
+
+def read_stream(file_path: Path) -> Iterator[Datagram]:
+    """
+    Read datagrams with timestamps from stream file.
+
+    :param file_path: path of stream file
+    :return: iterator of pairs of timestamp and datagram
+    """
+    with open(file_path, 'rb') as stream_file:
+        magic, ver = HEADER.unpack(stream_file.read(HEADER.size).ljust(HEADER.size, b'\x00'))
+        if magic != STREAM_MAGIC or ver != STREAM_VERSION:
+            raise StreamFormatError(f'Not a DCS-BIOS stream file: {file_path}')
+        while record := stream_file.read(RECORD.size):
+            if len(record) < RECORD.size:
+                raise StreamFormatError(f'Truncated record in: {file_path}')
+            timestamp, length = RECORD.unpack(record)
+            data = stream_file.read(length)
+            if len(data) != length:
+                raise StreamFormatError(f'Truncated datagram in: {file_path}')
+            yield timestamp, data
+
+
+def receive_datagrams(sock: socket.socket, event: Event, duration: float = 0.0, max_count: int = 0) -> Iterator[Datagram]:
+    """
+    Receive datagrams from socket with timestamps relative to first one.
+
+    Stop when event is set, after duration in seconds or after max_count datagrams.
+    Zero means no limit.
+    :param sock: UDP socket
+    :param event: stop event
+    :param duration: maximum recording time in seconds
+    :param max_count: maximum number of datagrams
+    :return: iterator of pairs of timestamp and datagram
+    """
+    start_time = perf_counter()
+    count = 0
+    while not event.is_set() and (not max_count or count < max_count) and (not duration or perf_counter() - start_time < duration):
+        try:
+            data = sock.recv(65535)
+        except OSError as exp:
+            LOG.debug(f'Recording socket error: {exp}')
+            continue
+        if not count:
+            start_time = perf_counter()
+        yield perf_counter() - start_time, data
+        count += 1
+
+
+def record_stream(file_path: Path, sock: socket.socket, event: Event, duration: float = 0.0, max_count: int = 0) -> int:
+    """
+    Record DCS-BIOS stream from socket to file.
+
+    :param file_path: path of stream file
+    :param sock: UDP socket i.e. multicast DCS-BIOS socket
+    :param event: stop event
+    :param duration: maximum recording time in seconds, zero means no limit
+    :param max_count: maximum number of datagrams, zero means no limit
+    :return: number of saved datagrams
+    """
+    count = write_stream(file_path=file_path, datagrams=receive_datagrams(sock=sock, event=event, duration=duration, max_count=max_count))
+    LOG.info(f'Recorded {count} datagrams to: {file_path}')
+    return count
+
+
+def replay_stream(file_path: Path, parser: Optional[ProtocolParser] = None, sock: Optional[socket.socket] = None,
+                  address: Tuple[str, int] = LOOPBACK_ADDR, speed: float = 1.0) -> int:
+    """
+    Replay recorded DCS-BIOS stream into parser and/or onto UDP socket.
+
+    Speed 1.0 keeps original timing, 2.0 is two times faster, zero replay stream without any delay.
+    :param file_path: path of stream file
+    :param parser: DCS-BIOS parser instance
+    :param sock: UDP socket used to send datagrams
+    :param address: destination address of datagrams
+    :param speed: replay speed factor
+    :return: number of replayed datagrams
+    """
+    start_time = perf_counter()
+    count = 0
+    for timestamp, data in read_stream(file_path=file_path):
+        if speed:
+            _wait_until(deadline=start_time + timestamp / speed)
+        if parser:
+            parser.process_bytes(data)
+        if sock:
+            sock.sendto(data, address)
+        count += 1
+    LOG.debug(f'Replayed {count} datagrams in {perf_counter() - start_time:.3f} s')
+    return count
+
+
+def _wait_until(deadline: float) -> None:
+    """
+    Sleep till deadline.
+
+    :param deadline: value of perf_counter
+    """
+    delay = deadline - perf_counter()
+    if delay > 0:
+        sleep(delay)
+
+
+class StreamGenerator:
+    """
+    Synthetic DCS-BIOS stream generator driven by plane JSON definitions.
+
+    Keep own copy of export memory. First frame contains all integer and string outputs of plane,
+    every next frame changes random part of outputs (change_density). Each frame starts with sync bytes,
+    contains write blocks of changed addresses and ends with update counter at 0xfffe.
+    """
+    def __init__(self, plane_bios: DcsBiosPlaneData, change_density: float = 0.1, datagram_size: int = 2048, seed: Optional[int] = None) -> None:
+        """
+        Initialize instance.
+
+        :param plane_bios: full DCS-BIOS definition of plane
+        :param change_density: part of outputs changed in every frame, from 0.0 to 1.0
+        :param datagram_size: maximum size of datagram, bigger frames are split
+        :param seed: seed for random values, for repeatable streams
+        """
+        self.outputs: List[Union[OutputInt, OutputStr]] = [
+            output for controls in plane_bios.root.values() for ctrl in controls.values() for output in ctrl.outputs
+        ]
+        self.change_density = change_density
+        self.datagram_size = datagram_size
+        self.memory = bytearray(0x10000)
+        self.frame_counter = 0
+        self._random = Random(seed)
+        self._dirty: Set[int] = set()
+
+    @classmethod
+    def from_plane(cls, plane: str, bios_dir: Path, **kwargs) -> 'StreamGenerator':
+        """
+        Create generator for plane from DCS-BIOS directory.
+
+        :param plane: BIOS plane name
+        :param bios_dir: path to DCS-BIOS directory
+        :param kwargs: change_density, datagram_size and seed
+        :return: StreamGenerator instance
+        """
+        return cls(plane_bios=get_full_bios_for_plane(plane=plane, bios_dir=bios_dir), **kwargs)
+
+    def frame(self) -> bytes:
+        """
+        Generate next frame of stream.
+
+        :return: frame bytes
+        """
+        outputs = self.outputs
+        if self.frame_counter:
+            outputs = self._random.sample(self.outputs, k=round(len(self.outputs) * self.change_density))
+        for output in outputs:
+            self._change_output(output)
+        self.frame_counter += 1
+        self._set_word(address=UPDATE_COUNTER_ADDR, value=self.frame_counter & 0xffff)
+        frame = bytearray(SYNC_BYTES)
+        for address, data in self._dirty_blocks():
+            frame += struct.pack('<HH', address, len(data)) + data
+        return bytes(frame)
+
+    def datagrams(self, frames: int, rate: float = 30.0) -> Iterator[Datagram]:
+        """
+        Generate datagrams with timestamps for number of frames.
+
+        Output can be saved with write_stream or send directly to parser.
+        :param frames: number of frames
+        :param rate: frames per second
+        :return: iterator of pairs of timestamp and datagram
+        """
+        for frame_no in range(frames):
+            frame = self.frame()
+            for offset in range(0, len(frame), self.datagram_size):
+                yield frame_no / rate, frame[offset:offset + self.datagram_size]
+
+    def get_value(self, output: Union[OutputInt, OutputStr]) -> Union[int, str]:
+        """
+        Get current value of output, as it should be decoded by DCS-BIOS buffers.
+
+        :param output: integer or string output
+        :return: value of output
+        """
+        if isinstance(output, OutputInt):
+            word = int.from_bytes(self.memory[output.address:output.address + 2], 'little')
+            return (word & output.mask) >> output.shift_by
+        return self.memory[output.address:output.address + output.max_length].split(sep=b'\x00', maxsplit=1)[0].decode('latin-1')
+
+    def _change_output(self, output: Union[OutputInt, OutputStr]) -> None:
+        """
+        Write random value of output into memory.
+
+        :param output: integer or string output
+        """
+        if isinstance(output, OutputInt):
+            word = int.from_bytes(self.memory[output.address:output.address + 2], 'little')
+            value = self._random.randint(0, output.max_value) << output.shift_by
+            self._set_word(address=output.address, value=(word & ~output.mask & 0xffff) | (value & output.mask))
+        else:
+            text = ''.join(self._random.choices(TEXT_CHARS, k=output.max_length))
+            self.memory[output.address:output.address + output.max_length] = text.encode('latin-1')
+            self._dirty.update(range(output.address & ~1, output.address + output.max_length, 2))
+
+    def _set_word(self, address: int, value: int) -> None:
+        """
+        Set word in memory and mark it as changed.
+
+        :param address: address of word
+        :param value: 16-bit value
+        """
+        self.memory[address:address + 2] = value.to_bytes(2, 'little')
+        self._dirty.add(address)
+
+    def _dirty_blocks(self) -> Iterator[Tuple[int, bytes]]:
+        """
+        Merge changed words into continuous write blocks.
+
+        :return: iterator of pairs of start address and data
+        """
+        start = end = -1
+        for address in sorted(self._dirty):
+            if address != end:
+                if start >= 0:
+                    yield start, bytes(self.memory[start:end])
+                start = address
+            end = address + 2
+        if start >= 0:
+            yield start, bytes(self.memory[start:end])
+        self._dirty.clear()
+
+
+def run(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Record, replay or generate DCS-BIOS stream from command line.
+
+    python -m dcspy.stream record flight.dcsbios --duration 60
+    python -m dcspy.stream replay flight.dcsbios --speed 2
+    python -m dcspy.stream generate ka50.dcsbios --plane Ka-50 --frames 3000 --rate 60
+    :param argv: command line arguments
+    """
+    arg_parser = ArgumentParser(prog='python -m dcspy.stream', description='Record, replay and generate DCS-BIOS UDP stream.')
+    arg_parser.add_argument('mode', choices=['record', 'replay', 'generate'])
+    arg_parser.add_argument('file', type=Path, help='stream file')
+    arg_parser.add_argument('--duration', type=float, default=0.0, help='recording time in seconds, 0 - until Ctrl+C')
+    arg_parser.add_argument('--speed', type=float, default=1.0, help='replay speed factor, 0 - unthrottled')
+    arg_parser.add_argument('--plane', default='A-10C', help='BIOS plane name for generated stream')
+    arg_parser.add_argument('--bios_dir', type=Path, default=None, help='path to DCS-BIOS, default from configuration')
+    arg_parser.add_argument('--frames', type=int, default=1000, help='number of generated frames')
+    arg_parser.add_argument('--rate', type=float, default=30.0, help='generated frames per second')
+    arg_parser.add_argument('--density', type=float, default=0.1, help='part of outputs changed in every generated frame')
+    args = arg_parser.parse_args(argv)
+    if args.mode == 'record':
+        from dcspy.starter import _prepare_socket
+
+        with _prepare_socket() as sock:
+            try:
+                record_stream(file_path=args.file, sock=sock, event=Event(), duration=args.duration)
+            except KeyboardInterrupt:
+                pass
+    elif args.mode == 'replay':
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as sock:
+            replay_stream(file_path=args.file, sock=sock, speed=args.speed)
+    else:
+        _generate(args=args)
+
+
+def _generate(args: Namespace) -> None:
+    """
+    Generate synthetic stream file from command line arguments.
+
+    :param args: parsed command line arguments
+    """
+    bios_dir = args.bios_dir or Path(str(get_config_yaml_item('dcsbios')))
+    generator = StreamGenerator.from_plane(plane=args.plane, bios_dir=bios_dir, change_density=args.density)
+    count = write_stream(file_path=args.file, datagrams=generator.datagrams(frames=args.frames, rate=args.rate))
+    LOG.info(f'Generated {count} datagrams of {args.plane} to: {args.file}')
+
+
+if __name__ == '__main__':
+    run()
@@ -10,7 +10,9 @@ from os import environ, makedirs, walk
 from pathlib import Path
 from platform import python_implementation, python_version, uname
 from pprint import pformat
-from re import search, sub
+from re import Match
+from re import compile as re_compile
+from re import escape, search, sub
 from shutil import rmtree
 from subprocess import CalledProcessError, run
 from tempfile import gettempdir
@@ -573,9 +575,9 @@ def _get_yaml_files(config_file) -> Generator[Path, None, None]:
 
 def _get_png_files() -> Generator[Path, None, None]:
     """
-    Get path to png screenshots for all airplanes.
+    Get path to png screenshots and LCD frame logs for all airplanes.
 
-    :return: generator of path to png files
+    :return: generator of path to png and frame log files
     """
     aircrafts = ['FA18Chornet', 'Ka50', 'Ka503', 'Mi8MT', 'Mi24P', 'F16C50', 'F15ESE',
                  'AH64DBLKII', 'A10C', 'A10C2', 'F14A135GR', 'F14B', 'AV8BNA']
@@ -583,7 +585,7 @@ def _get_png_files() -> Generator[Path, None, None]:
         Path(dirpath) / filename
         for dirpath, _, filenames in walk(gettempdir())
         for filename in filenames
-        if any(True for aircraft in aircrafts if aircraft in filename and filename.endswith('png'))
+        if any(True for aircraft in aircrafts if aircraft in filename and filename.endswith(('png', 'lcdlog')))
     )
 
 
@@ -724,3 +726,87 @@ def replace_symbols(value: str, symbol_replacement: Sequence[Sequence[str]]) ->
     for original, replacement in symbol_replacement:
         value = value.replace(original, replacement)
     return value
+
+
+class SymbolTranslator:
+    """
+    Translate symbols in display strings with table compiled once.
+
+    Single characters are compiled into str.maketrans table and multi-character strings into one
+    alternation regex, both applied in single pass. Substitution patterns are precompiled and applied
+    one after another in order, as each of them can depend on result of previous one.
+    Results are memoised, so repeated lines are translated only once.
+    """
+    def __init__(self, symbol_replacement: Sequence[Sequence[str]] = (), symbol_substitution: Sequence[Sequence[str]] = (),
+                 cache_size: int = 512) -> None:
+        """
+        Compile translation table.
+
+        Replacements are applied before substitutions.
+        :param symbol_replacement: original symbols and their replacement strings
+        :param symbol_substitution: symbol patterns and their replacement templates
+        :param cache_size: maximum number of memoised results
+        """
+        self._table = str.maketrans({original: replacement for original, replacement in symbol_replacement if len(original) == 1})
+        self._strings = {original: replacement for original, replacement in symbol_replacement if len(original) > 1}
+        self._strings_regex = re_compile('|'.join(escape(original) for original in self._strings)) if self._strings else None
+        self._substitutions = [(re_compile(pattern), replacement) for pattern, replacement in symbol_substitution]
+        self.translate = lru_cache(maxsize=cache_size)(self._translate)
+
+    def _translate(self, value: str) -> str:
+        """
+        Translate symbols in string.
+
+        :param value: string to translate
+        :return: translated string
+        """
+        if self._strings_regex:
+            value = self._strings_regex.sub(self._replace_string, value)
+        value = value.translate(self._table)
+        for regex, replacement in self._substitutions:
+            value = regex.sub(replacement, value)
+        return value
+
+    def _replace_string(self, mat: Match) -> str:
+        """
+        Get replacement for matched multi-character string.
+
+        :param mat: match object
+        :return: replacement string
+        """
+        return self._strings[mat.group()]
+
+
+@lru_cache
+def compose_symbol_replacements(*tables: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Compose replacement tables, which are applied one after another, into single table.
+
+    Replacement of each single character is passed through all following tables, so translation with single table
+    gives the same result as with all tables in order. Only first table can contain multi-character symbols,
+    their replacements are translated by composed table itself.
+    :param tables: replacement tables with original symbols and their replacement strings
+    :return: composed replacement table
+    """
+    composed: Dict[str, str] = {}
+    for idx, table in enumerate(tables):
+        if idx and any(len(original) > 1 for original, _ in table):
+            raise ValueError('Only first replacement table can contain multi-character symbols')
+        translator = SymbolTranslator(symbol_replacement=table)
+        composed = {original: translator.translate(replacement) if len(original) == 1 else replacement for original, replacement in composed.items()}
+        for original, replacement in table:
+            composed.setdefault(original, replacement)
+    return tuple(composed.items())
+
+
+@lru_cache
+def get_symbol_translator(symbol_replacement: Tuple[Tuple[str, str], ...] = (),
+                          symbol_substitution: Tuple[Tuple[str, str], ...] = ()) -> SymbolTranslator:
+    """
+    Get symbol translator compiled once for replacement table.
+
+    :param symbol_replacement: original symbols and their replacement strings
+    :param symbol_substitution: symbol patterns and their replacement templates
+    :return: symbol translator instance
+    """
+    return SymbolTranslator(symbol_replacement=symbol_replacement, symbol_substitution=symbol_substitution)
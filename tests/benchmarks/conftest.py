@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+from time import perf_counter
+
+from pytest import fixture
+
+BASELINE = Path(__file__).resolve().with_name('baseline.json')
+
+
+def measure(func, repeat: int = 3, min_time: float = 0.2) -> float:
+    """
+    Measure number of function calls per second.
+
+    Function is called in loop for at least min_time, best of repeat runs is returned.
+
+    :param func: function without arguments
+    :param repeat: number of runs
+    :param min_time: minimum time of one run in seconds
+    :return: calls per second
+    """
+    best = 0.0
+    for _ in range(repeat):
+        calls = 0
+        start = perf_counter()
+        while (elapsed := perf_counter() - start) < min_time:
+            func()
+            calls += 1
+        best = max(best, calls / elapsed)
+    return best
+
+
+def calibration_loop() -> None:
+    """Fixed pure Python workload: integer arithmetic, dictionary access, string formatting and bytes slicing."""
+    data = {}
+    payload = bytes(range(256))
+    for idx in range(256):
+        data[idx & 0x3f] = f'{(idx << 8 | payload[idx]) & 0xffff:04x}'
+    ''.join(data.values()).upper()
+
+
+@fixture()
+def calibration() -> float:
+    """
+    Measure speed of host with calibration loop, right before each benchmark, so both see the same load of host.
+
+    :return: calibration loop calls per second
+    """
+    return measure(calibration_loop, repeat=5)
+
+
+@fixture(scope='session')
+def benchmark_results(pytestconfig):
+    """
+    Collect all benchmark results, save them as baseline with --benchmark_save.
+
+    :param pytestconfig:
+    :return: dict with results
+    """
+    results = {}
+    yield results
+    if pytestconfig.getoption('benchmark_save') and results:
+        baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+        BASELINE.write_text(json.dumps({**baseline, **results}, indent=2, sort_keys=True) + '\n')
+
+
+@fixture()
+def check_metric(pytestconfig, benchmark_results, calibration):
+    """
+    Compare metric, normalised against calibration loop measured in the same run, with baseline.
+
+    Throughput metrics (higher is better) are divided by calibration loop calls per second,
+    latency metrics are multiplied by it, so baseline holds ratios independent of speed of host.
+    Normalised throughput fails when is below baseline, normalised latency when is above.
+    Allowed regression is set with --benchmark_threshold.
+
+    :param pytestconfig:
+    :param benchmark_results: dict with results
+    :param calibration: calibration loop calls per second
+    :return: function to check metric
+    """
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    threshold = pytestconfig.getoption('benchmark_threshold')
+
+    def _check_metric(name: str, value: float, higher_is_better: bool = True) -> None:
+        normalised = value / calibration if higher_is_better else value * calibration
+        benchmark_results[name] = float(f'{normalised:.6g}')
+        print(f'\n{name}: {value:.6g} (normalised: {normalised:.6g})')
+        if name not in baseline:
+            return
+        if higher_is_better:
+            assert normalised >= baseline[name] * (1 - threshold), f'{name}: {normalised:.6g} regressed, baseline: {baseline[name]:.6g}'
+        else:
+            assert normalised <= baseline[name] * (1 + threshold), f'{name}: {normalised:.6g} regressed, baseline: {baseline[name]:.6g}'
+    return _check_metric
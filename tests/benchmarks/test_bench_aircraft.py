@@ -0,0 +1,14 @@
+from pytest import mark
+
+from tests.benchmarks.conftest import measure
+from tests.helpers import set_bios_during_test
+
+pytestmark = mark.benchmark
+
+
+@mark.parametrize('lcd', ['mono', 'color'])
+@mark.parametrize('model', ['FA18Chornet', 'F16C50', 'F15ESE', 'Ka50', 'Ka503', 'Mi8MT', 'Mi24P', 'AH64DBLKII', 'A10C', 'A10C2', 'F14B', 'F14A135GR', 'AV8BNA'])
+def test_prepare_image(model, lcd, check_metric, request):
+    plane = request.getfixturevalue(f'{model.lower()}_{lcd}')
+    set_bios_during_test(plane, request.getfixturevalue(f'{model.lower()}_{lcd}_bios'))
+    check_metric(name=f'{model}_{lcd}_images_per_s', value=measure(plane.prepare_image))
@@ -0,0 +1,48 @@
+from pytest import fixture, mark
+
+from tests.benchmarks.conftest import measure
+
+pytestmark = mark.benchmark
+
+
+@fixture()
+def ka50_stream(test_dcs_bios):
+    """
+    Synthetic stream of Ka-50 with 100 frames.
+
+    :param test_dcs_bios: path to DCS-BIOS
+    :return: stream bytes
+    """
+    from dcspy.stream import StreamGenerator
+
+    generator = StreamGenerator.from_plane(plane='Ka-50', bios_dir=test_dcs_bios, change_density=0.1, seed=5010)
+    return b''.join(datagram for _, datagram in generator.datagrams(frames=100))
+
+
+def test_parser_process_byte(ka50_stream, protocol_parser, check_metric):
+    def _process():
+        for int_byte in ka50_stream:
+            protocol_parser.process_byte(int_byte)
+
+    check_metric(name='parser_process_byte_bytes_per_s', value=measure(_process) * len(ka50_stream))
+
+
+def test_parser_process_bytes(ka50_stream, protocol_parser, check_metric):
+    check_metric(name='parser_process_bytes_bytes_per_s', value=measure(lambda: protocol_parser.process_bytes(ka50_stream)) * len(ka50_stream))
+
+
+@mark.parametrize('klass, args', [
+    ('StringBuffer', {'address': 0x1000, 'max_length': 16}),
+    ('IntegerBuffer', {'address': 0x1000, 'mask': 0x0f00, 'shift_by': 8}),
+], ids=['StringBuffer', 'IntegerBuffer'])
+def test_buffer_callbacks(klass, args, protocol_parser, check_metric):
+    from dcspy import dcsbios
+
+    buffer = getattr(dcsbios, klass)(parser=protocol_parser, callback=lambda value: value, **args)
+    writes = [(address, data) for data in range(0x0100, 0x1100, 0x0100) for address in (0x1000, 0x1002, 0xfffe)]
+
+    def _write():
+        for address, data in writes:
+            buffer.on_dcsbios_write(address=address, data=data)
+
+    check_metric(name=f'{klass}_callbacks_per_s', value=measure(_write) * len(writes))
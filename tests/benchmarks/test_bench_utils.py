@@ -0,0 +1,23 @@
+from time import perf_counter
+
+from pytest import mark
+
+from tests.benchmarks.conftest import measure
+
+pytestmark = mark.benchmark
+
+
+@mark.parametrize('function', ['get_full_bios_for_plane', 'get_inputs_for_plane'])
+def test_plane_bios_latency(function, test_dcs_bios, check_metric):
+    from dcspy import utils
+
+    func = getattr(utils, function)
+    cold = []
+    for _ in range(3):
+        utils.get_full_bios_for_plane.cache_clear()
+        func.cache_clear()
+        start = perf_counter()
+        func(plane='Ka-50', bios_dir=test_dcs_bios)
+        cold.append(perf_counter() - start)
+    check_metric(name=f'{function}_cold_s', value=min(cold), higher_is_better=False)
+    check_metric(name=f'{function}_warm_s', value=1 / measure(lambda: func(plane='Ka-50', bios_dir=test_dcs_bios)), higher_is_better=False)
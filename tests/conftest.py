@@ -1,7 +1,7 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from pytest import fixture
+from pytest import fixture, mark
 
 from dcspy import aircraft, logitech, models
 from dcspy.models import DEFAULT_FONT_NAME, FontsConfig
@@ -64,11 +64,29 @@ for keyboard_model in ['G13', 'G510', 'G15v1', 'G15v2', 'G19']:
 
 def pytest_addoption(parser) -> None:
     """
-    Register img_precision CLI argument.
+    Register img_precision and benchmark CLI arguments.
 
     :param parser:
     """
     parser.addoption('--img_precision', action='store',  type=int, default=0)
+    parser.addoption('--benchmark', action='store_true', default=False, help='run benchmarks from tests/benchmarks')
+    parser.addoption('--benchmark_threshold', action='store', type=float, default=0.25, help='allowed regression against baseline, 0.25 = 25%%')
+    parser.addoption('--benchmark_save', action='store_true', default=False, help='save benchmark results as new baseline')
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """
+    Skip benchmarks, unless --benchmark is used.
+
+    :param config:
+    :param items:
+    """
+    if config.getoption('benchmark'):
+        return
+    skip_benchmark = mark.skip(reason='use --benchmark to run')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 @fixture(scope='session')
@@ -1,4 +1,3 @@
-from pathlib import Path
 from sys import platform
 from unittest.mock import patch
 
@@ -61,6 +60,371 @@ def test_meta_plane(keyboard, plane_name, request):
     assert type(plane).__name__ == plane_name
 
 
+def test_render_scheduler_once_per_frame():
+    from unittest.mock import MagicMock
+
+    from dcspy.aircraft import RenderScheduler
+
+    render = MagicMock()
+    scheduler = RenderScheduler(render=render)
+    scheduler.on_frame_sync()
+    for _ in range(5):
+        scheduler.mark_dirty()
+    scheduler.on_frame_sync()
+    scheduler.on_frame_sync()
+    render.assert_called_once_with()
+    assert scheduler.renders == 1
+    assert scheduler.skipped == 4
+    assert scheduler.dirty is False
+
+
+def test_render_scheduler_max_fps():
+    from unittest.mock import MagicMock
+
+    from dcspy.aircraft import RenderScheduler
+
+    render = MagicMock()
+    scheduler = RenderScheduler(render=render, max_fps=0.5)
+    scheduler.mark_dirty()
+    scheduler.on_frame_sync()
+    scheduler.mark_dirty()
+    scheduler.on_frame_sync()
+    assert render.call_count == 1
+    assert scheduler.dirty is True
+
+
+@mark.parametrize('plane', ['f16c50_mono', 'f16c50_color'])
+def test_set_bios_with_render_scheduler(plane, request):
+    from dcspy.aircraft import RenderScheduler
+
+    aircraft = request.getfixturevalue(plane)
+    with patch.object(aircraft, 'update_display') as update_display:
+        aircraft.render_scheduler = RenderScheduler(render=aircraft.update_display)
+        for i in range(1, 6):
+            aircraft.set_bios(f'DED_LINE_{i}', f'LINE {i}')
+        update_display.assert_not_called()
+        aircraft.render_scheduler.on_frame_sync()
+    update_display.assert_called_once_with()
+    assert aircraft.render_scheduler.skipped == 4
+    assert aircraft.get_bios('DED_LINE_5') == 'LINE 5'
+
+
+@mark.parametrize('plane', ['f16c50_mono', 'f16c50_color'])
+def test_set_frame_changes_render_once(plane, request):
+    aircraft = request.getfixturevalue(plane)
+    with patch.object(aircraft, 'update_display') as update_display:
+        aircraft.set_frame_changes({'UNKNOWN_CTRL': 1})
+        update_display.assert_not_called()
+        aircraft.set_frame_changes({f'DED_LINE_{i}': f'LINE {i}o' for i in range(1, 6)})
+    update_display.assert_called_once_with()
+    assert aircraft._changed_selectors == {f'DED_LINE_{i}' for i in range(1, 6)}
+    assert aircraft.get_bios('DED_LINE_5') == 'LINE 5' + ('\u00b0' if aircraft.lcd.type.name == 'MONO' else '^')
+
+
+def test_render_worker_render_newest_snapshot():
+    from threading import Event
+
+    from dcspy.aircraft import RenderWorker
+
+    started, release, rendered = Event(), Event(), []
+
+    def render(snapshot, changed):
+        started.set()
+        release.wait(1)
+        rendered.append((dict(snapshot), changed))
+
+    worker = RenderWorker(render=render)
+    worker.publish(snapshot={'A': 1}, changed={'A'})
+    assert started.wait(1)
+    worker.publish(snapshot={'A': 2}, changed={'A'})
+    worker.publish(snapshot={'A': 2, 'B': 3}, changed={'B'})
+    release.set()
+    assert worker.flush()
+    worker.stop()
+    assert rendered == [({'A': 1}, {'A'}), ({'A': 2, 'B': 3}, {'A', 'B'})]
+    assert (worker.published, worker.renders, worker.dropped) == (3, 2, 1)
+    assert len(worker.latencies) == 2
+    assert all(latency >= 0 for latency in worker.latencies)
+
+
+def test_render_worker_survives_failed_render():
+    from dcspy.aircraft import RenderWorker
+
+    rendered = []
+
+    def render(snapshot, changed):
+        if snapshot['A'] == 1:
+            raise ValueError('broken image')
+        rendered.append(snapshot['A'])
+
+    worker = RenderWorker(render=render)
+    worker.publish(snapshot={'A': 1}, changed={'A'})
+    assert worker.flush()
+    worker.publish(snapshot={'A': 2}, changed={'A'})
+    assert worker.flush()
+    worker.stop()
+    assert rendered == [2]
+    assert (worker.published, worker.renders, worker.failed) == (2, 1, 1)
+
+
+@mark.parametrize('plane', ['f16c50_mono', 'fa18chornet_color'])
+def test_set_bios_with_render_worker(plane, request):
+    from threading import current_thread
+
+    from dcspy.aircraft import RenderWorker
+
+    aircraft = request.getfixturevalue(plane)
+    selector = next(iter(aircraft.bios_data))
+    aircraft.render_worker = RenderWorker(render=aircraft.render_snapshot)
+    rendered = []
+
+    def update_display(img):
+        rendered.append((current_thread().name, aircraft.get_bios(selector), img.mode))
+
+    with patch('dcspy.aircraft.lcd_sdk.update_display', side_effect=update_display):
+        aircraft.set_bios(selector, 'NEW VALUE')
+        assert aircraft.render_worker.flush()
+    aircraft.render_worker.stop()
+    assert rendered == [('dcspy-render', 'NEW VALUE', aircraft.lcd.mode.value)]
+    assert aircraft.get_bios(selector) == 'NEW VALUE'
+
+
+@mark.parametrize('lcd', ['LcdMono', 'LcdColor'])
+def test_frame_pool_reuse_and_clear(lcd):
+    from dcspy import models
+    from dcspy.aircraft import FramePool
+
+    lcd = getattr(models, lcd)
+    pool = FramePool(lcd=lcd, size=2)
+    first = pool.next_frame()
+    draw = pool.get_draw(first)
+    draw.rectangle(xy=(0, 0, 10, 10), fill=lcd.foreground)
+    second = pool.next_frame()
+    assert second is not first
+    assert pool.next_frame() is first
+    assert first.getbbox() is None
+    assert pool.get_draw(first) is draw
+    assert pool.get_draw(first.copy()) is not draw
+
+
+def test_frame_pool_per_thread():
+    from threading import Thread
+
+    from dcspy.aircraft import get_frame_pool
+    from dcspy.models import LcdMono
+
+    pools = []
+    worker = Thread(target=lambda: pools.extend([get_frame_pool(LcdMono), get_frame_pool(LcdMono)]))
+    worker.start()
+    worker.join()
+    assert pools[0] is pools[1]
+    assert pools[0] is not get_frame_pool(LcdMono)
+    assert not {id(frame) for frame in pools[0].frames} & {id(frame) for frame in get_frame_pool(LcdMono).frames}
+
+
+def test_prepare_image_from_frame_pool(f16c50_mono):
+    from dcspy.aircraft import get_frame_pool
+
+    pool = get_frame_pool(f16c50_mono.lcd)
+    assert pool is get_frame_pool(f16c50_mono.lcd)
+    images = [f16c50_mono.prepare_image() for _ in range(len(pool.frames))]
+    assert all(any(img is frame for frame in pool.frames) for img in images)
+
+
+@mark.parametrize('plane', ['ka50_mono', 'ka50_color', 'fa18chornet_mono', 'av8bna_color', 'f16c50_mono'])
+def test_static_layer_rendered_once(plane, request):
+    from dcspy import aircraft
+
+    plane = request.getfixturevalue(plane)
+    aircraft.STATIC_LAYERS.clear()
+    with patch.object(plane, '_draw_static_data', wraps=plane._draw_static_data) as draw_static:
+        static = plane._get_static_layer()
+        plane.prepare_image()
+        plane.prepare_image()
+    draw_static.assert_called_once()
+    assert len(aircraft.STATIC_LAYERS) == 1
+    assert plane._get_static_layer() is static
+    assert (static.getbbox() is None) is (type(plane) is aircraft.F16C50)
+
+
+@mark.parametrize('lcd', ['LcdMono', 'LcdColor'])
+def test_text_cache_same_as_draw_text(lcd):
+    from PIL import Image, ImageDraw
+
+    from dcspy import models
+    from dcspy.aircraft import TextCache
+
+    lcd = getattr(models, lcd)
+    cache = TextCache()
+    expected = Image.new(mode=lcd.mode.value, size=(lcd.width, lcd.height), color=lcd.background)
+    cached = expected.copy()
+    expected_draw, cached_draw = ImageDraw.Draw(expected), ImageDraw.Draw(cached)
+    for idx, text in enumerate(['COM1 124.250', 'g|ypQ 0123', 'COM1 124.250']):
+        expected_draw.text(xy=(3, idx * 10), text=text, fill=lcd.foreground, font=lcd.font_s)
+        cache.text(cached_draw, xy=(3, idx * 10), text=text, fill=lcd.foreground, font=lcd.font_s)
+    assert expected.tobytes() == cached.tobytes()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_text_cache_evict_least_recently_used():
+    from PIL import Image, ImageDraw
+
+    from dcspy.aircraft import TextCache
+    from dcspy.models import LcdMono
+
+    cache = TextCache(max_size=2)
+    draw = ImageDraw.Draw(Image.new(mode=LcdMono.mode.value, size=(LcdMono.width, LcdMono.height)))
+    for text in ['A', 'B', 'A', 'C', 'A', 'B']:
+        cache.text(draw, xy=(0, 0), text=text, fill=LcdMono.foreground, font=LcdMono.font_s)
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert [key[2] for key in cache._masks] == ['A', 'B']
+
+
+@mark.parametrize('plane', ['fa18chornet_mono', 'fa18chornet_color'])
+def test_dirty_regions_same_as_full_render(plane, request):
+    plane = request.getfixturevalue(plane)
+    dirty_plane = type(plane)(plane.lcd)
+    dirty_plane.cfg['render_dirty_regions'] = True
+    bios_pairs = [
+        ('UFC_COMM1_DISPLAY', '12'), ('UFC_SCRATCHPAD_NUMBER_DISPLAY', '123456789'), ('UFC_OPTION_DISPLAY_1', 'GPS'),
+        ('UFC_OPTION_CUEING_1', ':'), ('UFC_COMM2_DISPLAY', '~3'), ('IFEI_FUEL_UP', '10780T'), ('IFEI_FUEL_DOWN', '04200I'),
+        ('UFC_SCRATCHPAD_STRING_1_DISPLAY', 'gj'), ('UFC_COMM1_DISPLAY', ''), ('UFC_OPTION_DISPLAY_5', 'MAN'), ('HUD_ATT_SW', 1),
+    ]
+    for selector, value in bios_pairs:
+        with patch('dcspy.aircraft.lcd_sdk.update_display'):
+            plane.set_bios(selector, value)
+            dirty_plane.set_bios(selector, value)
+        assert plane.prepare_image().tobytes() == dirty_plane.prepare_image().tobytes(), selector
+
+
+def test_dirty_regions_redraw_only_changed_elements(fa18chornet_mono):
+    fa18chornet_mono.cfg['render_dirty_regions'] = True
+    frame = fa18chornet_mono.prepare_image()
+    elements = fa18chornet_mono.get_lcd_elements()
+    with patch.object(fa18chornet_mono, 'draw_for_lcd_mono') as draw_for_lcd, \
+            patch.object(elements[1], 'draw') as draw_comm1, \
+            patch.object(elements[-1], 'draw') as draw_fuel_up:
+        fa18chornet_mono.bios_data['HUD_ATT_SW'] = 1
+        fa18chornet_mono._changed_selectors.add('HUD_ATT_SW')
+        assert fa18chornet_mono.prepare_image() is frame
+        draw_comm1.assert_not_called()
+        fa18chornet_mono.bios_data['UFC_OPTION_DISPLAY_1'] = 'GPS'
+        fa18chornet_mono._changed_selectors.add('UFC_OPTION_DISPLAY_1')
+        assert fa18chornet_mono.prepare_image() is frame
+        draw_comm1.assert_not_called()
+        draw_fuel_up.assert_not_called()
+        fa18chornet_mono.bios_data['UFC_COMM1_DISPLAY'] = '12'
+        fa18chornet_mono._changed_selectors.add('UFC_COMM1_DISPLAY')
+        fa18chornet_mono.prepare_image()
+        draw_comm1.assert_called_once()
+    draw_for_lcd.assert_not_called()
+
+
+@mark.parametrize('lcd, scale', [('LcdMono', 1), ('LcdColor', 2)])
+def test_compile_layout(lcd, scale):
+    from dcspy import models
+    from dcspy.aircraft import compile_layout
+
+    lcd = getattr(models, lcd)
+    layout = {'elements': [
+        {'line': [0, 20, 115, 20]},
+        {'box': [0, 29, 20, 42]},
+        {'text': 'CH{CHANNEL}:{FREQ}', 'xy': [2, 29], 'font': 'medium'},
+        {'led': 'AP', 'selector': 'AP_LED', 'box': [10, 5, 24, 17], 'xy': [12, 6], 'font': 'small'},
+        {'text': '{FUEL}', 'xy': [36, 50], 'lcd': 'color'},
+        {'arc': [0, 0, 10, 10]},
+    ]}
+    plan = compile_layout(layout=layout, lcd=lcd)
+    assert [op.kind for op in plan.static] == ['line', 'box']
+    assert plan.static[1].box == (0, 29 * scale, 20 * scale, 42 * scale)
+    assert [op.selectors for op in plan.dynamic][:2] == [frozenset({'CHANNEL', 'FREQ'}), frozenset({'AP_LED'})]
+    assert len(plan.dynamic) == scale + 1
+    assert plan.dynamic[0].font is lcd.font_s
+    assert plan.dynamic[0].bbox[:3] == (2 * scale, 29 * scale, lcd.width)
+    assert plan.dynamic[1].bbox[:2] == (10 * scale, 5 * scale)
+    assert plan.dynamic[1].bbox[2:] >= (24 * scale + 1, 17 * scale + 1)
+
+
+def test_compile_layout_drops_unknown_selector():
+    from dcspy.aircraft import LOG, compile_layout
+    from dcspy.models import LcdMono
+
+    layout = {'elements': [
+        {'text': 'CH{CHANNEL}', 'xy': [2, 0]},
+        {'text': '{CHANEL}:{FREQ}', 'xy': [2, 10]},
+        {'led': 'AP', 'selector': 'AP_LDE', 'box': [100, 5, 114, 17], 'xy': [102, 6]},
+    ]}
+    with patch.object(LOG, 'warning') as warning:
+        plan = compile_layout(layout=layout, lcd=LcdMono, selectors=frozenset({'CHANNEL', 'FREQ', 'AP_LED'}))
+    assert [op.selectors for op in plan.dynamic] == [frozenset({'CHANNEL'})]
+    assert warning.call_count == 2
+    assert len(compile_layout(layout=layout, lcd=LcdMono).dynamic) == 3
+
+
+def test_aircraft_layout_with_unknown_selector(test_dcs_bios):
+    from dcspy import aircraft
+    from dcspy.models import LcdMono
+
+    layout = {'elements': [{'text': '{UFC_COMM1_DISPLAY}', 'xy': [2, 0]}, {'text': '{UFC_COMM_TYPO}', 'xy': [2, 10]}]}
+    with patch('dcspy.aircraft.load_layout', return_value=layout), \
+            patch('dcspy.aircraft.get_config_yaml_item', return_value=test_dcs_bios):
+        aircraft.LAYOUT_PLANS.clear()
+        plane = aircraft.FA18Chornet(LcdMono)
+    aircraft.LAYOUT_PLANS.clear()
+    assert plane.bios_data['UFC_COMM1_DISPLAY'] == ''
+    assert 'UFC_COMM_TYPO' not in plane.bios_data
+
+
+@mark.parametrize('lcd', ['LcdMono', 'LcdColor'])
+def test_aircraft_drawn_from_layout(lcd):
+    from dcspy import aircraft, models
+
+    lcd = getattr(models, lcd)
+    layout = {'elements': [
+        {'box': [0, 29, 20, 42]},
+        {'text': 'CH{CHANNEL}', 'xy': [2, 0]},
+        {'led': 'AP', 'selector': 'AP_LED', 'box': [100, 5, 114, 17], 'xy': [102, 6], 'font': 'small'},
+    ]}
+    with patch('dcspy.aircraft.load_layout', return_value=layout):
+        aircraft.LAYOUT_PLANS.clear()
+        plane = aircraft.MetaAircraft('TestLayout', (aircraft.AdvancedAircraft,), {'bios_name': 'TestLayout'})(lcd)
+        assert plane.bios_data == {'CHANNEL': '', 'AP_LED': 0}
+        plane.cfg['render_dirty_regions'] = True
+        empty = plane.prepare_image().copy()
+        with patch('dcspy.aircraft.lcd_sdk.update_display'):
+            plane.set_bios('AP_LED', 1)
+        led_on = plane.prepare_image().copy()
+        led_left = 100 * lcd.width // 160
+        assert empty.tobytes() != led_on.tobytes()
+        assert empty.crop((0, 0, led_left, lcd.height)).tobytes() == led_on.crop((0, 0, led_left, lcd.height)).tobytes()
+        with patch('dcspy.aircraft.lcd_sdk.update_display'):
+            plane.set_bios('CHANNEL', '12')
+        full_plane = aircraft.MetaAircraft('TestLayout', (aircraft.AdvancedAircraft,), {'bios_name': 'TestLayout'})(lcd)
+        full_plane.bios_data.update(plane.bios_data)
+        assert plane.prepare_image().tobytes() == full_plane.prepare_image().tobytes()
+    aircraft.LAYOUT_PLANS.clear()
+
+
+@mark.parametrize('plane', ['fa18chornet_mono', 'fa18chornet_color'])
+def test_aircraft_without_layout_file_stays_blank(plane, request):
+    from PIL import Image
+
+    from dcspy import aircraft
+
+    plane = request.getfixturevalue(plane)
+    with patch('dcspy.aircraft.load_layout', return_value={}), \
+            patch.object(aircraft.LOG, 'warning') as warning:
+        aircraft.LAYOUT_PLANS.clear()
+        aircraft.STATIC_LAYERS.clear()
+        blank_plane = type(plane)(plane.lcd)
+        blank = Image.new(mode=plane.lcd.mode.value, size=(plane.lcd.width, plane.lcd.height), color=plane.lcd.background)
+        assert blank_plane.prepare_image().tobytes() == blank.tobytes()
+        blank_plane.prepare_image()
+    warning.assert_called_once()
+    aircraft.LAYOUT_PLANS.clear()
+    aircraft.STATIC_LAYERS.clear()
+
+
 # <=><=><=><=><=> Button Requests <=><=><=><=><=>
 @mark.parametrize('plane, button, result', [
     ('fa18chornet_mono', LcdButton.NONE, '\n'),
@@ -279,6 +643,31 @@ def test_apache_mode_switch_idm_pre_for_apache(plane, bios_pairs, mode, request)
     assert plane.mode.name == mode
 
 
+@mark.parametrize('plane', ['f16c50_mono', 'f16c50_color'])
+@mark.parametrize('line', [
+    '  LAT *N 43o06.2\'*       @',
+    ' STPT a  5  AUTO  a@\x03\x82',
+    ' LIST @ a  @ A\x10\x04',
+    '  @ INS  08.0/ 6  1a ',
+    '1DEST 2BNGO 3VIP  RINTG  A\x10\x04',
+    'M1 :12   M4  : (6) 1234 \xff',
+    ' *HUD BLNK*  *CKPT BLNK* ',
+])
+def test_f16_single_translator_same_as_sequential_replace(plane, line, request):
+    from dcspy.aircraft import LcdType
+    from dcspy.utils import replace_symbols, substitute_symbols
+
+    plane = request.getfixturevalue(plane)
+    expected = replace_symbols(line, plane.COMMON_SYMBOLS_TO_REPLACE)
+    if expected and expected[-1] == '@':
+        expected = expected.replace('@', '')
+    if plane.lcd.type == LcdType.MONO:
+        expected = replace_symbols(expected, plane.MONO_SYMBOLS_TO_REPLACE)
+    else:
+        expected = substitute_symbols(replace_symbols(expected, plane.COLOR_SYMBOLS_TO_REPLACE), plane.COLOR_SYMBOLS_TO_SUBSTITUTE)
+    assert plane._clean_and_replace(line) == expected
+
+
 # <=><=><=><=><=> Prepare Image <=><=><=><=><=>
 @mark.parametrize('lcd', ['mono', 'color'])
 @mark.parametrize('model', all_plane_list)
@@ -294,14 +683,12 @@ def test_prepare_image_for_all_planes(model, lcd, resources, img_precision, requ
 
 
 @mark.parametrize('model', ['ah64dblkii_mono', 'ah64dblkii_color'], ids=['Mono LCD', 'Color LCD'])
-def test_prepare_image_for_apache_wca_mode(model, resources, img_precision, request):
-    from itertools import repeat
-    from tempfile import gettempdir
-
+def test_prepare_image_for_apache_wca_mode(model, resources, img_precision, tmp_path, request):
     from dcspy.aircraft import ApacheEufdMode
+    from dcspy.screenshot import ScreenshotRecorder
 
     apache = request.getfixturevalue(model)
-    apache._debug_img = repeat(999)
+    apache.screenshot_recorder = ScreenshotRecorder(name=type(apache).__name__, directory=tmp_path)
     bios_pairs = [
         ('PLT_EUFD_LINE1', 'LOW ROTOR RPM     |RECTIFIER 2 FAIL  |CHARGER           '),
         ('PLT_EUFD_LINE2', 'ENGINE 2 OUT      |GENERATOR 2 FAIL  |TAIL WHL LOCK SEL '),
@@ -313,7 +700,9 @@ def test_prepare_image_for_apache_wca_mode(model, resources, img_precision, requ
     apache.mode = ApacheEufdMode.WCA
     apache.cfg['save_lcd'] = True
     img = apache.prepare_image()
-    assert (Path(gettempdir()) / f'{type(apache).__name__}_999.png').exists()
+    assert apache.screenshot_recorder.flush()
+    apache.screenshot_recorder.stop()
+    assert (tmp_path / f'{type(apache).__name__}_000.png').exists()
     assert compare_images(img=img, file_path=resources / platform / f'{model}_wca_mode.png', precision=img_precision)
 
 
@@ -1,4 +1,7 @@
-from pytest import mark
+from time import sleep
+from unittest.mock import call, patch
+
+from pytest import mark, raises
 
 from dcspy.dcsbios import ParserState
 
@@ -147,3 +150,283 @@ def test_string_buffer_callback(protocol_parser):
     protocol_parser.data = 0x31
     protocol_parser.address = 0x1930
     protocol_parser.process_byte(0x0)
+
+
+DCS_BIOS_STREAM = bytes.fromhex(
+    '55555555'                      # sync
+    '0010' '0600' '414243444546'    # 0x1000: 'ABCDEF'
+    '2a19' '0200' '2709'            # 0x192a: 0x0927
+    '0020' '0800' '5555555555554100'  # 0x2000: data with sync sequence inside
+    'feff' '0200' '0100'            # 0xfffe: end of update
+    '55555555'                      # sync
+    '0010' '0200' '5a55'            # 0x1000: 'ZU'
+    'feff' '0200' '0200'            # 0xfffe: end of update
+)
+
+
+def _record_parser_callbacks(parser, records):
+    parser.write_callbacks.add(lambda addr, data: records.append((addr, data)))
+    parser.frame_sync_callbacks.add(lambda: records.append('sync'))
+
+
+@mark.parametrize('chunk_size', [1, 3, 7, 13, len(DCS_BIOS_STREAM)])
+def test_process_bytes_same_callbacks_as_process_byte(chunk_size):
+    from dcspy.dcsbios import ProtocolParser
+
+    byte_parser, byte_records = ProtocolParser(), []
+    bulk_parser, bulk_records = ProtocolParser(), []
+    _record_parser_callbacks(byte_parser, byte_records)
+    _record_parser_callbacks(bulk_parser, bulk_records)
+
+    for int_byte in DCS_BIOS_STREAM:
+        byte_parser.process_byte(int_byte)
+    for i in range(0, len(DCS_BIOS_STREAM), chunk_size):
+        bulk_parser.process_bytes(DCS_BIOS_STREAM[i:i + chunk_size])
+
+    assert bulk_records == byte_records
+    assert byte_records.count('sync') >= 2
+    for attr in ('state', 'sync_byte_count', 'address', 'count', 'data'):
+        assert getattr(bulk_parser, attr) == getattr(byte_parser, attr)
+
+
+def test_process_bytes_accept_memoryview(protocol_parser):
+    records = []
+    _record_parser_callbacks(protocol_parser, records)
+    protocol_parser.process_bytes(memoryview(bytearray(DCS_BIOS_STREAM[:20])))
+    assert records == ['sync', (0x1000, 0x4241), (0x1002, 0x4443), (0x1004, 0x4645), (0x192a, 0x0927)]
+    assert protocol_parser.state == ParserState.ADDRESS_LOW
+
+
+def test_address_callback_only_for_own_addresses(protocol_parser):
+    all_records, addr_records = [], []
+    protocol_parser.write_callbacks.add(lambda addr, data: all_records.append(addr))
+    protocol_parser.add_address_callback(lambda addr, data: addr_records.append((addr, data)), address=0x1002, length=4)
+    protocol_parser.process_bytes(DCS_BIOS_STREAM)
+    assert addr_records == [(0x1002, 0x4443), (0x1004, 0x4645)]
+    assert all_records.count(0x1000) == 2
+    assert 0xfffe in all_records
+
+
+def test_buffers_registered_in_address_index(protocol_parser):
+    from dcspy.dcsbios import IntegerBuffer, StringBuffer
+
+    StringBuffer(parser=protocol_parser, address=0x1000, max_length=6, callback=lambda x: x)
+    IntegerBuffer(parser=protocol_parser, address=0x192a, mask=0xffff, shift_by=0, callback=lambda x: x)
+    assert protocol_parser.write_callbacks == set()
+    assert sorted(protocol_parser.address_callbacks) == [0x1000, 0x1001, 0x1002, 0x1003, 0x1004, 0x1005, 0x192a, 0xfffe]
+
+
+def test_string_buffer_via_address_index(protocol_parser):
+    from dcspy.dcsbios import StringBuffer
+
+    values = []
+    StringBuffer(parser=protocol_parser, address=0x1000, max_length=6, callback=values.append)
+    protocol_parser.process_bytes(DCS_BIOS_STREAM[:20] + DCS_BIOS_STREAM[32:])
+    assert values == ['ABCDEF', 'ZUCDEF']
+
+
+def test_frame_changed_callback_once_per_frame(protocol_parser):
+    from dcspy.dcsbios import IntegerBuffer, StringBuffer
+
+    frames, values = [], []
+    protocol_parser.frame_changed_callbacks.add(frames.append)
+    StringBuffer(parser=protocol_parser, address=0x1000, max_length=6, ctrl_name='STR_CTRL')
+    IntegerBuffer(parser=protocol_parser, address=0x192a, mask=0x0f00, shift_by=8, callback=values.append, ctrl_name='INT_CTRL')
+    protocol_parser.process_bytes(DCS_BIOS_STREAM[:20] + DCS_BIOS_STREAM[32:] + b'\x55' * 4)
+    assert frames == [{'STR_CTRL': 'ABCDEF', 'INT_CTRL': 9}, {'STR_CTRL': 'ZUCDEF'}]
+    assert values == [9]
+    assert protocol_parser.frame_changes == {}
+
+
+def test_frame_changes_not_collected_without_callback(protocol_parser):
+    from dcspy.dcsbios import IntegerBuffer
+
+    IntegerBuffer(parser=protocol_parser, address=0x192a, mask=0xffff, shift_by=0, ctrl_name='INT_CTRL')
+    protocol_parser.process_bytes(DCS_BIOS_STREAM[:20])
+    assert protocol_parser.frame_changes == {}
+
+
+def test_export_memory_integer_outputs(protocol_parser):
+    from dcspy.dcsbios import ExportMemory
+
+    values, frames = [], []
+    protocol_parser.frame_changed_callbacks.add(frames.append)
+    export_memory = ExportMemory(parser=protocol_parser)
+    export_memory.add_integer(address=0x192a, mask=0x0f00, shift_by=8, callback=values.append, ctrl_name='INT_CTRL')
+    export_memory.add_integer(address=0x1002, mask=0xff00, shift_by=8, ctrl_name='CHR_CTRL')
+    protocol_parser.process_bytes(DCS_BIOS_STREAM[:20] + DCS_BIOS_STREAM[32:] + b'\x55' * 4)
+    assert values == [9]
+    assert frames == [{'INT_CTRL': 9, 'CHR_CTRL': 0x44}]
+    assert export_memory.memory[0x1000 >> 1] == 0x555a
+    assert not export_memory.dirty.any()
+
+
+def test_frame_end_callbacks_after_frame_sync_and_frame_changes(protocol_parser):
+    from dcspy.dcsbios import ExportMemory
+
+    records = []
+    protocol_parser.add_callback(protocol_parser.frame_end_callbacks, lambda: records.append('end'))
+    protocol_parser.add_callback(protocol_parser.frame_changed_callbacks, lambda changes: records.append(changes))
+    export_memory = ExportMemory(parser=protocol_parser)
+    export_memory.add_integer(address=0x192a, mask=0x0f00, shift_by=8, callback=records.append, ctrl_name='INT_CTRL')
+    protocol_parser.process_bytes(DCS_BIOS_STREAM[:20] + b'\x55' * 4)
+    assert records == ['end', 9, {'INT_CTRL': 9}, 'end']
+
+
+def test_export_memory_without_numpy(protocol_parser):
+    from dcspy import dcsbios
+
+    with patch.dict(dcsbios.__dict__), raises(ImportError, match='NumPy'):
+        del dcsbios.__dict__['np']
+        dcsbios.ExportMemory(parser=protocol_parser)
+    assert protocol_parser.block_callbacks == set()
+
+
+def test_export_memory_same_values_as_integer_buffer(protocol_parser):
+    from dcspy.dcsbios import ExportMemory, IntegerBuffer
+
+    buffer_values, memory_values = [], []
+    export_memory = ExportMemory(parser=protocol_parser)
+    for mask, shift_by in ((0x1, 0), (0x0f00, 8), (0xff00, 8)):
+        IntegerBuffer(parser=protocol_parser, address=0x1000, mask=mask, shift_by=shift_by, callback=lambda val, m=mask: buffer_values.append((m, val)))
+        export_memory.add_integer(address=0x1000, mask=mask, shift_by=shift_by, callback=lambda val, m=mask: memory_values.append((m, val)))
+    for int_byte in DCS_BIOS_STREAM + b'\x55' * 4:
+        protocol_parser.process_byte(int_byte)
+    assert sorted(memory_values) == sorted(buffer_values)
+
+
+def test_unsubscribe_buffers(protocol_parser):
+    from dcspy.dcsbios import IntegerBuffer, StringBuffer
+
+    values = []
+    str_buff = StringBuffer(parser=protocol_parser, address=0x1000, max_length=6, callback=values.append)
+    int_buff = IntegerBuffer(parser=protocol_parser, address=0x192a, mask=0xffff, shift_by=0, callback=values.append)
+    str_buff.unsubscribe()
+    int_buff.unsubscribe()
+    int_buff.unsubscribe()
+    protocol_parser.process_bytes(DCS_BIOS_STREAM)
+    assert protocol_parser.address_callbacks == {}
+    assert values == []
+
+
+def test_unsubscribe_keeps_other_callbacks(protocol_parser):
+    from dcspy.dcsbios import StringBuffer
+
+    old_values, new_values = [], []
+    old_buff = StringBuffer(parser=protocol_parser, address=0x1000, max_length=6, callback=old_values.append)
+    StringBuffer(parser=protocol_parser, address=0x1000, max_length=2, callback=new_values.append)
+    old_buff.unsubscribe()
+    protocol_parser.process_bytes(DCS_BIOS_STREAM[:20] + DCS_BIOS_STREAM[32:])
+    assert sorted(protocol_parser.address_callbacks) == [0x1000, 0x1001, 0xfffe]
+    assert old_values == []
+    assert new_values == ['AB', 'ZU']
+
+
+def test_export_memory_unsubscribe_integer(protocol_parser):
+    from dcspy.dcsbios import ExportMemory
+
+    values = []
+    export_memory = ExportMemory(parser=protocol_parser)
+    subscription = export_memory.add_integer(address=0x1002, mask=0xff00, shift_by=8, callback=values.append, ctrl_name='CHR_CTRL')
+    export_memory.add_integer(address=0x192a, mask=0x0f00, shift_by=8, callback=values.append, ctrl_name='INT_CTRL')
+    subscription.unsubscribe()
+    protocol_parser.process_bytes(DCS_BIOS_STREAM[:20] + b'\x55' * 4)
+    assert values == [9]
+    assert export_memory.ctrl_names == ['INT_CTRL']
+    export_memory.unsubscribe()
+    assert protocol_parser.block_callbacks == set()
+    assert protocol_parser.frame_sync_callbacks == set()
+
+
+def test_command_scheduler_multistep_request(sock):
+    from dcspy.dcsbios import CommandScheduler
+
+    scheduler = CommandScheduler(sock=sock, address=('127.0.0.1', 7778), delay=0.01)
+    scheduler.schedule('UFC_1 1\n|UFC_1 0\n')
+    scheduler.schedule('UFC_COMM1_CHANNEL_SELECT DEC\n', delay=0)
+    assert scheduler.flush()
+    scheduler.stop()
+    assert sock.sendto.call_args_list == [call(b'UFC_1 1\n', ('127.0.0.1', 7778)),
+                                          call(b'UFC_1 0\n', ('127.0.0.1', 7778)),
+                                          call(b'UFC_COMM1_CHANNEL_SELECT DEC\n', ('127.0.0.1', 7778))]
+    assert scheduler.sent == 3
+    assert scheduler.queue_depth == 0
+
+
+def test_request_queue_multistep_and_coalesce():
+    from dcspy.dcsbios import RequestQueue
+
+    requests = RequestQueue(delay=0.1)
+    requests.put('UFC_1 1\n|UFC_1 0\n', delay=0)
+    requests.put('HUD_ATT_SW 1\n')
+    requests.put('HUD_ATT_SW 2\n')
+    assert (requests.queue_depth, requests.max_queue_depth, requests.coalesced) == (3, 3, 1)
+    assert [requests.get() for _ in range(3)] == [('UFC_1 1\n', 0), ('UFC_1 0\n', 0), ('HUD_ATT_SW 2\n', 0.1)]
+    requests.put('HUD_ATT_SW 0\n')
+    requests.close()
+    assert requests.queue_depth == 0
+
+
+def test_command_scheduler_coalesce_set_state(sock):
+    from dcspy.dcsbios import CommandScheduler
+
+    scheduler = CommandScheduler(sock=sock, address=('127.0.0.1', 7778), delay=0.2)
+    scheduler.schedule('IFEI_DWN_BTN 1\n')
+    sleep(0.05)
+    for value in range(1, 4):
+        scheduler.schedule(f'UFC_COMM1_CHANNEL_SELECT {value}\n')
+    scheduler.schedule('IFEI_DWN_BTN 1\n|IFEI_DWN_BTN 0\n')
+    scheduler.schedule('UFC_COMM1_CHANNEL_SELECT 4\n')
+    assert scheduler.queue_depth == 3
+    assert scheduler.max_queue_depth == 3
+    assert scheduler.coalesced == 3
+    assert [request for _, request, _ in scheduler._queue] == ['UFC_COMM1_CHANNEL_SELECT 4\n', 'IFEI_DWN_BTN 1\n', 'IFEI_DWN_BTN 0\n']
+    scheduler.stop()
+    assert scheduler.queue_depth == 0
+    sock.sendto.assert_called_once_with(b'IFEI_DWN_BTN 1\n', ('127.0.0.1', 7778))
+
+
+def test_datagram_receiver_process(protocol_parser):
+    import socket
+
+    from dcspy.dcsbios import DatagramReceiver
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as recv_sock, socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as send_sock:
+        recv_sock.bind(('127.0.0.1', 0))
+        recv_sock.settimeout(0.1)
+        receiver = DatagramReceiver(sock=recv_sock, slots=4, datagram_size=64)
+        for counter in range(3):
+            send_sock.sendto(bytes.fromhex(f'55555555 feff 0200 0{counter}00'), recv_sock.getsockname())
+        sleep(0.1)
+        received = []
+        with patch.object(protocol_parser, 'process_bytes', side_effect=lambda data: received.append(bytes(data))):
+            assert receiver.process(parser=protocol_parser, timeout=0.5) == 3
+            with raises(TimeoutError):
+                receiver.process(parser=protocol_parser, timeout=0.05)
+        receiver.stop()
+    assert received == [bytes.fromhex(f'55555555 feff 0200 0{counter}00') for counter in range(3)]
+    assert receiver.received == 3
+    assert receiver.overflows == 0
+    assert receiver.max_queue_depth == 3
+    assert receiver.queue_depth == 0
+
+
+def test_datagram_receiver_overflow(protocol_parser):
+    import socket
+
+    from dcspy.dcsbios import DatagramReceiver
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as recv_sock, socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as send_sock:
+        recv_sock.bind(('127.0.0.1', 0))
+        recv_sock.settimeout(0.1)
+        receiver = DatagramReceiver(sock=recv_sock, slots=2, datagram_size=64)
+        for counter in range(5):
+            send_sock.sendto(bytes([counter]), recv_sock.getsockname())
+        sleep(0.1)
+        received = []
+        with patch.object(protocol_parser, 'process_bytes', side_effect=lambda data: received.append(bytes(data))):
+            assert receiver.process(parser=protocol_parser, timeout=0.5) == 2
+        receiver.stop()
+    assert received == [b'\x00', b'\x01']
+    assert receiver.overflows == 3
+    assert receiver.max_queue_depth == 2
@@ -31,20 +31,37 @@ def test_all_failure_cases(function, args, result):
     assert getattr(lcd_sdk, function)(*args) is result
 
 
-@mark.parametrize('c_func, effect, lcd, size', [
-    ('logi_lcd_mono_set_background', [True], 1, (16, 4)),
-    ('logi_lcd_color_set_background', [False, True], 2, (32, 24))
-], ids=['Mono', 'Color'])
-def test_update_display(c_func, effect, lcd, size):
+@mark.parametrize('c_func, effect, lcd, mode, color, size, bitmap', [
+    ('logi_lcd_mono_set_background', [True], 1, '1', 0, (16, 4), bytes(16 * 4)),
+    ('logi_lcd_mono_set_background', [True], 1, '1', 1, (16, 4), b'\xff' * 16 * 4),
+    ('logi_lcd_mono_set_background', [True], 1, 'L', 200, (16, 4), b'\xff' * 16 * 4),
+    ('logi_lcd_color_set_background', [False, True], 2, 'RGBA', (0, 255, 0, 255), (32, 24), b'\x00\xff\x00\xff' * 32 * 24)
+], ids=['Mono black', 'Mono white', 'Mono threshold', 'Color'])
+def test_update_display(c_func, effect, lcd, mode, color, size, bitmap):
     from PIL import Image
 
     from dcspy.sdk import lcd_sdk
+    lcd_sdk.LAST_FRAMES.clear()
     with patch.object(lcd_sdk, 'logi_lcd_is_connected', side_effect=effect) as connected, \
             patch.object(lcd_sdk, c_func, return_value=True) as set_background, \
             patch.object(lcd_sdk, 'logi_lcd_update', return_value=True):
-        lcd_sdk.update_display(Image.new('1', (size[0], size[1]), 0))
+        lcd_sdk.update_display(Image.new(mode, (size[0], size[1]), color))
         connected.assert_called_with(lcd)
-        set_background.assert_called_once_with([0] * size[0] * size[1])
+        set_background.assert_called_once_with(bitmap)
+
+
+@mark.parametrize('function, pixels', [
+    ('logi_lcd_mono_set_background', b'\x00\xff'),
+    ('logi_lcd_color_set_background', b'\x00\xff\x00\xff'),
+    ('logi_lcd_color_set_background', [(0, 255, 0, 255)]),
+], ids=['Mono bytes', 'Color bytes', 'Color list'])
+def test_set_background_bitmap(function, pixels):
+    from dcspy.sdk import lcd_sdk
+    with patch.object(lcd_sdk, 'LCD_DLL') as lcd_dll, \
+            patch.object(lcd_sdk, '_bitmap', return_value='bitmap') as bitmap:
+        assert getattr(lcd_sdk, function)(pixels)
+    bitmap.assert_called_once_with(pixels if isinstance(pixels, bytes) else [0, 255, 0, 255])
+    assert lcd_dll.method_calls[0].args == ('bitmap',)
 
 
 @mark.parametrize('c_func, effect, lcd, list_txt', [
@@ -92,3 +109,50 @@ def test_update_display_no_lcd():
     with patch.object(lcd_sdk, 'logi_lcd_is_connected', side_effect=[False, False]) as connected:
         lcd_sdk.update_display(Image.new('1', (16, 4), 0))
         connected.assert_has_calls([call(1), call(2)])
+
+
+def test_frame_mailbox_latest_frame_wins():
+    from time import sleep
+
+    from PIL import Image
+
+    from dcspy.sdk import lcd_sdk
+    image = Image.new('L', (16, 4), 0)
+    pushed = []
+    with patch.object(lcd_sdk, 'push_display', side_effect=lambda img: pushed.append(img.tobytes())):
+        lcd_sdk.start_mailbox(max_fps=5)
+        mailbox = lcd_sdk.MAILBOX
+        lcd_sdk.update_display(image)
+        sleep(0.05)
+        for color in range(1, 4):
+            image.paste(color, (0, 0, 16, 4))
+            lcd_sdk.update_display(image)
+        image.paste(255, (0, 0, 16, 4))
+        lcd_sdk.stop_mailbox()
+    assert lcd_sdk.MAILBOX is None
+    assert pushed == [bytes([0] * 64), bytes([3] * 64)]
+    assert mailbox.pushed == 2
+    assert mailbox.replaced == 2
+
+
+@mark.parametrize('c_func, effect', [
+    ('logi_lcd_mono_set_background', [True] * 4),
+    ('logi_lcd_color_set_background', [False, True] * 4)
+], ids=['Mono', 'Color'])
+def test_update_display_skip_identical_frame(c_func, effect):
+    from PIL import Image
+
+    from dcspy.sdk import lcd_sdk
+    lcd_sdk.LAST_FRAMES.clear()
+    suppressed = lcd_sdk.SUPPRESSED_PUSHES
+    with patch.object(lcd_sdk, 'logi_lcd_is_connected', side_effect=effect), \
+            patch.object(lcd_sdk, c_func, return_value=True) as set_background, \
+            patch.object(lcd_sdk, 'logi_lcd_update', return_value=True) as update:
+        lcd_sdk.update_display(Image.new('L', (16, 4), 0))
+        lcd_sdk.update_display(Image.new('L', (16, 4), 0))
+        lcd_sdk.update_display(Image.new('L', (16, 4), 255))
+        lcd_sdk.LAST_FRAMES.clear()
+        lcd_sdk.update_display(Image.new('L', (16, 4), 255))
+    assert set_background.call_count == 3
+    assert update.call_count == 3
+    assert lcd_sdk.SUPPRESSED_PUSHES == suppressed + 1
@@ -69,6 +69,8 @@ def test_keyboard_button_handle_lcdbutton(keyboard, sock, request):
     keyboard = request.getfixturevalue(keyboard)
     with patch.object(lcd_sdk, 'logi_lcd_is_button_pressed', side_effect=[True]):
         keyboard.button_handle(sock)
+    assert keyboard.scheduler.flush()
+    keyboard.scheduler.stop()
     sock.sendto.assert_called_once_with(b'\n', ('127.0.0.1', 7778))
 
 
@@ -79,6 +81,8 @@ def test_keyboard_button_handle_gkey(keyboard, sock, request):
     with patch.object(key_sdk, 'logi_gkey_is_keyboard_gkey_pressed', side_effect=[True]), \
             patch.object(key_sdk, 'logi_gkey_is_keyboard_gkey_string', side_effect=['G1/M1']):
         keyboard.button_handle(sock)
+    assert keyboard.scheduler.flush()
+    keyboard.scheduler.stop()
     sock.sendto.assert_called_once_with(b'\n', ('127.0.0.1', 7778))
 
 
@@ -233,3 +237,182 @@ def test_all_keyboard_all_plane_load(model, keyboard, test_dcs_bios, request):
 
     assert isinstance(keyboard.plane, AdvancedAircraft)
     assert model in type(keyboard.plane).__name__
+
+
+def test_keyboard_load_plane_with_unknown_control(protocol_parser, lcd_font_mono, test_dcs_bios):
+    from dcspy import aircraft, logitech
+    from dcspy.sdk import key_sdk, lcd_sdk
+
+    with patch.object(lcd_sdk, 'logi_lcd_init', return_value=True), \
+            patch.object(key_sdk, 'logi_gkey_init', return_value=True):
+        keyboard = logitech.G13(parser=protocol_parser, fonts=lcd_font_mono)
+    layout = {'elements': [{'text': '{UFC_COMM1_DISPLAY}', 'xy': [2, 0]}, {'text': '{UFC_COMM_TYPO}', 'xy': [2, 10]}]}
+    aircraft.LAYOUT_PLANS.clear()
+    with patch('dcspy.aircraft.load_layout', return_value=layout), \
+            patch('dcspy.aircraft.get_bios_selectors', return_value=None), \
+            patch('dcspy.logitech.get_config_yaml_item', return_value=test_dcs_bios), \
+            patch.object(logitech.LOG, 'warning') as warning:
+        keyboard.plane_name = 'FA18Chornet'
+        keyboard.load_new_plane()
+    aircraft.LAYOUT_PLANS.clear()
+
+    assert 'UFC_COMM_TYPO' in keyboard.plane.bios_data
+    warning.assert_called_once_with('Control: UFC_COMM_TYPO not found in DCS-BIOS of: FA-18C_hornet')
+
+
+def test_keyboard_load_plane_with_export_memory(protocol_parser, lcd_font_mono, test_dcs_bios):
+    from dcspy.dcsbios import ExportMemory
+    from dcspy.logitech import G13
+    from dcspy.sdk import key_sdk, lcd_sdk
+
+    export_memory = ExportMemory(parser=protocol_parser)
+    with patch.object(lcd_sdk, 'logi_lcd_init', return_value=True), \
+            patch.object(key_sdk, 'logi_gkey_init', return_value=True):
+        keyboard = G13(parser=protocol_parser, fonts=lcd_font_mono, export_memory=export_memory)
+    with patch('dcspy.logitech.get_config_yaml_item', return_value=test_dcs_bios):
+        keyboard.plane_name = 'Ka50'
+        keyboard.load_new_plane()
+
+    assert keyboard.export_memory is export_memory
+    assert 'AP_FD_LED' in export_memory.ctrl_names
+    assert 'PVI_LINE1_TEXT' not in export_memory.ctrl_names
+
+
+def test_keyboard_load_plane_with_render_scheduler(protocol_parser, lcd_font_mono, test_dcs_bios):
+    from dcspy.aircraft import RenderScheduler
+    from dcspy.logitech import G13
+    from dcspy.sdk import key_sdk, lcd_sdk
+
+    with patch.object(lcd_sdk, 'logi_lcd_init', return_value=True), \
+            patch.object(key_sdk, 'logi_gkey_init', return_value=True):
+        keyboard = G13(parser=protocol_parser, fonts=lcd_font_mono, render_max_fps=10)
+    with patch('dcspy.logitech.get_config_yaml_item', return_value=test_dcs_bios):
+        keyboard.plane_name = 'Ka50'
+        keyboard.load_new_plane()
+
+    assert isinstance(keyboard.plane.render_scheduler, RenderScheduler)
+    assert keyboard.plane.render_scheduler.interval == 0.1
+    assert len(protocol_parser.frame_end_callbacks) == 1
+    keyboard.plane_name = 'Bf109K4'
+    keyboard.load_new_plane()
+    assert protocol_parser.frame_end_callbacks == set()
+
+
+def test_keyboard_render_scheduler_after_export_memory(protocol_parser, lcd_font_mono, test_dcs_bios):
+    from dcspy.dcsbios import ExportMemory
+    from dcspy.logitech import G13
+    from dcspy.sdk import key_sdk, lcd_sdk
+    from dcspy.utils import get_full_bios_for_plane
+
+    with patch.object(lcd_sdk, 'logi_lcd_init', return_value=True), \
+            patch.object(key_sdk, 'logi_gkey_init', return_value=True):
+        keyboard = G13(parser=protocol_parser, fonts=lcd_font_mono, export_memory=ExportMemory(parser=protocol_parser), render_max_fps=0)
+    with patch('dcspy.logitech.get_config_yaml_item', return_value=test_dcs_bios):
+        keyboard.plane_name = 'Ka50'
+        keyboard.load_new_plane()
+    output = get_full_bios_for_plane(plane='Ka-50', bios_dir=test_dcs_bios).get_ctrl(ctrl_name='AP_FD_LED').output
+    rendered = []
+    with patch.object(keyboard.plane.render_scheduler, 'render', side_effect=lambda: rendered.append(keyboard.plane.bios_data['AP_FD_LED'])):
+        word = output.args.mask.to_bytes(2, 'little')
+        protocol_parser.process_bytes(b'\x55' * 4 + output.args.address.to_bytes(2, 'little') + b'\x02\x00' + word + b'\x55' * 4)
+    assert rendered == [1]
+
+
+def test_keyboard_load_plane_with_frame_changes(protocol_parser, lcd_font_mono, test_dcs_bios):
+    from dcspy.logitech import G13
+    from dcspy.sdk import key_sdk, lcd_sdk
+    from dcspy.utils import get_full_bios_for_plane
+
+    with patch.object(lcd_sdk, 'logi_lcd_init', return_value=True), \
+            patch.object(key_sdk, 'logi_gkey_init', return_value=True):
+        keyboard = G13(parser=protocol_parser, fonts=lcd_font_mono, frame_changes=True)
+    with patch('dcspy.logitech.get_config_yaml_item', return_value=test_dcs_bios):
+        keyboard.plane_name = 'Ka50'
+        keyboard.load_new_plane()
+    assert len(protocol_parser.frame_changed_callbacks) == 1
+
+    plane_bios = get_full_bios_for_plane(plane='Ka-50', bios_dir=test_dcs_bios)
+    frame = b'\x55' * 4
+    for ctrl_name in ('AP_FD_LED', 'AP_BANK_HOLD_LED'):
+        args = plane_bios.get_ctrl(ctrl_name=ctrl_name).output.args
+        frame += args.address.to_bytes(2, 'little') + b'\x02\x00' + args.mask.to_bytes(2, 'little')
+    with patch.object(keyboard.plane, 'update_display') as update_display:
+        protocol_parser.process_bytes(frame + b'\x55' * 4)
+        update_display.assert_called_once_with()
+        protocol_parser.process_bytes(b'\x55' * 4)
+        update_display.assert_called_once_with()
+    assert (keyboard.plane.bios_data['AP_FD_LED'], keyboard.plane.bios_data['AP_BANK_HOLD_LED']) == (1, 1)
+    keyboard.plane_name = 'Bf109K4'
+    keyboard.load_new_plane()
+    assert protocol_parser.frame_changed_callbacks == set()
+
+
+def test_keyboard_load_plane_with_render_worker(protocol_parser, lcd_font_mono, test_dcs_bios):
+    from dcspy.aircraft import RenderWorker
+    from dcspy.logitech import G13
+    from dcspy.sdk import key_sdk, lcd_sdk
+
+    with patch.object(lcd_sdk, 'logi_lcd_init', return_value=True), \
+            patch.object(key_sdk, 'logi_gkey_init', return_value=True):
+        keyboard = G13(parser=protocol_parser, fonts=lcd_font_mono, render_worker=True)
+    with patch('dcspy.logitech.get_config_yaml_item', return_value=test_dcs_bios):
+        keyboard.plane_name = 'Ka50'
+        keyboard.load_new_plane()
+
+    ka50 = keyboard.plane
+    worker = ka50.render_worker
+    assert isinstance(worker, RenderWorker)
+    assert worker._worker.is_alive()
+    keyboard.plane_name = 'Bf109K4'
+    keyboard.load_new_plane()
+    assert ka50.render_worker is None
+    assert not worker._worker.is_alive()
+
+
+def test_keyboard_shutdown_stops_render_worker(protocol_parser, lcd_font_mono, test_dcs_bios):
+    from dcspy.logitech import G13
+    from dcspy.sdk import key_sdk, lcd_sdk
+
+    with patch.object(lcd_sdk, 'logi_lcd_init', return_value=True), \
+            patch.object(key_sdk, 'logi_gkey_init', return_value=True):
+        keyboard = G13(parser=protocol_parser, fonts=lcd_font_mono, render_worker=True)
+    with patch('dcspy.logitech.get_config_yaml_item', return_value=test_dcs_bios):
+        keyboard.plane_name = 'Ka50'
+        keyboard.load_new_plane()
+
+    worker = keyboard.plane.render_worker
+    keyboard.shutdown()
+    assert keyboard.plane.render_worker is None
+    assert not worker._worker.is_alive()
+    assert keyboard.plane_subscriptions == []
+
+
+def test_keyboard_shutdown_stops_screenshot_recorder(keyboard_mono, test_dcs_bios, tmp_path):
+    from dcspy.screenshot import ScreenshotRecorder
+
+    with patch('dcspy.logitech.get_config_yaml_item', return_value=test_dcs_bios):
+        keyboard_mono.plane_name = 'Ka50'
+        keyboard_mono.load_new_plane()
+    recorder = ScreenshotRecorder(name='Ka50', directory=tmp_path, frame_log=True)
+    keyboard_mono.plane.screenshot_recorder = recorder
+    recorder.record(keyboard_mono.plane.prepare_image())
+    keyboard_mono.shutdown()
+    assert keyboard_mono.plane.screenshot_recorder is None
+    assert not recorder._worker.is_alive()
+    assert recorder._log_file is None
+    assert recorder.written == 1
+
+
+def test_keyboard_load_new_plane_remove_old_callbacks(keyboard_mono, test_dcs_bios):
+    with patch('dcspy.logitech.get_config_yaml_item', return_value=test_dcs_bios):
+        keyboard_mono.plane_name = 'Ka50'
+        keyboard_mono.load_new_plane()
+        callbacks_ka50 = sum(len(callbacks) for callbacks in keyboard_mono.parser.address_callbacks.values())
+        for plane_name in ('F16C50', 'Ka50'):
+            keyboard_mono.plane_name = plane_name
+            keyboard_mono.load_new_plane()
+
+    assert sum(len(callbacks) for callbacks in keyboard_mono.parser.address_callbacks.values()) == callbacks_ka50
+    keyboard_mono.plane_name = 'Bf109K4'
+    keyboard_mono.load_new_plane()
+    assert keyboard_mono.plane_subscriptions == []
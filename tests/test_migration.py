@@ -22,6 +22,7 @@ def test_generate_config():
     migrated_cfg = migrate(cfg={})
     assert migrated_cfg == {
         'api_ver': '3.1.3',
+        'async_runtime': False,
         'autostart': False,
         'check_bios': True,
         'check_ver': True,
@@ -29,6 +30,7 @@ def test_generate_config():
         'current_plane': 'A-10C',
         'dcs': 'C:/Program Files/Eagle Dynamics/DCS World OpenBeta',
         'dcsbios': f'C:\\Users\\{environ.get("USERNAME", "UNKNOWN")}\\Saved Games\\DCS.openbeta\\Scripts\\DCS-BIOS',
+        'export_memory': False,
         'f16_ded_font': True,
         'font_color_l': 32,
         'font_color_m': 22,
@@ -42,6 +44,16 @@ def test_generate_config():
         'gkeys_area': 2,
         'gkeys_float': False,
         'keyboard': 'G13',
+        'recv_buffer_size': 0,
+        'recv_queue_size': 0,
+        'render_dirty_regions': False,
+        'render_max_fps': 0,
+        'render_on_frame_change': False,
+        'render_on_frame_sync': False,
+        'render_worker': False,
+        'save_lcd_log': False,
+        'lcd_max_fps_mono': 0,
+        'lcd_max_fps_color': 0,
         'save_lcd': False,
         'show_gui': True,
         'toolbar_area': 4,
@@ -552,3 +552,28 @@ def test_zigzag_iterator_direction():
     assert next(zz) == 7
     assert next(zz) == 5
     assert zz.direction == Direction.BACKWARD
+
+
+def test_get_font_loaded_once(lcd_font_mono):
+    from unittest.mock import patch
+
+    from dcspy import models
+
+    models.FONTS.clear()
+    with patch.object(models.ImageFont, 'truetype', wraps=models.ImageFont.truetype) as truetype:
+        models.LcdMono.set_fonts(lcd_font_mono)
+        models.LcdMono.set_fonts(lcd_font_mono)
+        font = models.get_font(name=lcd_font_mono.name, size=lcd_font_mono.large)
+    assert truetype.call_count == 3
+    assert font is models.LcdMono.font_l
+    assert set(models.FONTS) == {(lcd_font_mono.name, size) for size in (9, 11, 16)}
+
+
+def test_preload_fonts(lcd_font_color):
+    from dcspy import models
+
+    models.FONTS.clear()
+    thread = models.preload_fonts(lcd_font_color.fonts + [('not_existing_font.ttf', 10)])
+    thread.join(timeout=5)
+    assert thread.name == 'dcspy-fonts'
+    assert set(models.FONTS) == {(lcd_font_color.name, size) for size in (18, 22, 32)}
@@ -0,0 +1,148 @@
+from unittest.mock import patch
+
+from PIL import Image, ImageDraw
+from pytest import mark, raises
+
+
+def _frames(lcd, count=3):
+    frames = []
+    for idx in range(count):
+        img = Image.new(mode=lcd.mode.value, size=(lcd.width, lcd.height), color=lcd.background)
+        ImageDraw.Draw(img).text(xy=(idx, idx), text=f'FRAME {idx}', fill=lcd.foreground)
+        frames.append((idx * 0.033, img))
+    return frames
+
+
+@mark.parametrize('lcd', ['LcdMono', 'LcdColor'])
+def test_write_and_read_frames(lcd, tmp_path):
+    from dcspy import models
+    from dcspy.screenshot import read_frames, write_frame, write_header
+
+    frames = _frames(getattr(models, lcd))
+    frame_log = tmp_path / 'Ka50.lcdlog'
+    with open(frame_log, 'wb') as frame_file:
+        write_header(frame_file=frame_file)
+        for timestamp, img in frames:
+            write_frame(frame_file=frame_file, timestamp=timestamp, img=img)
+    assert frame_log.stat().st_size < sum(len(img.tobytes()) for _, img in frames)
+    read = list(read_frames(file_path=frame_log))
+    assert len(read) == len(frames)
+    for (timestamp, img), (read_timestamp, read_img) in zip(frames, read):
+        assert read_timestamp == timestamp
+        assert read_img.mode == img.mode
+        assert read_img.tobytes() == img.tobytes()
+
+
+@mark.parametrize('content', [b'', b'NOT_LCD_LOG', b'DCSPYLCD\x01\x00\x00\x00', b'DCSPYLCD\x01\x00' + bytes(13) + b'\x04\x00\x00\x00abcd'],
+                  ids=['empty', 'wrong magic', 'truncated', 'corrupted'])
+def test_read_frames_invalid_file(content, tmp_path):
+    from dcspy.screenshot import FrameLogFormatError, read_frames
+
+    frame_log = tmp_path / 'Ka50.lcdlog'
+    frame_log.write_bytes(content)
+    with raises(FrameLogFormatError):
+        list(read_frames(file_path=frame_log))
+
+
+def test_recorder_saves_png_files_round_robin(tmp_path):
+    from dcspy.models import LcdMono
+    from dcspy.screenshot import ScreenshotRecorder
+
+    recorder = ScreenshotRecorder(name='Ka50', directory=tmp_path, max_frames=2)
+    for _, img in _frames(LcdMono):
+        recorder.record(img)
+    assert recorder.flush()
+    recorder.stop()
+    assert sorted(png.name for png in tmp_path.iterdir()) == ['Ka50_000.png', 'Ka50_001.png']
+    assert (recorder.recorded, recorder.written, recorder.dropped) == (3, 3, 0)
+
+
+def test_recorder_frame_log_rotation_and_export(tmp_path):
+    from dcspy.models import LcdColor
+    from dcspy.screenshot import ScreenshotRecorder, export_png, read_frames
+
+    recorder = ScreenshotRecorder(name='Ka50', directory=tmp_path, frame_log=True, max_frames=2)
+    for _, img in _frames(LcdColor):
+        recorder.record(img)
+    recorder.stop()
+    assert len(list(read_frames(file_path=tmp_path / 'Ka50.1.lcdlog'))) == 2
+    assert len(list(read_frames(file_path=recorder.log_path))) == 1
+    assert export_png(file_path=tmp_path / 'Ka50.1.lcdlog', directory=tmp_path / 'png') == 2
+    assert sorted(png.name for png in (tmp_path / 'png').iterdir()) == ['Ka50.1_000.png', 'Ka50.1_001.png']
+
+
+def test_recorder_drops_screenshots_when_queue_is_full(tmp_path):
+    from dcspy.models import LcdMono
+    from dcspy.screenshot import ScreenshotRecorder
+
+    with patch.object(ScreenshotRecorder, '_run'):
+        recorder = ScreenshotRecorder(name='Ka50', directory=tmp_path, queue_size=2)
+    for _, img in _frames(LcdMono, count=5):
+        recorder.record(img)
+    assert (recorder.recorded, recorder.dropped) == (2, 3)
+
+
+def test_recorder_frame_log_closed_by_busy_writer(tmp_path):
+    from time import sleep
+
+    from dcspy.models import LcdMono
+    from dcspy.screenshot import ScreenshotRecorder, read_frames
+
+    recorder = ScreenshotRecorder(name='Ka50', directory=tmp_path, frame_log=True)
+    write = recorder._write
+
+    def slow_write(timestamp, img):
+        sleep(0.05)
+        write(timestamp=timestamp, img=img)
+
+    with patch.object(recorder, '_write', side_effect=slow_write):
+        for _, img in _frames(LcdMono):
+            recorder.record(img)
+        recorder.stop(timeout=0.01)
+        recorder.record(img)
+        recorder._worker.join()
+    assert (recorder.recorded, recorder.written) == (3, 3)
+    assert recorder._log_file is None
+    assert len(list(read_frames(file_path=recorder.log_path))) == 3
+
+
+def test_replay_frames(tmp_path):
+    from dcspy.models import LcdMono
+    from dcspy.screenshot import ScreenshotRecorder, replay_frames
+
+    recorder = ScreenshotRecorder(name='Ka50', directory=tmp_path, frame_log=True)
+    for _, img in _frames(LcdMono):
+        recorder.record(img)
+    recorder.stop()
+    shown = []
+    with patch('dcspy.screenshot.sleep') as sleep:
+        assert replay_frames(file_path=recorder.log_path, show=shown.append, speed=0) == 3
+    sleep.assert_not_called()
+    assert [img.mode for img in shown] == ['1', '1', '1']
+
+
+def test_export_from_command_line(tmp_path):
+    from dcspy.models import LcdMono
+    from dcspy.screenshot import ScreenshotRecorder, run
+
+    recorder = ScreenshotRecorder(name='Ka50', directory=tmp_path, frame_log=True)
+    for _, img in _frames(LcdMono, count=2):
+        recorder.record(img)
+    recorder.stop()
+    run(['export', str(recorder.log_path), '--out', str(tmp_path / 'png')])
+    assert len(list((tmp_path / 'png').iterdir())) == 2
+
+
+@mark.parametrize('argv', [['play'], ['play', '--lcd']], ids=['window', 'lcd'])
+def test_play_empty_frame_log(argv, tmp_path):
+    from dcspy import screenshot
+    from dcspy.sdk import lcd_sdk
+
+    frame_log = tmp_path / f'Ka50{screenshot.FRAMES_SUFFIX}'
+    with open(frame_log, 'wb') as frame_file:
+        screenshot.write_header(frame_file=frame_file)
+    with patch.object(screenshot.LOG, 'warning') as warning, \
+            patch.object(lcd_sdk, 'logi_lcd_init') as lcd_init:
+        screenshot.run(argv[:1] + [str(frame_log)] + argv[1:])
+    warning.assert_called_once_with(f'No frames to play in: {frame_log}')
+    lcd_init.assert_not_called()
@@ -1,6 +1,8 @@
 import socket
 from unittest.mock import patch
 
+from pytest import mark
+
 
 def test_load_new_plane_if_detected():
     from dcspy import starter
@@ -35,3 +37,80 @@ def test_prepare_socket():
     assert sock.proto == 17
     assert sock.type in (2050, 2)
     assert sock.family == 2
+
+
+def test_dcs_bios_protocol_datagram_received(keyboard_mono, protocol_parser):
+    from dcspy import starter
+
+    protocol = starter.DcsBiosProtocol(manager=keyboard_mono, parser=protocol_parser)
+    protocol.last_data = 0.0
+    with patch.object(protocol_parser, 'process_bytes') as process_bytes:
+        protocol.datagram_received(data=b'\x55\x55\x55\x55', addr=('127.0.0.1', 5010))
+    process_bytes.assert_called_once_with(b'\x55\x55\x55\x55')
+    assert protocol.last_data > 0.0
+
+
+def test_async_handle_connection(keyboard_mono, protocol_parser):
+    import asyncio
+    from threading import Event, Timer
+
+    from dcspy import starter
+
+    event = Event()
+    dcs_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    dcs_sock.bind(('127.0.0.1', 0))
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as bios_sock:
+        bios_sock.bind(('127.0.0.1', 0))
+        bios_sock.settimeout(1)
+        bios_sock.sendto(b'\x55\x55\x55\x55\xfe\xff\x02\x00\x01\x00', dcs_sock.getsockname())
+        Timer(0.4, event.set).start()
+        with patch.object(starter, 'SEND_ADDR', bios_sock.getsockname()), \
+                patch.object(starter, 'DISCONNECT_TIMEOUT', 0.1), \
+                patch.object(keyboard_mono, 'get_requests', side_effect=[['UFC_1 1\n|UFC_1 0\n', 'HUD_ATT_SW 1\n', 'HUD_ATT_SW 2\n']] + [[]] * 100), \
+                patch.object(protocol_parser, 'process_bytes') as process_bytes, \
+                patch('dcspy.dcsbios.LOG.debug') as log_debug:
+            asyncio.run(starter._async_handle_connection(manager=keyboard_mono, parser=protocol_parser, sock=dcs_sock, ver_string='v3.1.3', event=event))
+        assert [bios_sock.recv(64) for _ in range(3)] == [b'UFC_1 1\n', b'UFC_1 0\n', b'HUD_ATT_SW 2\n']
+    log_debug.assert_called_with('Requests sent: 3, coalesced: 1, max queue depth: 3')
+    process_bytes.assert_called_once_with(b'\x55\x55\x55\x55\xfe\xff\x02\x00\x01\x00')
+    assert dcs_sock.fileno() == -1
+    assert keyboard_mono.display[1].startswith('No data from DCS:')
+
+
+@mark.parametrize('enabled, numpy, result', [
+    (False, True, None),
+    (True, True, 'ExportMemory'),
+    (True, False, None),
+], ids=['disabled', 'enabled', 'no numpy'])
+def test_prepare_export_memory(enabled, numpy, result, protocol_parser):
+    from dcspy import dcsbios, starter
+
+    with patch.object(starter, 'get_config_yaml_item', return_value=enabled), \
+            patch.dict(dcsbios.__dict__), \
+            patch.object(starter.LOG, 'warning') as warning:
+        if not numpy:
+            del dcsbios.__dict__['np']
+        export_memory = starter._prepare_export_memory(parser=protocol_parser)
+    assert (type(export_memory).__name__ if export_memory else None) == result
+    assert warning.called is (enabled and not numpy)
+
+
+def test_prepare_socket_recv_buffer_size():
+    from dcspy import starter
+    with starter._prepare_socket(recv_buffer_size=0x40000) as sock:
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 0x40000
+
+
+def test_receive_datagrams_drain_socket(protocol_parser):
+    from dcspy import starter
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as recv_sock, socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as send_sock:
+        recv_sock.bind(('127.0.0.1', 0))
+        recv_sock.settimeout(0.5)
+        for counter in range(3):
+            send_sock.sendto(bytes.fromhex(f'55555555 feff 0200 0{counter}00'), recv_sock.getsockname())
+        recv_buffer = memoryview(bytearray(starter.DATAGRAM_SIZE))
+        received = []
+        with patch.object(protocol_parser, 'process_bytes', side_effect=lambda data: received.append((type(data), bytes(data)))):
+            assert starter._receive_datagrams(parser=protocol_parser, sock=recv_sock, recv_buffer=recv_buffer) == 3
+    assert received == [(memoryview, bytes.fromhex(f'55555555 feff 0200 0{counter}00')) for counter in range(3)]
@@ -0,0 +1,115 @@
+import socket
+from threading import Event
+from unittest.mock import patch
+
+from pytest import mark, raises
+
+DATAGRAMS = [
+    (0.0, bytes.fromhex('55555555 0010 0400 4142 4344 feff 0200 0000')),
+    (0.034, bytes.fromhex('55555555 2a19 0200 3109 feff 0200 0100')),
+    (0.067, bytes.fromhex('55555555 0010 0200 5a55 feff 0200 0200')),
+]
+
+
+def test_write_and_read_stream(tmp_path):
+    from dcspy.stream import read_stream, write_stream
+
+    stream_file = tmp_path / 'flight.dcsbios'
+    assert write_stream(file_path=stream_file, datagrams=DATAGRAMS) == 3
+    assert list(read_stream(file_path=stream_file)) == DATAGRAMS
+
+
+@mark.parametrize('content', [b'', b'NOT_DCS_BIOS', b'DCSBIOS\x00\x01\x00\x00\x00'], ids=['empty', 'wrong magic', 'truncated'])
+def test_read_stream_invalid_file(content, tmp_path):
+    from dcspy.stream import StreamFormatError, read_stream
+
+    stream_file = tmp_path / 'flight.dcsbios'
+    stream_file.write_bytes(content)
+    with raises(StreamFormatError):
+        list(read_stream(file_path=stream_file))
+
+
+def test_read_stream_truncated_datagram(tmp_path):
+    from dcspy.stream import StreamFormatError, read_stream, write_stream
+
+    stream_file = tmp_path / 'flight.dcsbios'
+    write_stream(file_path=stream_file, datagrams=DATAGRAMS)
+    stream_file.write_bytes(stream_file.read_bytes()[:-3])
+    datagrams = read_stream(file_path=stream_file)
+    assert [next(datagrams), next(datagrams)] == DATAGRAMS[:2]
+    with raises(StreamFormatError, match='Truncated datagram'):
+        next(datagrams)
+
+
+def test_replay_stream_into_parser(protocol_parser, tmp_path):
+    from dcspy.dcsbios import StringBuffer
+    from dcspy.stream import replay_stream, write_stream
+
+    values = []
+    StringBuffer(parser=protocol_parser, address=0x1000, max_length=4, callback=values.append)
+    stream_file = tmp_path / 'flight.dcsbios'
+    write_stream(file_path=stream_file, datagrams=DATAGRAMS)
+    with patch('dcspy.stream.sleep') as sleep:
+        assert replay_stream(file_path=stream_file, parser=protocol_parser, speed=0) == 3
+    sleep.assert_not_called()
+    assert values == ['ABCD', 'ZUCD']
+
+
+@mark.parametrize('speed, max_time', [(1.0, 0.067), (2.0, 0.0335)])
+def test_replay_stream_keeps_timing(speed, max_time, tmp_path):
+    from dcspy.stream import replay_stream, write_stream
+
+    stream_file = tmp_path / 'flight.dcsbios'
+    write_stream(file_path=stream_file, datagrams=DATAGRAMS)
+    with patch('dcspy.stream.sleep') as sleep:
+        replay_stream(file_path=stream_file, speed=speed)
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert 0 < max(delays) <= max_time
+
+
+def test_record_and_replay_on_loopback(tmp_path):
+    from dcspy.stream import read_stream, record_stream, replay_stream, write_stream
+
+    src_file, dst_file = tmp_path / 'src.dcsbios', tmp_path / 'dst.dcsbios'
+    write_stream(file_path=src_file, datagrams=DATAGRAMS)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as recv_sock, socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as send_sock:
+        recv_sock.bind(('127.0.0.1', 0))
+        recv_sock.settimeout(0.5)
+        replay_stream(file_path=src_file, sock=send_sock, address=recv_sock.getsockname(), speed=0)
+        assert record_stream(file_path=dst_file, sock=recv_sock, event=Event(), max_count=3) == 3
+    assert [data for _, data in read_stream(file_path=dst_file)] == [data for _, data in DATAGRAMS]
+
+
+@mark.parametrize('plane', ['A-10C', 'AH-64D_BLK_II', 'F-16C_50', 'FA-18C_hornet', 'Ka-50', 'Mi-24P'])
+def test_generated_stream_decoded_by_buffers(plane, protocol_parser, test_dcs_bios):
+    from dcspy.dcsbios import IntegerBuffer, StringBuffer
+    from dcspy.models import OutputInt
+    from dcspy.stream import StreamGenerator
+
+    generator = StreamGenerator.from_plane(plane=plane, bios_dir=test_dcs_bios, change_density=0.2, datagram_size=512, seed=5010)
+    values = {}
+    for idx, output in enumerate(generator.outputs):
+        if isinstance(output, OutputInt):
+            IntegerBuffer(parser=protocol_parser, address=output.address, mask=output.mask, shift_by=output.shift_by,
+                          callback=lambda val, i=idx: values.__setitem__(i, val))
+        else:
+            StringBuffer(parser=protocol_parser, address=output.address, max_length=output.max_length, callback=lambda val, i=idx: values.__setitem__(i, val))
+    for _, datagram in generator.datagrams(frames=10):
+        assert len(datagram) <= 512
+        protocol_parser.process_bytes(datagram)
+    assert generator.frame_counter == 10
+    assert all(values.get(idx, 0) == generator.get_value(output) for idx, output in enumerate(generator.outputs) if isinstance(output, OutputInt))
+    assert all(values[idx] == generator.get_value(output) for idx, output in enumerate(generator.outputs) if not isinstance(output, OutputInt))
+
+
+def test_generated_frame_structure(test_dcs_bios):
+    from dcspy.stream import StreamGenerator
+
+    generator = StreamGenerator.from_plane(plane='Ka-50', bios_dir=test_dcs_bios, change_density=0.0, seed=1)
+    full_frame = generator.frame()
+    empty_frame = generator.frame()
+    assert full_frame.startswith(b'\x55\x55\x55\x55')
+    assert len(full_frame) > len(empty_frame)
+    assert empty_frame == bytes.fromhex('55555555 feff 0200 0200')
+    timestamps = [timestamp for timestamp, _ in generator.datagrams(frames=4, rate=50)]
+    assert timestamps == [0.0, 0.02, 0.04, 0.06]
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, PropertyMock, mock_open, patch
 
 import pytest
 from packaging import version
-from pytest import mark
+from pytest import mark, raises
 
 from dcspy import utils
 from dcspy.models import DEFAULT_FONT_NAME, ReleaseInfo
@@ -99,6 +99,18 @@ def test_dummy_save_load_migrate(tmpdir):
         'current_plane': 'A-10C',
         'dcsbios': f'C:\\Users\\{environ.get("USERNAME", "UNKNOWN")}\\Saved Games\\DCS.openbeta\\Scripts\\DCS-BIOS',
         'dcs': 'C:/Program Files/Eagle Dynamics/DCS World OpenBeta',
+        'export_memory': False,
+        'async_runtime': False,
+        'recv_buffer_size': 0,
+        'recv_queue_size': 0,
+        'render_dirty_regions': False,
+        'render_max_fps': 0,
+        'render_on_frame_change': False,
+        'render_on_frame_sync': False,
+        'render_worker': False,
+        'save_lcd_log': False,
+        'lcd_max_fps_mono': 0,
+        'lcd_max_fps_color': 0,
         'verbose': False,
         'check_bios': True,
         'check_ver': True,
@@ -269,6 +281,8 @@ def test_collect_debug_data(switch_dcs_bios_path_in_config, resources):
     from zipfile import ZipFile
     with open(Path(gettempdir()) / 'Ka50_999.png', 'w+') as png:
         png.write('')
+    with open(Path(gettempdir()) / 'Ka50.lcdlog', 'w+') as frame_log:
+        frame_log.write('')
     with patch('dcspy.utils.get_config_yaml_location', lambda: resources):
         zip_file = utils.collect_debug_data()
     assert 'dcspy_debug_' in str(zip_file)
@@ -281,6 +295,7 @@ def test_collect_debug_data(switch_dcs_bios_path_in_config, resources):
     assert sum('.yaml' in s for s in zip_list) == 2
     assert 'dcspy.log' in zip_list
     assert 'Ka50_999.png' in zip_list
+    assert 'Ka50.lcdlog' in zip_list
     assert 'dcs.log' in zip_list
 
 
@@ -403,3 +418,61 @@ def test_replace_symbols():
 
 def test_substitute_symbols():
     assert utils.substitute_symbols('123qwe123qwe', ((r'\d+', r'QWE'),)) == 'QWEqweQWEqwe'
+
+
+@mark.parametrize('replacement, substitution, value, result', [
+    ((('1', '4'), ('w', 'W')), (), '1q2w3e', '4q2W3e'),
+    ((('ab', ''), ('b', 'B')), (), 'aabbab', 'aB'),
+    ((), ((r'\d+', r'QWE'),), '123qwe123qwe', 'QWEqweQWEqwe'),
+    ((('*', 'x'),), ((r'(a)(b)', r'\2\1'), (r'M1(\s)M4', r'm1\g<1>m4')), '*ab M1 M4', 'xba m1 m4'),
+], ids=['single characters', 'multi characters', 'substitution', 'replace then substitute'])
+def test_symbol_translator(replacement, substitution, value, result):
+    translator = utils.SymbolTranslator(symbol_replacement=replacement, symbol_substitution=substitution)
+    assert translator.translate(value) == result
+    assert translator.translate(value) == result
+    assert translator.translate.cache_info().hits == 1
+
+
+@mark.parametrize('line', [
+    ' *HUD BLNK*  *CKPT BLNK* ',
+    '  HUD BLNK    CKPT BLNK  ',
+    'M1 :12   M4  (6) 1234',
+    'M1 :12   M4  : (6) 1234',
+    'M3 :7000 * 4*DCPL(9)  ',
+    'M3 :7000 * 4*DCPL(9) *HUD BLNK*  *CKPT BLNK* ',
+    '1DEST 2BNGO 3VIP  RINTG',
+    '4NAV  5MAN  6INS  EDLNK',
+    '7CMDS 8MODE 9VRP  0MISC',
+    '1CORR 2MAGV 3OFP  RHMCS',
+    '4INSM 5LASR 6GPS  E',
+    '7DRNG 8BULL 9     0',
+    ' STPT a  5  AUTO  \x03\x82',
+    'A\x10\x04 TOS 10:20:00 o\xff',
+])
+def test_symbol_translator_same_as_sequential_replace_and_substitute(line):
+    from dcspy.aircraft import F16C50
+
+    expected = utils.replace_symbols(line, F16C50.COMMON_SYMBOLS_TO_REPLACE)
+    assert utils.SymbolTranslator(symbol_replacement=F16C50.COMMON_SYMBOLS_TO_REPLACE).translate(line) == expected
+    color = utils.substitute_symbols(utils.replace_symbols(expected, F16C50.COLOR_SYMBOLS_TO_REPLACE), F16C50.COLOR_SYMBOLS_TO_SUBSTITUTE)
+    translator = utils.SymbolTranslator(symbol_replacement=F16C50.COLOR_SYMBOLS_TO_REPLACE, symbol_substitution=F16C50.COLOR_SYMBOLS_TO_SUBSTITUTE)
+    assert translator.translate(expected) == color
+    mono = utils.replace_symbols(expected, F16C50.MONO_SYMBOLS_TO_REPLACE)
+    assert utils.SymbolTranslator(symbol_replacement=F16C50.MONO_SYMBOLS_TO_REPLACE).translate(expected) == mono
+
+
+def test_compose_symbol_replacements():
+    composed = utils.compose_symbol_replacements((('ab', 'a'), ('\x03', ''), ('c', '*')), (('@', ''),), (('a', '@'), ('*', 'x')))
+    assert composed == (('ab', 'a'), ('\x03', ''), ('c', 'x'), ('@', ''), ('a', '@'), ('*', 'x'))
+    line = 'abc@*a\x03'
+    expected = utils.replace_symbols(utils.replace_symbols(utils.replace_symbols(line, (('ab', 'a'), ('\x03', ''), ('c', '*'))), (('@', ''),)),
+                                     (('a', '@'), ('*', 'x')))
+    assert utils.SymbolTranslator(symbol_replacement=composed).translate(line) == expected == '@xx@'
+    with raises(ValueError):
+        utils.compose_symbol_replacements((('a', 'b'),), (('ab', ''),))
+
+
+def test_get_symbol_translator_compiled_once():
+    table = (('a', 'b'),)
+    assert utils.get_symbol_translator(table) is utils.get_symbol_translator(table)
+    assert utils.get_symbol_translator(table) is not utils.get_symbol_translator(table, ((r'\d', ''),))